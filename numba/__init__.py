@@ -71,7 +71,7 @@ from numba.core import types, errors
 # Re-export typeof
 from numba.misc.special import (
     typeof, prange, pndindex, gdb, gdb_breakpoint, gdb_init,
-    literally, literal_unroll,
+    literally, literal_unroll, parallel_scan, thread_local,
 )
 
 # Re-export error classes
@@ -134,6 +134,8 @@ __all__ = """
     vectorize
     objmode
     literal_unroll
+    parallel_scan
+    thread_local
     get_num_threads
     set_num_threads
     set_parallel_chunksize
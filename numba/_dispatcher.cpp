@@ -11,6 +11,11 @@
 #include "core/typeconv/typeconv.hpp"
 #include "_devicearray.h"
 
+#if (PY_MAJOR_VERSION == 3) && (PY_MINOR_VERSION == 8)
+/* The vectorcall protocol is provisional on Python 3.8 */
+#define Py_TPFLAGS_HAVE_VECTORCALL _Py_TPFLAGS_HAVE_VECTORCALL
+#endif
+
 /*
  * Notes on the C_TRACE macro:
  *
@@ -366,6 +371,27 @@ else                                                            \
 typedef std::vector<Type> TypeTable;
 typedef std::vector<PyObject*> Functions;
 
+/* Number of entries in the inline cache of each dispatcher, and maximum
+   number of arguments of the signatures it remembers. */
+#define INLINE_CACHE_SIZE 4
+#define INLINE_CACHE_MAX_ARGS 8
+
+/* The key of an argument in the inline cache: its Python type and a
+   descriptor of its value that, together, determine its typecode (see
+   typeof_argkey()). */
+struct ArgKey {
+    PyTypeObject *type;
+    int desc;
+};
+
+/* An entry of the inline cache: the argument keys of a call and the
+   overload that matched their types exactly. */
+struct InlineCacheEntry {
+    /* Borrowed reference, NULL if the entry is unused */
+    PyObject *cfunc;
+    ArgKey args[INLINE_CACHE_MAX_ARGS];
+};
+
 /* The Dispatcher class is the base class of all dispatchers in the CPU and
    CUDA targets. Its main responsibilities are:
 
@@ -407,6 +433,17 @@ public:
     /* A flattened array of argument types to all overloads
      * (invariant: sizeof(overloads) == argct * sizeof(functions)) */
     TypeTable overloads;
+    /* The keys of the last few arguments whose types matched an overload
+     * exactly, checked before computing the typecodes of the arguments and
+     * searching the overloads.  An exact match is always the unique best
+     * match, whatever the conversion rules, so the entries remain valid
+     * until the overloads change. */
+    mutable InlineCacheEntry inline_cache[INLINE_CACHE_SIZE];
+    /* Index of the next entry of inline_cache to replace */
+    mutable int inline_cache_next;
+    /* The PEP 590 vectorcall entry point, NULL if calls must go through
+     * tp_call (e.g. when a subclass overrides __call__) */
+    vectorcallfunc vectorcall;
 
     /* Add a new overload. Parameters:
 
@@ -418,6 +455,58 @@ public:
             overloads.push_back(args[i]);
         }
         functions.push_back(callable);
+        clearInlineCache();
+    }
+
+    /* Forget the overloads remembered by the inline cache */
+    void clearInlineCache() {
+        for (int i = 0; i < INLINE_CACHE_SIZE; ++i) {
+            inline_cache[i].cfunc = NULL;
+        }
+        inline_cache_next = 0;
+    }
+
+    /* Compute the inline cache keys of the nargs arguments args into keys.
+       Returns false if the call can't use the inline cache. */
+    bool makeArgKeys(PyObject *const *args, Py_ssize_t nargs,
+                     ArgKey keys[]) const {
+        if (nargs != argct || argct == 0 || argct > INLINE_CACHE_MAX_ARGS) {
+            return false;
+        }
+        for (int i = 0; i < argct; ++i) {
+            keys[i].type = Py_TYPE(args[i]);
+            keys[i].desc = typeof_argkey(args[i]);
+            if (keys[i].desc == -1) {
+                return false;
+            }
+        }
+        return true;
+    }
+
+    /* Return the overload remembered for the argument keys, or NULL */
+    PyObject* lookupInlineCache(const ArgKey keys[]) const {
+        for (int i = 0; i < INLINE_CACHE_SIZE; ++i) {
+            const InlineCacheEntry &entry = inline_cache[i];
+            if (entry.cfunc != NULL &&
+                memcmp(entry.args, keys, argct * sizeof(ArgKey)) == 0) {
+                return entry.cfunc;
+            }
+        }
+        return NULL;
+    }
+
+    /* Remember the overload at index selected for the argument keys if its
+       types are exactly sig, the types of the arguments */
+    void storeInlineCache(const ArgKey keys[], const Type sig[],
+                          int selected) const {
+        if (memcmp(&overloads[selected * argct], sig,
+                   argct * sizeof(Type)) != 0) {
+            return;
+        }
+        InlineCacheEntry &entry = inline_cache[inline_cache_next];
+        memcpy(entry.args, keys, argct * sizeof(ArgKey));
+        entry.cfunc = functions[selected];
+        inline_cache_next = (inline_cache_next + 1) % INLINE_CACHE_SIZE;
     }
 
     /* Given a list of types, find the overloads that have a matching signature.
@@ -432,9 +521,12 @@ public:
        - exact_match_required: Whether all arguments types must match the
                                overload's types exactly. When false,
                                overloads that would require a type conversion
-                               can also be matched. */
+                               can also be matched.
+       - keys: the inline cache keys of the arguments, to remember the
+               overload for, or NULL. */
     PyObject* resolve(Type sig[], int &matches, bool allow_unsafe,
-                      bool exact_match_required) const {
+                      bool exact_match_required,
+                      const ArgKey *keys = NULL) const {
         const int ovct = functions.size();
         int selected;
         matches = 0;
@@ -451,6 +543,9 @@ public:
             matches = tm->selectOverload(sig, &overloads[0], selected, argct,
                                          ovct, allow_unsafe,
                                          exact_match_required);
+            if (matches == 1 && keys != NULL) {
+                storeInlineCache(keys, sig, selected);
+            }
         }
         if (matches == 1) {
             return functions[selected];
@@ -462,11 +557,20 @@ public:
     void clear() {
         functions.clear();
         overloads.clear();
+        clearInlineCache();
     }
 
 };
 
 
+static PyObject*
+Dispatcher_call(Dispatcher *self, PyObject *args, PyObject *kws);
+
+static PyObject*
+Dispatcher_vectorcall(PyObject *obj, PyObject *const *args, size_t nargsf,
+                      PyObject *kwnames);
+
+
 static int
 Dispatcher_traverse(Dispatcher *self, visitproc visit, void *arg)
 {
@@ -514,6 +618,12 @@ Dispatcher_init(Dispatcher *self, PyObject *args, PyObject *kwds)
     self->fallbackdef = NULL;
     self->has_stararg = has_stararg;
     self->exact_match_required = exact_match_required;
+    self->clearInlineCache();
+    self->vectorcall = NULL;
+    if (Py_TYPE(self)->tp_call == (ternaryfunc) Dispatcher_call) {
+        /* The type has the vectorcall flag, see Dispatcher_init_subclass */
+        self->vectorcall = Dispatcher_vectorcall;
+    }
     return 0;
 }
 
@@ -637,16 +747,23 @@ int search_new_conversions(PyObject *dispatcher, PyObject *args, PyObject *kws)
 }
 
 
-/* A custom, fast, inlinable version of PyCFunction_Call() */
+/* The signature of the compiled wrappers, which are METH_FASTCALL |
+   METH_KEYWORDS functions (see numba/core/callwrapper.py) */
+typedef PyObject *(*fastcallfunc)(PyObject *, PyObject *const *, Py_ssize_t,
+                                  PyObject *);
+
+/* A custom, fast, inlinable version of PyCFunction_Call(), taking the
+   positional arguments as a vector */
 static PyObject *
-call_cfunc(Dispatcher *self, PyObject *cfunc, PyObject *args, PyObject *kws, PyObject *locals)
+call_cfunc(Dispatcher *self, PyObject *cfunc, PyObject *const *args,
+           Py_ssize_t nargs, PyObject *locals)
 {
-    PyCFunctionWithKeywords fn;
+    fastcallfunc fn;
     PyThreadState *tstate;
 
     assert(PyCFunction_Check(cfunc));
-    assert(PyCFunction_GET_FLAGS(cfunc) == (METH_VARARGS | METH_KEYWORDS));
-    fn = (PyCFunctionWithKeywords) PyCFunction_GET_FUNCTION(cfunc);
+    assert(PyCFunction_GET_FLAGS(cfunc) == (METH_FASTCALL | METH_KEYWORDS));
+    fn = (fastcallfunc) PyCFunction_GET_FUNCTION(cfunc);
     tstate = PyThreadState_GET();
 
 #if (PY_MAJOR_VERSION >= 3) && (PY_MINOR_VERSION >= 11)
@@ -716,10 +833,10 @@ call_cfunc(Dispatcher *self, PyObject *cfunc, PyObject *args, PyObject *kws, PyO
         /* Populate the 'fast locals' in `frame` */
         PyFrame_LocalsToFast(frame, 0);
 #if (PY_MAJOR_VERSION >= 3) && (PY_MINOR_VERSION >= 11)
-        C_TRACE(result, fn(PyCFunction_GET_SELF(cfunc), args, kws), frame);
+        C_TRACE(result, fn(PyCFunction_GET_SELF(cfunc), args, nargs, NULL), frame);
 #else
         tstate->frame = frame;
-        C_TRACE(result, fn(PyCFunction_GET_SELF(cfunc), args, kws));
+        C_TRACE(result, fn(PyCFunction_GET_SELF(cfunc), args, nargs, NULL));
         /* write changes back to locals? */
         PyFrame_FastToLocals(frame);
         tstate->frame = frame->f_back;
@@ -732,7 +849,7 @@ call_cfunc(Dispatcher *self, PyObject *cfunc, PyObject *args, PyObject *kws, PyO
     }
     else
     {
-        return fn(PyCFunction_GET_SELF(cfunc), args, kws);
+        return fn(PyCFunction_GET_SELF(cfunc), args, nargs, NULL);
     }
 }
 
@@ -756,7 +873,8 @@ compile_and_invoke(Dispatcher *self, PyObject *args, PyObject *kws, PyObject *lo
         return NULL;
 
     if (PyObject_TypeCheck(cfunc, &PyCFunction_Type)) {
-        retval = call_cfunc(self, cfunc, args, kws, locals);
+        retval = call_cfunc(self, cfunc, PySequence_Fast_ITEMS(args),
+                            PyTuple_GET_SIZE(args), locals);
     } else {
         /* Re-enter interpreter */
         retval = PyObject_Call(cfunc, args, kws);
@@ -941,6 +1059,8 @@ Dispatcher_call(Dispatcher *self, PyObject *args, PyObject *kws)
     PyObject *cfunc;
     PyThreadState *ts = PyThreadState_Get();
     PyObject *locals = NULL;
+    ArgKey keys[INLINE_CACHE_MAX_ARGS];
+    bool use_inline_cache;
 
     // Check TLS target stack
     if (use_tls_target_stack) {
@@ -979,6 +1099,19 @@ Dispatcher_call(Dispatcher *self, PyObject *args, PyObject *kws)
 
     argct = PySequence_Fast_GET_SIZE(args);
 
+    /* Look for the overload in the inline cache before computing the
+       typecodes of the arguments */
+    use_inline_cache = self->makeArgKeys(PySequence_Fast_ITEMS(args), argct,
+                                         keys);
+    if (use_inline_cache) {
+        cfunc = self->lookupInlineCache(keys);
+        if (cfunc != NULL) {
+            retval = call_cfunc(self, cfunc, PySequence_Fast_ITEMS(args),
+                                argct, locals);
+            goto CLEANUP;
+        }
+    }
+
     if (argct < (Py_ssize_t) (sizeof(prealloc) / sizeof(int)))
         tys = prealloc;
     else
@@ -1003,7 +1136,8 @@ Dispatcher_call(Dispatcher *self, PyObject *args, PyObject *kws)
        Note that the number of matches is returned in matches by resolve, which
        accepts it as a reference. */
     cfunc = self->resolve(tys, matches, !self->can_compile,
-                          exact_match_required);
+                          exact_match_required,
+                          use_inline_cache ? keys : NULL);
 
     if (matches == 0 && !self->can_compile) {
         /*
@@ -1024,14 +1158,16 @@ Dispatcher_call(Dispatcher *self, PyObject *args, PyObject *kws)
     }
     if (matches == 1) {
         /* Definition is found */
-        retval = call_cfunc(self, cfunc, args, kws, locals);
+        retval = call_cfunc(self, cfunc, PySequence_Fast_ITEMS(args),
+                            argct, locals);
     } else if (matches == 0) {
         /* No matching definition */
         if (self->can_compile) {
             retval = compile_and_invoke(self, args, kws, locals);
         } else if (self->fallbackdef) {
             /* Have object fallback */
-            retval = call_cfunc(self, self->fallbackdef, args, kws, locals);
+            retval = call_cfunc(self, self->fallbackdef,
+                                PySequence_Fast_ITEMS(args), argct, locals);
         } else {
             /* Raise TypeError */
             explain_matching_error((PyObject *) self, args, kws);
@@ -1054,6 +1190,123 @@ CLEANUP:
     return retval;
 }
 
+/* Call obj through tp_call, converting the vectorcall arguments to a tuple
+   and a dict */
+static PyObject*
+vectorcall_using_tp_call(PyObject *obj, PyObject *const *args,
+                         Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *argstuple, *kws = NULL, *retval;
+    Py_ssize_t i, nkws = kwnames == NULL ? 0 : PyTuple_GET_SIZE(kwnames);
+
+    argstuple = PyTuple_New(nargs);
+    if (argstuple == NULL)
+        return NULL;
+    for (i = 0; i < nargs; ++i) {
+        Py_INCREF(args[i]);
+        PyTuple_SET_ITEM(argstuple, i, args[i]);
+    }
+    if (nkws > 0) {
+        kws = PyDict_New();
+        if (kws == NULL) {
+            Py_DECREF(argstuple);
+            return NULL;
+        }
+        for (i = 0; i < nkws; ++i) {
+            if (PyDict_SetItem(kws, PyTuple_GET_ITEM(kwnames, i),
+                               args[nargs + i])) {
+                Py_DECREF(argstuple);
+                Py_DECREF(kws);
+                return NULL;
+            }
+        }
+    }
+    retval = Py_TYPE(obj)->tp_call(obj, argstuple, kws);
+    Py_DECREF(argstuple);
+    Py_XDECREF(kws);
+    return retval;
+}
+
+/* The PEP 590 vectorcall entry point.  Calls passing exactly the positional
+   arguments of the function and matching a compiled overload are dispatched
+   straight from the argument vector, without creating a tuple; all other
+   calls (keyword or default arguments, compilation, errors, tracing...) go
+   through Dispatcher_call. */
+static PyObject*
+Dispatcher_vectorcall(PyObject *obj, PyObject *const *args, size_t nargsf,
+                      PyObject *kwnames)
+{
+    Dispatcher *self = (Dispatcher *) obj;
+    Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+    PyObject *retval = NULL;
+    PyObject *cfunc;
+    int *tys = NULL;
+    int prealloc[24];
+    int matches;
+    Py_ssize_t i;
+    PyThreadState *ts = PyThreadState_Get();
+
+    if ((kwnames != NULL && PyTuple_GET_SIZE(kwnames) > 0)
+        || nargs != self->argct
+        || (self->fold_args && self->has_stararg)
+        || use_tls_target_stack
+        || Py_TYPE(obj)->tp_call != (ternaryfunc) Dispatcher_call
+#if (PY_MAJOR_VERSION >= 3) && (PY_MINOR_VERSION >= 10)
+        || (ts->tracing && ts->c_profilefunc)
+#else
+        || (ts->use_tracing && ts->c_profilefunc)
+#endif
+        ) {
+        return vectorcall_using_tp_call(obj, args, nargs, kwnames);
+    }
+
+    int exact_match_required = self->can_compile ? 1 : self->exact_match_required;
+
+    /* Look for the overload in the inline cache before computing the
+       typecodes of the arguments */
+    ArgKey keys[INLINE_CACHE_MAX_ARGS];
+    bool use_inline_cache = self->makeArgKeys(args, nargs, keys);
+    if (use_inline_cache) {
+        cfunc = self->lookupInlineCache(keys);
+        if (cfunc != NULL) {
+            return call_cfunc(self, cfunc, args, nargs, NULL);
+        }
+    }
+
+    if (nargs < (Py_ssize_t) (sizeof(prealloc) / sizeof(int)))
+        tys = prealloc;
+    else
+        tys = new int[nargs];
+
+    for (i = 0; i < nargs; ++i) {
+        tys[i] = typeof_typecode(obj, args[i]);
+        if (tys[i] == -1) {
+            if (self->can_fallback){
+                /* We will clear the exception if fallback is allowed. */
+                PyErr_Clear();
+            } else {
+                goto CLEANUP;
+            }
+        }
+    }
+
+    cfunc = self->resolve(tys, matches, !self->can_compile,
+                          exact_match_required,
+                          use_inline_cache ? keys : NULL);
+    if (matches == 1) {
+        /* Definition is found */
+        retval = call_cfunc(self, cfunc, args, nargs, NULL);
+    } else {
+        retval = vectorcall_using_tp_call(obj, args, nargs, kwnames);
+    }
+
+CLEANUP:
+    if (tys != prealloc)
+        delete[] tys;
+
+    return retval;
+}
+
 /* Based on Dispatcher_call above, with the following differences:
    1. It does not invoke the definition of the function.
    2. It returns the definition, instead of a value returned by the function.
@@ -1148,7 +1401,8 @@ Dispatcher_cuda_call(Dispatcher *self, PyObject *args, PyObject *kws)
             retval = cuda_compile_only(self, args, kws, locals);
         } else if (self->fallbackdef) {
             /* Have object fallback */
-            retval = call_cfunc(self, self->fallbackdef, args, kws, locals);
+            retval = call_cfunc(self, self->fallbackdef,
+                                PySequence_Fast_ITEMS(args), argct, locals);
         } else {
             /* Raise TypeError */
             explain_matching_error((PyObject *) self, args, kws);
@@ -1188,8 +1442,28 @@ import_devicearray(void)
     return 0;
 }
 
+/* Subclasses defined in Python don't inherit the vectorcall flag, set it on
+   the new subclass as long as it doesn't override __call__. */
+static PyObject *
+Dispatcher_init_subclass(PyObject *cls, PyObject *args, PyObject *kwds)
+{
+    PyTypeObject *type = (PyTypeObject *) cls;
+
+    if (PyTuple_GET_SIZE(args) || (kwds && PyDict_GET_SIZE(kwds))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__init_subclass__() takes no arguments");
+        return NULL;
+    }
+    if (type->tp_call == (ternaryfunc) Dispatcher_call) {
+        type->tp_flags |= Py_TPFLAGS_HAVE_VECTORCALL;
+    }
+    Py_RETURN_NONE;
+}
+
 static PyMethodDef Dispatcher_methods[] = {
     { "_clear", (PyCFunction)Dispatcher_clear, METH_NOARGS, NULL },
+    { "__init_subclass__", (PyCFunction)Dispatcher_init_subclass,
+      METH_VARARGS | METH_KEYWORDS | METH_CLASS, NULL },
     { "_insert", (PyCFunction)Dispatcher_Insert, METH_VARARGS | METH_KEYWORDS,
       "insert new definition"},
     { "_cuda_call", (PyCFunction)Dispatcher_cuda_call,
@@ -1209,7 +1483,7 @@ static PyTypeObject DispatcherType = {
     sizeof(Dispatcher),                          /* tp_basicsize */
     0,                                           /* tp_itemsize */
     (destructor)Dispatcher_dealloc,              /* tp_dealloc */
-    0,                                           /* tp_vectorcall_offset */
+    offsetof(Dispatcher, vectorcall),            /* tp_vectorcall_offset */
     0,                                           /* tp_getattr */
     0,                                           /* tp_setattr */
     0,                                           /* tp_as_async */
@@ -1223,7 +1497,8 @@ static PyTypeObject DispatcherType = {
     0,                                           /* tp_getattro*/
     0,                                           /* tp_setattro*/
     0,                                           /* tp_as_buffer*/
-    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_GC, /* tp_flags*/
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_GC
+        | Py_TPFLAGS_HAVE_VECTORCALL,            /* tp_flags*/
     "Dispatcher object",                         /* tp_doc */
     (traverseproc) Dispatcher_traverse,          /* tp_traverse */
     0,                                           /* tp_clear */
@@ -161,6 +161,7 @@ build_c_helpers_dict(void)
     declmethod(list_setitem);
     declmethod(list_getitem);
     declmethod(list_append);
+    declmethod(list_resize);
     declmethod(list_delitem);
     declmethod(list_delete_slice);
     declmethod(list_iter_sizeof);
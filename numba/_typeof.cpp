@@ -1038,6 +1038,57 @@ typeof_typecode(PyObject *dispatcher, PyObject *val)
 }
 
 
+/*
+ * Return a descriptor of val that, together with its Python type, determines
+ * its typecode, or -1 if the typecode depends on more than its type and the
+ * descriptor.  This is much cheaper than typeof_typecode() and lets the
+ * dispatcher look up the overloads it remembers before computing typecodes.
+ */
+extern "C" int
+typeof_argkey(PyObject *val)
+{
+    PyTypeObject *tyobj = Py_TYPE(val);
+    if (tyobj == &PyFloat_Type || tyobj == &PyComplex_Type
+        || tyobj == &PyBool_Type) {
+        return 0;
+    }
+#if SIZEOF_VOID_P >= 8
+    /* On 32-bit platforms, the typecode of an int depends on its value */
+    if (tyobj == &PyLong_Type) {
+        return 0;
+    }
+#endif
+    if (tyobj == &PyArray_Type) {
+        PyArrayObject *ary = (PyArrayObject *) val;
+        int ndim = PyArray_NDIM(ary);
+        int layout = 0;
+        int dtype;
+        /* The arrays taking the table lookup in typecode_ndarray() */
+        if (!PyArray_ISBEHAVED(ary) || ndim <= 0 || ndim > N_NDIM) {
+            return -1;
+        }
+        dtype = dtype_num_to_typecode(PyArray_TYPE(ary));
+        if (dtype == -1) {
+            return -1;
+        }
+        if (PyArray_IS_C_CONTIGUOUS(ary)) {
+            layout = 1;
+        } else if (PyArray_IS_F_CONTIGUOUS(ary)) {
+            layout = 2;
+        }
+        return 1 + (dtype * N_NDIM + ndim - 1) * N_LAYOUT + layout;
+    }
+    /* The numeric scalar types have a single dtype.  Subclasses are left
+       out, as a type freed and another allocated at the same address would
+       get the same key. */
+    if (!(tyobj->tp_flags & Py_TPFLAGS_HEAPTYPE)
+        && (PyArray_IsScalar(val, Number) || PyArray_IsScalar(val, Bool))) {
+        return 0;
+    }
+    return -1;
+}
+
+
 static
 void* wrap_import_array(void) {
     import_array(); /* import array returns NULL on failure */
@@ -7,6 +7,7 @@
 
 extern PyObject *typeof_init(PyObject *self, PyObject *args);
 extern int typeof_typecode(PyObject *dispatcher, PyObject *val);
+extern int typeof_argkey(PyObject *val);
 extern PyObject *typeof_compute_fingerprint(PyObject *val);
 
 #ifdef __cplusplus
@@ -4,15 +4,19 @@ Caching mechanism for compiled functions.
 
 
 from abc import ABCMeta, abstractmethod, abstractproperty
+import base64
 import contextlib
 import errno
 import hashlib
 import inspect
 import itertools
+import json
 import os
 import pickle
 import sys
 import tempfile
+import threading
+import time
 import uuid
 import warnings
 
@@ -73,6 +77,12 @@ class _Cache(metaclass=ABCMeta):
         Flush the cache.
         """
 
+    def trace_signature(self, sig):
+        """
+        Record that the given signature of the function was used, so that
+        the cache can be populated ahead of time.
+        """
+
 
 class NullCache(_Cache):
     @property
@@ -126,6 +136,15 @@ class _CacheLocator(metaclass=ABCMeta):
         It should allow disambiguating different but similarly-named functions.
         """
 
+    def get_source_path(self):
+        """
+        Return the path of the file the source stamp is computed from, so
+        that the freshness of cache entries can be checked without the
+        function (see `gc_cache_dir`).  None if the stamp cannot be
+        recomputed from a file.
+        """
+        return None
+
     @classmethod
     def from_function(cls, py_func, py_file):
         """
@@ -152,6 +171,139 @@ class _CacheLocator(metaclass=ABCMeta):
         return '_'.join([parentdir, hashed])
 
 
+# Hashes of the source files computed by this process, keyed by path,
+# modification time and size, so that each file is only read once.
+_source_file_hashes = {}
+
+
+def _source_file_hash(py_file):
+    """
+    Return the SHA-256 hash of the contents of *py_file*.
+    """
+    st = os.stat(py_file)
+    key = py_file, st.st_mtime_ns, st.st_size
+    try:
+        return _source_file_hashes[key]
+    except KeyError:
+        pass
+    with open(py_file, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    _source_file_hashes[key] = digest
+    return digest
+
+
+def _source_file_stamp(py_file, mode=None):
+    """
+    Return the stamp of the Python source file *py_file*, depending on
+    *mode* (NUMBA_CACHE_SOURCE_STAMP by default) either its modification
+    time and size or a hash of its contents.
+    """
+    if mode is None:
+        mode = config.CACHE_SOURCE_STAMP
+    if getattr(sys, 'frozen', False):
+        st = os.stat(sys.executable)
+    elif mode == 'hash':
+        return _source_file_hash(py_file)
+    elif mode == 'mtime':
+        st = os.stat(py_file)
+    else:
+        msg = ("Unknown cache source stamp %r, expected 'mtime' or 'hash'"
+               % (mode,))
+        raise ValueError(msg)
+    # We use both timestamp and size as some filesystems only have second
+    # granularity.
+    return st.st_mtime, st.st_size
+
+
+def _dependency_stamp(source_stamp, dependencies, mode=None):
+    """
+    Combine the stamp of a function's own source file with the stamps of the
+    source files of the functions it depends on.
+    """
+    if not dependencies:
+        return source_stamp
+    return source_stamp, tuple(_source_file_stamp(dep, mode)
+                               for dep in dependencies)
+
+
+def _is_fresh_stamp(stamp, source_path, dependencies, mode):
+    """
+    Whether *stamp*, computed with the source stamp *mode*, is still the
+    stamp of *source_path* and its *dependencies*.
+    """
+    try:
+        current = _dependency_stamp(_source_file_stamp(source_path, mode),
+                                    dependencies, mode)
+    except OSError:
+        # A source file was removed
+        return False
+    return current == stamp
+
+
+def _referenced_objects(py_func):
+    """
+    Yield the global and closure variables *py_func* may refer to, including
+    the attributes of referenced modules.
+    """
+    names = set()
+    codes = [py_func.__code__]
+    while codes:
+        code = codes.pop()
+        names.update(code.co_names)
+        codes.extend(c for c in code.co_consts if inspect.iscode(c))
+    values = [py_func.__globals__[name] for name in names
+              if name in py_func.__globals__]
+    for cell in py_func.__closure__ or ():
+        try:
+            values.append(cell.cell_contents)
+        except ValueError:
+            # Empty cell
+            pass
+    for value in values:
+        yield value
+        if inspect.ismodule(value):
+            # Look in the module namespace directly to avoid triggering
+            # module-level __getattr__ hooks.
+            namespace = vars(value)
+            for name in names:
+                if name in namespace:
+                    yield namespace[name]
+
+
+def find_dependency_files(py_func):
+    """
+    Return the sorted list of source files, other than the function's own,
+    defining the jitted functions *py_func* may call, transitively.  Callees
+    are found from the global and closure variables of the functions, so
+    functions bound after *py_func* is decorated are missed.
+    """
+    from numba.core.dispatcher import Dispatcher
+
+    files = set()
+    seen = set()
+    pending = [py_func]
+    while pending:
+        func = pending.pop()
+        if func in seen:
+            continue
+        seen.add(func)
+        for obj in _referenced_objects(func):
+            if not isinstance(obj, Dispatcher):
+                continue
+            try:
+                path = inspect.getfile(obj.py_func)
+            except TypeError:
+                continue
+            if os.path.exists(path):
+                files.add(path)
+            pending.append(obj.py_func)
+    try:
+        files.discard(inspect.getfile(py_func))
+    except TypeError:
+        pass
+    return sorted(files)
+
+
 class _SourceFileBackedLocatorMixin(object):
     """
     A cache locator mixin for functions which are backed by a well-known
@@ -159,13 +311,12 @@ class _SourceFileBackedLocatorMixin(object):
     """
 
     def get_source_stamp(self):
+        return _source_file_stamp(self._py_file)
+
+    def get_source_path(self):
         if getattr(sys, 'frozen', False):
-            st = os.stat(sys.executable)
-        else:
-            st = os.stat(self._py_file)
-        # We use both timestamp and size as some filesystems only have second
-        # granularity.
-        return st.st_mtime, st.st_size
+            return None
+        return self._py_file
 
     def get_disambiguator(self):
         return str(self._lineno)
@@ -448,12 +599,16 @@ class IndexDataCacheFile(object):
     """
     Implements the logic for the index file and data file used by a cache.
     """
-    def __init__(self, cache_path, filename_base, source_stamp):
+    def __init__(self, cache_path, filename_base, source_stamp,
+                 source_path=None, dependencies=()):
         self._cache_path = cache_path
         self._index_name = '%s.nbi' % (filename_base,)
         self._index_path = os.path.join(self._cache_path, self._index_name)
         self._data_name_pattern = '%s.{number:d}.nbc' % (filename_base,)
         self._source_stamp = source_stamp
+        self._source_path = source_path
+        self._dependencies = tuple(dependencies)
+        self._stamp_mode = config.CACHE_SOURCE_STAMP
         self._version = numba.__version__
 
     def flush(self):
@@ -476,7 +631,11 @@ class IndexDataCacheFile(object):
                     break
             overloads[key] = data_name
             self._save_index(overloads)
-        self._save_data(data_name, data)
+        # The key is saved along with the data, see load()
+        size = self._save_data(data_name, (key, data))
+        if config.CACHE_MAX_SIZE > 0:
+            _evict_if_oversized(self._cache_path, size,
+                                config.CACHE_MAX_SIZE)
 
     def load(self, key):
         """
@@ -487,10 +646,18 @@ class IndexDataCacheFile(object):
         if data_name is None:
             return
         try:
-            return self._load_data(data_name)
+            saved_key, data = self._load_data(data_name)
         except OSError:
             # File could have been removed while the index still refers it.
             return
+        except ValueError:
+            # Data file written by an earlier revision
+            return
+        if saved_key != key:
+            # Another process allocated the same data file to a different
+            # entry after the index was read.
+            return
+        return data
 
     def _load_index(self):
         """
@@ -508,9 +675,20 @@ class IndexDataCacheFile(object):
             # This is another version.  Avoid trying to unpickling the
             # rest of the stream, as that may fail.
             return {}
-        stamp, overloads = pickle.loads(data)
+        # Indexes written by earlier revisions don't record the source path
+        stamp, overloads, *rest = pickle.loads(data)
         _cache_log("[cache] index loaded from %r", self._index_path)
-        if stamp != self._source_stamp:
+        stamp_mode = rest[2] if len(rest) > 2 else 'mtime'
+        if stamp_mode != self._stamp_mode and self._source_path is not None:
+            # Written with another NUMBA_CACHE_SOURCE_STAMP, the stamps can
+            # only be compared if computed the same way, from the
+            # dependencies the index was written with.
+            dependencies = rest[1] if len(rest) > 1 else []
+            fresh = _is_fresh_stamp(stamp, self._source_path,
+                                    dependencies, stamp_mode)
+        else:
+            fresh = stamp == self._source_stamp
+        if not fresh:
             # Cache is not fresh.  Stale data files will be eventually
             # overwritten, since they are numbered in incrementing order.
             return {}
@@ -518,7 +696,8 @@ class IndexDataCacheFile(object):
             return overloads
 
     def _save_index(self, overloads):
-        data = self._source_stamp, overloads
+        data = (self._source_stamp, overloads, self._source_path,
+                self._dependencies, self._stamp_mode)
         data = self._dump(data)
         with self._open_for_write(self._index_path) as f:
             pickle.dump(self._version, f, protocol=-1)
@@ -531,6 +710,14 @@ class IndexDataCacheFile(object):
             data = f.read()
         tup = pickle.loads(data)
         _cache_log("[cache] data loaded from %r", path)
+        # Record the load time as the access time of the data file, it is
+        # used to evict the least recently used entries.  The modification
+        # time is left untouched.
+        try:
+            os.utime(path, (time.time(), os.stat(path).st_mtime))
+        except OSError:
+            # Read-only cache
+            pass
         return tup
 
     def _save_data(self, name, data):
@@ -539,6 +726,7 @@ class IndexDataCacheFile(object):
         with self._open_for_write(path) as f:
             f.write(data)
         _cache_log("[cache] data saved to %r", path)
+        return len(data)
 
     def _data_name(self, number):
         return self._data_name_pattern.format(number=number)
@@ -570,6 +758,209 @@ class IndexDataCacheFile(object):
             raise
 
 
+class SQLiteDataCacheFile(object):
+    """
+    Implements a cache store keeping the index and data of all the functions
+    cached in a directory in a single SQLite database.
+
+    Each overload is one row, so saving an overload is an atomic insert
+    rather than a rewrite of the function's whole index, and loading one
+    only needs to open a single file.
+
+    This relies on SQLite's file locking, which is not reliable on network
+    file systems such as NFS: this store must not be used for a cache
+    directory on one.
+    """
+    _db_name = 'index.nbdb'
+    # Seconds to wait for another process to finish writing
+    _timeout = 60.0
+
+    def __init__(self, cache_path, filename_base, source_stamp,
+                 source_path=None, dependencies=()):
+        self._cache_path = cache_path
+        self._db_path = os.path.join(self._cache_path, self._db_name)
+        self._filename_base = filename_base
+        self._source_stamp = source_stamp
+        self._version = numba.__version__
+
+    def flush(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM overloads WHERE name = ?",
+                         (self._filename_base,))
+        _cache_log("[cache] index flushed in %r", self._db_path)
+
+    def save(self, key, data):
+        """
+        Save a new cache entry with *key* and *data*.
+        """
+        data = self._dump(data)
+        with self._connect() as conn:
+            # Take the write lock before reading so that the lookup and the
+            # insertion are atomic with respect to other writers.
+            conn.execute("BEGIN IMMEDIATE")
+            stale = []
+            existing = None
+            for rowid, row_key in self._iter_rows(conn, stale):
+                if row_key == key:
+                    existing = rowid
+                    break
+            # Entries for an obsolete source file or Numba version can never
+            # be loaded again, drop them.
+            conn.executemany("DELETE FROM overloads WHERE rowid = ?",
+                             [(rowid,) for rowid in stale])
+            if existing is None:
+                conn.execute("INSERT INTO overloads "
+                             "(name, version, stamp, key, data) "
+                             "VALUES (?, ?, ?, ?, ?)",
+                             (self._filename_base, self._version,
+                              pickle.dumps(self._source_stamp, protocol=-1),
+                              pickle.dumps(key, protocol=-1), data))
+            else:
+                conn.execute("UPDATE overloads SET data = ? WHERE rowid = ?",
+                             (data, existing))
+            if config.CACHE_MAX_SIZE:
+                self._evict(conn, config.CACHE_MAX_SIZE)
+        _cache_log("[cache] data saved to %r", self._db_path)
+
+    def _evict(self, conn, max_size):
+        """
+        Delete the oldest entries of the database until the pages in use take
+        at most *max_size* bytes.  The freed pages are reused by later saves.
+        """
+        (page_size,), = conn.execute("PRAGMA page_size")
+        (page_count,), = conn.execute("PRAGMA page_count")
+        (free_count,), = conn.execute("PRAGMA freelist_count")
+        excess = (page_count - free_count) * page_size - max_size
+        if excess <= 0:
+            return
+        evicted = []
+        cur = conn.execute("SELECT rowid, length(key) + length(data) "
+                           "FROM overloads ORDER BY rowid")
+        for rowid, size in cur:
+            if excess <= 0:
+                break
+            evicted.append((rowid,))
+            excess -= size
+        cur.close()
+        conn.executemany("DELETE FROM overloads WHERE rowid = ?", evicted)
+        _cache_log("[cache] evicted %d entries from %r", len(evicted),
+                   self._db_path)
+
+    def load(self, key):
+        """
+        Load a cache entry with *key*.
+        """
+        if not os.path.exists(self._db_path):
+            return
+        with self._connect() as conn:
+            # Read the keys and the data in one transaction so that they are
+            # consistent with each other.
+            conn.execute("BEGIN")
+            for rowid, row_key in self._iter_rows(conn):
+                if row_key == key:
+                    (data,), = conn.execute(
+                        "SELECT data FROM overloads WHERE rowid = ?",
+                        (rowid,))
+                    break
+            else:
+                return
+        _cache_log("[cache] data loaded from %r", self._db_path)
+        return pickle.loads(data)
+
+    def _iter_rows(self, conn, stale=None):
+        """
+        Yield (rowid, key) for the fresh entries of this function. The rowids
+        of obsolete entries are appended to *stale* if given.
+        """
+        cur = conn.execute("SELECT rowid, version, stamp, key FROM overloads "
+                           "WHERE name = ?", (self._filename_base,))
+        for rowid, version, stamp, key in cur.fetchall():
+            # Don't try to unpickle entries from another version, as that may
+            # fail.
+            if (version != self._version
+                    or pickle.loads(stamp) != self._source_stamp):
+                if stale is not None:
+                    stale.append(rowid)
+                continue
+            yield rowid, pickle.loads(key)
+
+    def _create(self):
+        """
+        Create the database with its schema.  It is created under a temporary
+        name and linked into place, so that other processes never see a
+        database without the schema.
+        """
+        import sqlite3
+
+        uid = uuid.uuid4().hex[:16]  # avoid long paths
+        tmpname = '%s.tmp.%s' % (self._db_path, uid)
+        try:
+            conn = sqlite3.connect(tmpname, isolation_level=None)
+            try:
+                conn.execute("CREATE TABLE overloads ("
+                             "name TEXT NOT NULL, "
+                             "version TEXT NOT NULL, "
+                             "stamp BLOB NOT NULL, "
+                             "key BLOB NOT NULL, "
+                             "data BLOB NOT NULL)")
+                conn.execute("CREATE INDEX overloads_name "
+                             "ON overloads (name)")
+            finally:
+                conn.close()
+            try:
+                os.link(tmpname, self._db_path)
+            except FileExistsError:
+                # Created by another process in the meantime
+                pass
+            except OSError:
+                # Hard links are not supported by the file system
+                if not os.path.exists(self._db_path):
+                    os.replace(tmpname, self._db_path)
+        finally:
+            try:
+                os.unlink(tmpname)
+            except OSError:
+                pass
+
+    @contextlib.contextmanager
+    def _connect(self):
+        """
+        Open a connection to the database, creating it if needed.
+        Connections are not kept around so that the store can be used from
+        several threads and forked processes.  The transaction is committed
+        on successful exit.
+        """
+        # Not imported at module level to keep it out of Numba's import time
+        import sqlite3
+
+        if not os.path.exists(self._db_path):
+            self._create()
+        conn = sqlite3.connect(self._db_path, timeout=self._timeout,
+                               isolation_level=None)
+        try:
+            try:
+                yield conn
+            except BaseException:
+                if conn.in_transaction:
+                    conn.rollback()
+                raise
+            else:
+                if conn.in_transaction:
+                    conn.commit()
+        finally:
+            conn.close()
+
+    def _dump(self, obj):
+        return dumps(obj)
+
+
+# Cache stores selectable through NUMBA_CACHE_BACKEND
+_cache_file_classes = {
+    'files': IndexDataCacheFile,
+    'sqlite': SQLiteDataCacheFile,
+}
+
+
 class Cache(_Cache):
     """
     A per-function compilation cache.  The cache saves data in separate
@@ -587,6 +978,10 @@ class Cache(_Cache):
     Separate index and data files per Python version avoid pickle
     compatibility problems.
 
+    Alternatively, when ``NUMBA_CACHE_BACKEND`` is set to ``sqlite``, the
+    index and data of all functions in a cache directory are kept in a
+    single database ("index.nbdb").
+
     Note:
     This contains the driver logic only.  The core logic is provided
     by a subclass of ``CacheImpl`` specified as *_impl_class* in the subclass.
@@ -602,10 +997,26 @@ class Cache(_Cache):
         self._cache_path = self._impl.locator.get_cache_path()
         # This may be a bit strict but avoids us maintaining a magic number
         source_stamp = self._impl.locator.get_source_stamp()
+        source_path = self._impl.locator.get_source_path()
+        # Entries are also invalidated when the source of a jitted callee
+        # changes, as its code may be inlined or linked in.
+        if source_path is not None:
+            dependencies = find_dependency_files(py_func)
+        else:
+            dependencies = []
+        source_stamp = _dependency_stamp(source_stamp, dependencies)
         filename_base = self._impl.filename_base
-        self._cache_file = IndexDataCacheFile(cache_path=self._cache_path,
-                                              filename_base=filename_base,
-                                              source_stamp=source_stamp)
+        try:
+            cache_file_class = _cache_file_classes[config.CACHE_BACKEND]
+        except KeyError:
+            msg = ("Unknown cache backend %r, expected one of %s"
+                   % (config.CACHE_BACKEND, sorted(_cache_file_classes)))
+            raise ValueError(msg)
+        self._cache_file = cache_file_class(cache_path=self._cache_path,
+                                            filename_base=filename_base,
+                                            source_stamp=source_stamp,
+                                            source_path=source_path,
+                                            dependencies=dependencies)
         self.enable()
 
     def __repr__(self):
@@ -624,6 +1035,10 @@ class Cache(_Cache):
     def flush(self):
         self._cache_file.flush()
 
+    def trace_signature(self, sig):
+        if config.CACHE_TRACE:
+            _record_cache_trace(self._py_func, sig)
+
     def load_overload(self, sig, target_context):
         """
         Load and recreate the cached object for the given signature,
@@ -703,6 +1118,114 @@ class FunctionCache(Cache):
     _impl_class = CompileResultCacheImpl
 
 
+class _OverloadCacheImpl(CompileResultCacheImpl):
+
+    def check_cachable(self, cres):
+        # Overload implementations are cached opportunistically, don't warn
+        # the user about those that cannot be.
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', NumbaWarning)
+            return super().check_cachable(cres)
+
+
+class OverloadCache(FunctionCache):
+    """
+    Implements Cache that saves and loads the CompileResult objects of the
+    implementations of `@overload` functions (see NUMBA_CACHE_OVERLOADS).
+    """
+    _impl_class = _OverloadCacheImpl
+
+    def __init__(self, py_func, options):
+        super().__init__(py_func)
+        # A string describing the compilation options of the implementation,
+        # including those inherited from the function being compiled: an
+        # implementation gets a dispatcher for each set of options.
+        self._options = options
+
+    def load_overload(self, sig, target_context):
+        try:
+            return super().load_overload(sig, target_context)
+        except (pickle.PickleError, TypeError, AttributeError, EOFError):
+            # The implementation is compiled instead, e.g. its closure
+            # variables can't be pickled to compute the index key.
+            return None
+
+    def save_overload(self, sig, data):
+        try:
+            super().save_overload(sig, data)
+        except (pickle.PicklingError, TypeError, AttributeError,
+                OSError) as e:
+            # e.g. the compile result refers to objects that can't be pickled
+            msg = ('Cannot cache compiled implementation "%s" for %s: %s'
+                   % (self._name, sig, e))
+            warnings.warn(msg, NumbaWarning)
+
+    def _index_key(self, sig, codegen):
+        return super()._index_key(sig, codegen) + (self._options,)
+
+    def trace_signature(self, sig):
+        # Implementations are not importable, they are compiled when warming
+        # the cache of the functions using them.
+        pass
+
+
+# Signatures already written to each trace file by this process
+_traced_signatures = set()
+_traced_signatures_lock = threading.Lock()
+
+
+def _record_cache_trace(py_func, argtypes):
+    """
+    Append an entry for calling *py_func* with *argtypes* to the signature
+    trace file given by NUMBA_CACHE_TRACE.  Each line of the trace file is a
+    JSON object; the argument types are stored pickled so that they can be
+    rebuilt exactly by ``numba --warm-cache``.
+    """
+    module = py_func.__module__
+    qualname = py_func.__qualname__
+    key = config.CACHE_TRACE, module, qualname, argtypes
+    with _traced_signatures_lock:
+        if key in _traced_signatures:
+            return
+        _traced_signatures.add(key)
+    try:
+        pickled = pickle.dumps(argtypes, protocol=-1)
+    except Exception as e:
+        msg = ("Cannot record signature %s of %s.%s in the cache trace: %s"
+               % (argtypes, module, qualname, e))
+        warnings.warn(msg, NumbaWarning)
+        return
+    entry = dict(module=module, qualname=qualname,
+                 signature=str(argtypes),
+                 argtypes=base64.b64encode(pickled).decode('ascii'))
+    # A single write of a line in append mode keeps the entries of
+    # concurrent processes from interleaving.
+    with open(config.CACHE_TRACE, "a") as f:
+        f.write(json.dumps(entry) + "\n")
+    _cache_log("[cache] signature %s of %s.%s traced to %r",
+               argtypes, module, qualname, config.CACHE_TRACE)
+
+
+def load_cache_trace(path):
+    """
+    Read a signature trace file written with NUMBA_CACHE_TRACE.  Returns a
+    dict mapping (module, qualname) to the list of distinct argument type
+    tuples recorded for that function, in recording order.
+    """
+    trace = {}
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            entry = json.loads(line)
+            argtypes = pickle.loads(base64.b64decode(entry['argtypes']))
+            sigs = trace.setdefault((entry['module'], entry['qualname']), [])
+            if argtypes not in sigs:
+                sigs.append(argtypes)
+    return trace
+
+
 # Remember used cache filename prefixes.
 _lib_cache_prefixes = set([''])
 
@@ -729,3 +1252,184 @@ def make_library_cache(prefix):
 
     return LibraryCache
 
+
+
+def _read_index_file(path):
+    """
+    Read the index file at *path*.  Returns (version, stamp, overloads,
+    source path, dependencies, stamp mode), the last five being None if the
+    index was written by another Numba version.
+    """
+    with open(path, "rb") as f:
+        version = pickle.load(f)
+        data = f.read()
+    if version != numba.__version__:
+        return version, None, None, None, None, None
+    stamp, overloads, *rest = pickle.loads(data)
+    source_path = rest[0] if len(rest) > 0 else None
+    dependencies = rest[1] if len(rest) > 1 else ()
+    # Indexes written before the stamp mode was recorded used mtime
+    stamp_mode = rest[2] if len(rest) > 2 else 'mtime'
+    return version, stamp, overloads, source_path, dependencies, stamp_mode
+
+
+def _remove_cache_file(path, removed):
+    """
+    Remove the file at *path*, appending (path, size) to *removed*.  Returns
+    the size of the file, or None if it could not be removed.
+    """
+    try:
+        size = os.stat(path).st_size
+        os.unlink(path)
+    except OSError:
+        return None
+    removed.append((path, size))
+    return size
+
+
+# Estimated size of the cache files of the cache directories saved to by
+# this process, so that they are only scanned when they may be too large.
+_cache_dir_sizes = {}
+
+
+def _evict_if_oversized(cache_path, added, max_size):
+    """
+    Account for *added* bytes saved to the cache directory *cache_path* and
+    evict data files if its estimated size exceeds *max_size*.  The size is
+    measured on the first save and after each eviction, and the sizes of the
+    files saved in between are added to it.  Files saved by other processes
+    are only accounted for when the directory is measured.
+    """
+    size = _cache_dir_sizes.get(cache_path)
+    if size is not None and size + added <= max_size:
+        _cache_dir_sizes[cache_path] = size + added
+        return
+    _, _cache_dir_sizes[cache_path] = _evict_cache_dir(cache_path, max_size)
+
+
+def evict_cache_dir(cache_path, max_size):
+    """
+    Remove the least recently loaded data files of the cache directory
+    *cache_path* until the cache files in it take at most *max_size* bytes.
+    Returns a list of (path, size) of the removed files.
+    """
+    removed, _ = _evict_cache_dir(cache_path, max_size)
+    return removed
+
+
+def _evict_cache_dir(cache_path, max_size):
+    """
+    Implementation of `evict_cache_dir`, also returning the size of the cache
+    files left in *cache_path*.
+    """
+    total = 0
+    data_files = []
+    try:
+        names = os.listdir(cache_path)
+    except OSError:
+        return [], 0
+    for name in names:
+        if not name.endswith(('.nbi', '.nbc', '.nbdb')):
+            continue
+        path = os.path.join(cache_path, name)
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        total += st.st_size
+        if name.endswith('.nbc'):
+            data_files.append((st.st_atime, path))
+    removed = []
+    for _, path in sorted(data_files):
+        if total <= max_size:
+            break
+        size = _remove_cache_file(path, removed)
+        if size is not None:
+            total -= size
+            _cache_log("[cache] evicted %r", path)
+    return removed, total
+
+
+def _gc_index_files(dirpath, names, removed):
+    """
+    Remove the stale index files in *dirpath* along with their data files,
+    and the data files not referenced by any fresh index.
+    """
+    referenced = set()
+    for name in names:
+        if not name.endswith('.nbi'):
+            continue
+        path = os.path.join(dirpath, name)
+        try:
+            (version, stamp, overloads, source_path,
+             dependencies, stamp_mode) = _read_index_file(path)
+        except Exception:
+            # Unreadable, e.g. truncated or foreign pickle protocol
+            overloads = None
+        else:
+            # The stamp is recomputed the way the index was written, not
+            # according to the current NUMBA_CACHE_SOURCE_STAMP.
+            if (overloads is not None and source_path is not None
+                    and not _is_fresh_stamp(stamp, source_path,
+                                            dependencies, stamp_mode)):
+                overloads = None
+        if overloads is None:
+            _remove_cache_file(path, removed)
+        else:
+            referenced.update(overloads.values())
+    for name in names:
+        if name.endswith('.nbc') and name not in referenced:
+            _remove_cache_file(os.path.join(dirpath, name), removed)
+
+
+def _gc_database(path, removed):
+    """
+    Remove the entries of another Numba version from the SQLite cache store
+    at *path*.
+    """
+    import sqlite3
+
+    size = os.stat(path).st_size
+    conn = sqlite3.connect(path, timeout=SQLiteDataCacheFile._timeout,
+                           isolation_level=None)
+    try:
+        conn.execute("DELETE FROM overloads WHERE version != ?",
+                     (numba.__version__,))
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+    freed = size - os.stat(path).st_size
+    if freed > 0:
+        removed.append((path, freed))
+
+
+def gc_cache_dir(cache_dir, max_size=None):
+    """
+    Garbage collect the cache files found under *cache_dir* (recursively).
+    This removes:
+
+    - index files written by another Numba version, or whose source file
+      has changed or no longer exists;
+    - data files which are not referenced by a fresh index;
+    - entries of another Numba version from SQLite cache stores;
+    - if *max_size* is given, the least recently loaded data files of each
+      directory until it holds at most *max_size* bytes of cache files.
+
+    Returns a list of (path, freed bytes).
+    """
+    import sqlite3
+
+    removed = []
+    for dirpath, dirnames, names in os.walk(cache_dir):
+        if any(name.endswith(('.nbi', '.nbc')) for name in names):
+            _gc_index_files(dirpath, names, removed)
+        if SQLiteDataCacheFile._db_name in names:
+            path = os.path.join(dirpath, SQLiteDataCacheFile._db_name)
+            try:
+                _gc_database(path, removed)
+            except sqlite3.Error as e:
+                warnings.warn("Cannot garbage collect %r: %s" % (path, e),
+                              NumbaWarning)
+        if max_size:
+            removed.extend(evict_cache_dir(dirpath, max_size))
+    return removed
@@ -101,42 +101,53 @@ class PyCallWrapper(object):
     def build(self):
         wrapname = self.fndesc.llvm_cpython_wrapper_name
 
-        # This is the signature of PyCFunctionWithKeywords
-        # (see CPython's methodobject.h)
+        # This is the signature of a METH_FASTCALL | METH_KEYWORDS function,
+        # i.e. _PyCFunctionFastWithKeywords (see CPython's methodobject.h)
         pyobj = self.context.get_argument_type(types.pyobject)
-        wrapty = llvmlite.ir.FunctionType(pyobj, [pyobj, pyobj, pyobj])
+        py_ssize_t = self.context.get_value_type(types.intp)
+        wrapty = llvmlite.ir.FunctionType(pyobj, [pyobj, pyobj.as_pointer(),
+                                                  py_ssize_t, pyobj])
         wrapper = llvmlite.ir.Function(self.module, wrapty, name=wrapname)
 
         builder = IRBuilder(wrapper.append_basic_block('entry'))
 
         # - `closure` will receive the `self` pointer stored in the
         #   PyCFunction object (see _dynfunc.c)
-        # - `args` and `kws` will receive the tuple and dict objects
-        #   of positional and keyword arguments, respectively.
-        closure, args, kws = wrapper.args
+        # - `args` and `nargs` will receive the vector of positional
+        #   arguments and its length, respectively.
+        # - `kwnames` will receive the tuple of the names of the keyword
+        #   arguments following the positional ones in `args`.  They are
+        #   ignored, as PyArg_UnpackTuple() ignored the keyword arguments
+        #   dict: the dispatcher folds them into the positional arguments.
+        closure, args, nargs, kwnames = wrapper.args
         closure.name = 'py_closure'
         args.name = 'py_args'
-        kws.name = 'py_kws'
+        nargs.name = 'py_nargs'
+        kwnames.name = 'py_kwnames'
 
         api = self.context.get_python_api(builder)
-        self.build_wrapper(api, builder, closure, args, kws)
+        self.build_wrapper(api, builder, closure, args, nargs)
 
         return wrapper, api
 
-    def build_wrapper(self, api, builder, closure, args, kws):
-        nargs = len(self.fndesc.argtypes)
+    def build_wrapper(self, api, builder, closure, args, nargs):
+        expected = len(self.fndesc.argtypes)
 
-        objs = [api.alloca_obj() for _ in range(nargs)]
-        parseok = api.unpack_tuple(args, self.fndesc.qualname,
-                                   nargs, nargs, *objs)
-
-        pred = builder.icmp_unsigned(
-            '==',
-            parseok,
-            Constant(parseok.type, None))
+        pred = builder.icmp_signed('!=', nargs,
+                                   Constant(nargs.type, expected))
         with cgutils.if_unlikely(builder, pred):
+            # Same message as PyArg_UnpackTuple()
+            msg = "%%s expected %d argument%s, got %%zd" % (
+                expected, "" if expected == 1 else "s")
+            name = self.context.insert_const_string(builder.module,
+                                                    self.fndesc.qualname)
+            api.err_format("PyExc_TypeError", msg, name, nargs)
             builder.ret(api.get_null_object())
 
+        # The arguments are borrowed references, as with PyArg_UnpackTuple()
+        objs = [builder.gep(args, [Constant(nargs.type, i)])
+                for i in range(expected)]
+
         # Block that returns after erroneous argument unboxing/cleanup
         endblk = builder.append_basic_block("arg.end")
         with builder.goto_block(endblk):
@@ -146,7 +157,7 @@ class PyCallWrapper(object):
         env_manager = self.get_env(api, builder)
 
         cleanup_manager = _ArgManager(self.context, builder, api,
-                                      env_manager, endblk, nargs)
+                                      env_manager, endblk, expected)
 
         # Compute the arguments to the compiled Numba function.
         innerargs = []
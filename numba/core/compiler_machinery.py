@@ -298,6 +298,7 @@ class PassManager(object):
 
         ev_details = dict(
             name=f"{pss.name()} [{qualname}]",
+            pass_name=pss.name(),
             qualname=qualname,
             module=internal_state.func_id.modname,
             flags=pformat(internal_state.flags.values()),
@@ -80,6 +80,29 @@ def _validate_captured_errors_style(style_str):
         return rendered_style
 
 
+def _parse_thread_affinity(value):
+    """Parse the thread affinity policy of NUMBA_THREAD_AFFINITY, one of
+    "none", "compact" or a list of CPUs such as "0-3,8,10-11", the latter
+    being returned as a tuple of ints.
+    """
+    if not isinstance(value, str):
+        return tuple(int(cpu) for cpu in value)
+    value = value.strip().lower()
+    if value in ('none', 'compact'):
+        return value
+    cpus = []
+    for item in value.split(','):
+        first, _, last = item.partition('-')
+        first = int(first)
+        last = int(last) if last else first
+        if first < 0 or last < first:
+            raise ValueError(f"Invalid CPU range in thread affinity: {item}")
+        cpus.extend(range(first, last + 1))
+    if not cpus:
+        raise ValueError("Empty thread affinity CPU list")
+    return tuple(cpus)
+
+
 class _OptLevel(int):
     """This class holds the "optimisation level" set in `NUMBA_OPT`. As this env
     var can be an int or a string, but is almost always interpreted as an int,
@@ -290,12 +313,35 @@ class _EnvReloader(object):
         # Contains path to the directory
         CACHE_DIR = _readenv("NUMBA_CACHE_DIR", str, "")
 
+        # Storage used by the cache, "files" for an index file and a data
+        # file per function or "sqlite" for a single database per directory
+        CACHE_BACKEND = _readenv("NUMBA_CACHE_BACKEND", str, "files")
+
+        # Record the signatures of cached functions to this file, for use
+        # with `numba --warm-cache`
+        CACHE_TRACE = _readenv("NUMBA_CACHE_TRACE", str, "")
+
+        # Maximum size in bytes of the cache files in a cache directory, the
+        # least recently loaded entries are evicted beyond it (0: unlimited)
+        CACHE_MAX_SIZE = _readenv("NUMBA_CACHE_MAX_SIZE", int, 0)
+
+        # How the freshness of source files is checked by the cache, "mtime"
+        # for the modification time and size, "hash" for a content hash
+        CACHE_SOURCE_STAMP = _readenv("NUMBA_CACHE_SOURCE_STAMP", str, "mtime")
+
+        # Also cache the compiled implementations of `@overload` functions,
+        # in the cache directory of the file they are defined in
+        CACHE_OVERLOADS = _readenv("NUMBA_CACHE_OVERLOADS", int, 0)
+
         # Enable tracing support
         TRACE = _readenv("NUMBA_TRACE", int, 0)
 
         # Enable chrome tracing support
         CHROME_TRACE = _readenv("NUMBA_CHROME_TRACE", str, "")
 
+        # Write an aggregated compile-time profile to this file at exit
+        COMPILE_PROFILE = _readenv("NUMBA_COMPILE_PROFILE", str, "")
+
         # Enable debugging of type inference
         DEBUG_TYPEINFER = _readenv("NUMBA_DEBUG_TYPEINFER", int, 0)
 
@@ -405,6 +451,12 @@ class _EnvReloader(object):
         )
         THREADING_LAYER = _readenv("NUMBA_THREADING_LAYER", str, 'default')
 
+        # CPU affinity of the threads of the threading layer, "none" (threads
+        # are not pinned), "compact" (pinned to consecutive available CPUs) or
+        # a list of the CPUs to pin the threads to
+        THREAD_AFFINITY = _readenv("NUMBA_THREAD_AFFINITY",
+                                   _parse_thread_affinity, 'none')
+
         CAPTURED_ERRORS = _readenv("NUMBA_CAPTURED_ERRORS",
                                    _validate_captured_errors_style,
                                    'old_style')
@@ -519,6 +571,10 @@ class _EnvReloader(object):
         NUMBA_NUM_THREADS = _NUMBA_NUM_THREADS
         del _NUMBA_NUM_THREADS
 
+        # Number of worker threads used by Dispatcher.submit()
+        ASYNC_CALL_WORKERS = _readenv("NUMBA_ASYNC_CALL_WORKERS", int,
+                                      NUMBA_NUM_THREADS)
+
         # Profiling support
 
         # Indicates if a profiler detected. Only VTune can be detected for now
@@ -78,6 +78,7 @@ class CPUContext(BaseContext):
                                      generator_methods,) # noqa F401
         from numba.typed import typeddict, dictimpl # noqa F401
         from numba.typed import typedlist, listobject # noqa F401
+        from numba.typed import typedset, setobject # noqa F401
         from numba.experimental import jitclass, function_type # noqa F401
         from numba.np import npdatetime # noqa F401
 
@@ -69,7 +69,10 @@ class ParallelOptions(AbstractOptionValue):
     Options for controlling auto parallelization.
     """
     __slots__ = ("enabled", "comprehension", "reduction", "inplace_binop",
-                 "setitem", "numpy", "stencil", "fusion", "prange")
+                 "setitem", "numpy", "stencil", "fusion", "prange",
+                 "schedule")
+
+    _schedules = ("static", "dynamic", "guided")
 
     def __init__(self, value):
         if isinstance(value, bool):
@@ -82,6 +85,7 @@ class ParallelOptions(AbstractOptionValue):
             self.stencil = value
             self.fusion = value
             self.prange = value
+            self.schedule = "static"
         elif isinstance(value, dict):
             self.enabled = True
             self.comprehension = value.pop('comprehension', True)
@@ -92,9 +96,14 @@ class ParallelOptions(AbstractOptionValue):
             self.stencil = value.pop('stencil', True)
             self.fusion = value.pop('fusion', True)
             self.prange = value.pop('prange', True)
+            self.schedule = value.pop('schedule', 'static')
             if value:
                 msg = "Unrecognized parallel options: %s" % value.keys()
                 raise NameError(msg)
+            if self.schedule not in self._schedules:
+                msg = ("Unrecognized parallel schedule: %r, expected one "
+                       "of %s" % (self.schedule, ", ".join(self._schedules)))
+                raise ValueError(msg)
         elif isinstance(value, ParallelOptions):
             self.enabled = value.enabled
             self.comprehension = value.comprehension
@@ -105,6 +114,7 @@ class ParallelOptions(AbstractOptionValue):
             self.stencil = value.stencil
             self.fusion = value.fusion
             self.prange = value.prange
+            self.schedule = value.schedule
         else:
             msg = "Expect parallel option to be either a bool or a dict"
             raise ValueError(msg)
@@ -4,9 +4,11 @@
 import collections
 import functools
 import sys
+import threading
 import types as pytypes
 import uuid
 import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import ExitStack
 
 from numba import _dispatcher
@@ -212,6 +214,41 @@ _CompileStats = collections.namedtuple(
     '_CompileStats', ('cache_path', 'cache_hits', 'cache_misses'))
 
 
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+def _get_executor(name, max_workers):
+    """
+    Return the process-wide thread pool called *name*, creating it with
+    *max_workers* threads on first use.
+    """
+    with _executors_lock:
+        executor = _executors.get(name)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=max_workers,
+                                          thread_name_prefix=name)
+            _executors[name] = executor
+        return executor
+
+
+def _get_background_compile_executor():
+    """
+    Return the process-wide executor used for background compilation,
+    creating it on first use.  It has a single thread, as compilation holds
+    the global compiler lock.
+    """
+    return _get_executor("numba-compile", 1)
+
+
+def _get_async_call_executor():
+    """
+    Return the process-wide executor running the calls made by
+    Dispatcher.submit(), creating it on first use.
+    """
+    return _get_executor("numba-call", config.ASYNC_CALL_WORKERS)
+
+
 class CompilingCounter(object):
     """
     A simple counter that increment in __enter__ and decrement in __exit__.
@@ -841,6 +878,10 @@ class Dispatcher(serialize.ReduceMixin, _MemoMixin, _DispatcherBase):
                                         targetoptions, locals, pipeline_class)
         self._cache_hits = collections.Counter()
         self._cache_misses = collections.Counter()
+        # Signatures scheduled by precompile_async() and not yet compiled,
+        # mapped to their futures.
+        self._pending_compiles = {}
+        self._pending_compiles_lock = threading.Lock()
 
         self._type = types.Dispatcher(self)
         self.typingctx.insert_global(self, self._type)
@@ -917,6 +958,18 @@ class Dispatcher(serialize.ReduceMixin, _MemoMixin, _DispatcherBase):
         if disp is not self:
             return disp.compile(sig)
 
+        # If the signature is being compiled in the background, wait for that
+        # compilation rather than starting another one. This is skipped when
+        # the current thread holds the compiler lock (e.g. the signature is
+        # needed while typing another function), as the background worker
+        # cannot make progress until the lock is released.
+        if self._pending_compiles and not global_compiler_lock.is_locked():
+            args, return_type = sigutils.normalize_signature(sig)
+            with self._pending_compiles_lock:
+                future = self._pending_compiles.get(tuple(args))
+            if future is not None:
+                return future.result()
+
         with ExitStack() as scope:
             cres = None
 
@@ -943,7 +996,13 @@ class Dispatcher(serialize.ReduceMixin, _MemoMixin, _DispatcherBase):
                 if existing is not None:
                     return existing.entry_point
                 # Try to load from disk cache
-                cres = self._cache.load_overload(sig, self.targetctx)
+                ev_details = dict(
+                    dispatcher=self,
+                    args=args,
+                    return_type=return_type,
+                )
+                with ev.trigger_event("numba:cache_load", data=ev_details):
+                    cres = self._cache.load_overload(sig, self.targetctx)
                 if cres is not None:
                     self._cache_hits[sig] += 1
                     # XXX fold this in add_overload()? (also see compiler.py)
@@ -952,6 +1011,7 @@ class Dispatcher(serialize.ReduceMixin, _MemoMixin, _DispatcherBase):
                                                             cres.fndesc,
                                                             [cres.library])
                     self.add_overload(cres)
+                    self._cache.trace_signature(tuple(args))
                     return cres.entry_point
 
                 self._cache_misses[sig] += 1
@@ -970,8 +1030,127 @@ class Dispatcher(serialize.ReduceMixin, _MemoMixin, _DispatcherBase):
                         raise e.bind_fold_arguments(folded)
                     self.add_overload(cres)
                 self._cache.save_overload(sig, cres)
+                self._cache.trace_signature(tuple(args))
                 return cres.entry_point
 
+    def precompile_async(self, sigs, executor=None):
+        """
+        Schedule compilation of the given signatures in the background.
+
+        Returns a list of ``concurrent.futures.Future``, one per signature,
+        resolving to the compiled entry point. The futures of signatures that
+        are already compiled are resolved on return. Calls needing a
+        signature that is still being compiled wait on its future instead of
+        compiling it again. *executor* defaults to a process-wide background
+        thread.
+
+        Compilation itself still holds the global compiler lock, so this
+        overlaps compilation with other work done by the caller rather than
+        compiling several signatures at once.
+        """
+        if not self._can_compile:
+            raise RuntimeError("compilation disabled")
+        if executor is None:
+            executor = _get_background_compile_executor()
+        self._compilation_chain_init_hook()
+
+        futures = []
+        for sig in sigs:
+            args, return_type = sigutils.normalize_signature(sig)
+            key = tuple(args)
+            existing = self.overloads.get(key)
+            if existing is not None:
+                future = Future()
+                future.set_result(existing.entry_point)
+                futures.append(future)
+                continue
+            with self._pending_compiles_lock:
+                future = self._pending_compiles.get(key)
+                if future is None:
+                    future = executor.submit(self._background_compile, sig,
+                                             key)
+                    self._pending_compiles[key] = future
+            futures.append(future)
+        return futures
+
+    def _background_compile(self, sig, key):
+        try:
+            # Take the compiler lock before entering compile() so that it
+            # compiles the signature rather than waiting on its own future.
+            with global_compiler_lock:
+                return self.compile(sig)
+        finally:
+            with self._pending_compiles_lock:
+                self._pending_compiles.pop(key, None)
+
+    def submit(self, *args, **kws):
+        """
+        Call the function with the given arguments on a worker thread.
+
+        Returns a ``concurrent.futures.Future`` resolving to the result of the
+        call.  The overload is selected, and compiled if needed, in the
+        calling thread, so typing and compilation errors are raised here
+        rather than through the future.  The calls run on a process-wide pool
+        of ``NUMBA_ASYNC_CALL_WORKERS`` threads; they only run concurrently
+        with each other and with the caller if the function was compiled
+        with ``nogil=True``.
+        """
+        args = self._fold_argument_values(args, kws)
+        entry_point = self._resolve_entry_point(args)
+        return _get_async_call_executor().submit(entry_point, *args)
+
+    async def async_call(self, *args, **kws):
+        """
+        Awaitable version of submit(): call the function with the given
+        arguments on a worker thread and return its result.
+        """
+        import asyncio
+        return await asyncio.wrap_future(self.submit(*args, **kws))
+
+    def _fold_argument_values(self, args, kws):
+        """
+        Fold keyword arguments and resolve defaults the same way as the C
+        dispatcher, returning the tuple of arguments to pass to an entry
+        point.
+        """
+        def normal_handler(index, param, value):
+            return value
+
+        def default_handler(index, param, default):
+            return OmittedArg(default)
+
+        def stararg_handler(index, param, values):
+            return tuple(values)
+
+        return tuple(fold_arguments(self._compiler.pysig, args, kws,
+                                    normal_handler,
+                                    default_handler,
+                                    stararg_handler))
+
+    def _resolve_entry_point(self, args):
+        """
+        Return the entry point of the overload called for the given folded
+        arguments, compiling it if needed.
+        """
+        try:
+            argtypes = tuple(types.Omitted(a.value)
+                             if isinstance(a, OmittedArg)
+                             else self.typeof_pyval(a)
+                             for a in args)
+        finally:
+            self._types_active_call = []
+        cres = self.overloads.get(argtypes)
+        if cres is not None:
+            return cres.entry_point
+        if self._can_compile:
+            return self._compile_for_args(*args)
+        sig = self.typingctx.resolve_overload(self.py_func,
+                                              self.nopython_signatures,
+                                              argtypes, {})
+        if sig is None:
+            self._explain_matching_error(*args)
+        return self.overloads[tuple(sig.args)].entry_point
+
     def get_compile_result(self, sig):
         """Compile (if needed) and return the compilation result with the
         given signature.
@@ -3,23 +3,28 @@ import warnings
 
 from numba.core.config import PYVERSION
 
-if PYVERSION < (3, 9):
-    try:
-        import importlib_metadata
-    except ImportError as ex:
-        raise ImportError(
-            "importlib_metadata backport is required for Python version < 3.9, "
-            "try:\n"
-            "$ conda/pip install importlib_metadata"
-        ) from ex
-else:
-    from importlib import metadata as importlib_metadata
-
 
 _already_initialized = False
 logger = logging.getLogger(__name__)
 
 
+def _get_importlib_metadata():
+    # Imported on first use as importlib.metadata is slow to import and
+    # extensions are only initialized ahead of the first compilation.
+    if PYVERSION < (3, 9):
+        try:
+            import importlib_metadata
+        except ImportError as ex:
+            raise ImportError(
+                "importlib_metadata backport is required for Python version "
+                "< 3.9, try:\n"
+                "$ conda/pip install importlib_metadata"
+            ) from ex
+    else:
+        from importlib import metadata as importlib_metadata
+    return importlib_metadata
+
+
 def init_all():
     """Execute all `numba_extensions` entry points with the name `init`
 
@@ -45,7 +50,7 @@ def init_all():
             warnings.warn(msg, stacklevel=3)
             logger.debug('Extension loading failed for: %s', entry_point)
 
-    eps = importlib_metadata.entry_points()
+    eps = _get_importlib_metadata().entry_points()
     # Split, Python 3.10+ and importlib_metadata 3.6+ have the "selectable"
     # interface, versions prior to that do not. See "compatibility note" in:
     # https://docs.python.org/3.10/library/importlib.metadata.html#entry-points
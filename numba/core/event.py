@@ -12,6 +12,10 @@ The following events are built in:
   - ``"args"``: the argument types.
   - ``"return_type"``: the return type.
 
+- ``"numba:cache_load"`` is broadcast when a dispatcher is looking up a
+  signature in its on-disk cache, before compiling it on a cache miss.
+  Events of this kind have the same ``data`` as ``"numba:compile"``.
+
 - ``"numba:compiler_lock"`` is broadcast when the internal compiler-lock is
   acquired. This is mostly used internally to measure time spent with the lock
   acquired.
@@ -21,7 +25,9 @@ The following events are built in:
 
 - ``"numba:run_pass"`` is broadcast when a compiler pass is running.
 
-    - ``"name"``: pass name.
+    - ``"name"``: pass name, followed by the qualified name of the function
+      being compiled in square brackets.
+    - ``"pass_name"``: pass name.
     - ``"qualname"``: qualified name of the function being compiled.
     - ``"module"``: module name of the function being compiled.
     - ``"flags"``: compilation flags.
@@ -56,6 +62,7 @@ class EventStatus(enum.Enum):
 
 # Builtin event kinds.
 _builtin_kinds = frozenset([
+    "numba:cache_load",
     "numba:compiler_lock",
     "numba:compile",
     "numba:llvm_lock",
@@ -491,3 +498,8 @@ def _setup_chrome_trace_exit_handler():
 
 if config.CHROME_TRACE:
     _setup_chrome_trace_exit_handler()
+
+if config.COMPILE_PROFILE:
+    # Imported here as the profiler is built on this module
+    from numba.core import profiling
+    profiling._setup_compile_profile_exit_handler()
@@ -118,7 +118,7 @@ class FunctionDescriptor(object):
     def llvm_cpython_wrapper_name(self):
         """
         The LLVM-registered name for a CPython-compatible wrapper of the
-        raw function (i.e. a PyCFunctionWithKeywords).
+        raw function (i.e. a METH_FASTCALL | METH_KEYWORDS function).
         """
         return itanium_mangler.prepend_namespace(self.mangled_name,
                                                  ns='cpython')
@@ -0,0 +1,284 @@
+"""
+The ``numba.core.profiling`` module aggregates where compilation time is
+spent, per function, from the events broadcast by the compiler (see
+``numba.core.event``):
+
+- the time spent in each compiler pass, excluding the time spent compiling
+  other functions from within the pass (e.g. callees during type inference),
+- the time spent looking up the on-disk cache and the cache hits and misses
+  of the dispatchers,
+- the time spent in each LLVM optimization stage, when
+  :envvar:`NUMBA_LLVM_PASS_TIMINGS` is enabled.
+
+The profile can be exported as a JSON report and as folded stacks, the input
+format of flame graph tools such as ``flamegraph.pl`` or speedscope.
+
+Examples
+--------
+
+>>> from numba.core import profiling
+>>> with profiling.profile() as prof:
+...     foo(1)
+>>> print(prof.summary())
+>>> prof.write_json("profile.json")
+>>> prof.write_folded("profile.folded")
+
+Setting :envvar:`NUMBA_COMPILE_PROFILE` to a file name profiles the whole
+process and writes the JSON report to that file and the folded stacks to the
+same file name with a ``.folded`` suffix at exit.
+"""
+
+import atexit
+import json
+import threading
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager
+from timeit import default_timer as timer
+
+from numba.core import config
+import numba.core.event as ev
+
+
+# The event kinds the profiler listens to
+_profiled_kinds = ("numba:compile", "numba:cache_load", "numba:run_pass")
+
+
+class _Frame:
+    """An event being timed on the stack of a thread.
+    """
+    __slots__ = ("label", "start", "children")
+
+    def __init__(self, label):
+        self.label = label
+        self.start = timer()
+        # Time spent in the nested events
+        self.children = 0.0
+
+
+class _FunctionProfile:
+    """The aggregated profile of a function.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.signatures = []
+        self.compile_time = 0.0
+        self.cache_load_time = 0.0
+        self.passes = defaultdict(float)
+        self.llvm = defaultdict(float)
+        self.dispatcher = None
+
+    def as_dict(self):
+        res = dict(
+            name=self.name,
+            signatures=self.signatures,
+            compile_time=self.compile_time,
+            cache_load_time=self.cache_load_time,
+            passes=dict(sorted(self.passes.items(), key=lambda x: -x[1])),
+            llvm=dict(sorted(self.llvm.items(), key=lambda x: -x[1])),
+            cache_hits=None,
+            cache_misses=None,
+        )
+        stats = getattr(self.dispatcher, "stats", None)
+        if stats is not None and stats.cache_path is not None:
+            res["cache_hits"] = sum(stats.cache_hits.values())
+            res["cache_misses"] = sum(stats.cache_misses.values())
+        return res
+
+
+def _function_name(module, qualname):
+    return f"{module}.{qualname}"
+
+
+def _dispatcher_name(dispatcher):
+    py_func = dispatcher.py_func
+    return _function_name(py_func.__module__, py_func.__qualname__)
+
+
+class CompileProfiler(ev.Listener):
+    """A listener aggregating the compilation time per function and per
+    compiler pass.  It must be registered for the ``"numba:compile"``,
+    ``"numba:cache_load"`` and ``"numba:run_pass"`` events, see `profile()`.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._functions = {}
+        # Self time in seconds of each stack of frame labels
+        self._stacks = defaultdict(float)
+
+    def _get_stack(self):
+        try:
+            return self._local.stack
+        except AttributeError:
+            stack = self._local.stack = []
+            return stack
+
+    def _get_function(self, name):
+        try:
+            return self._functions[name]
+        except KeyError:
+            fn = self._functions[name] = _FunctionProfile(name)
+            return fn
+
+    def _label(self, event):
+        data = event.data
+        if event.kind == "numba:run_pass":
+            return data["pass_name"]
+        name = _dispatcher_name(data["dispatcher"])
+        label = f"{name}({', '.join(map(str, data['args']))})"
+        if event.kind == "numba:cache_load":
+            label += " [cache load]"
+        return label
+
+    def on_start(self, event):
+        self._get_stack().append(_Frame(self._label(event)))
+
+    def on_end(self, event):
+        stack = self._get_stack()
+        if not stack:
+            # The event started before the profiler was installed
+            return
+        frame = stack.pop()
+        elapsed = timer() - frame.start
+        if stack:
+            stack[-1].children += elapsed
+        own_time = elapsed - frame.children
+        labels = tuple(f.label.replace(";", ",") for f in stack)
+        labels += (frame.label.replace(";", ","),)
+        data = event.data
+        with self._lock:
+            self._stacks[labels] += own_time
+            if event.kind == "numba:run_pass":
+                name = _function_name(data["module"], data["qualname"])
+                fn = self._get_function(name)
+                fn.passes[data["pass_name"]] += own_time
+                return
+            disp = data["dispatcher"]
+            fn = self._get_function(_dispatcher_name(disp))
+            fn.dispatcher = disp
+            if event.kind == "numba:cache_load":
+                fn.cache_load_time += elapsed
+                return
+            fn.compile_time += elapsed
+            cres = disp.overloads.get(tuple(data["args"]))
+            if cres is None:
+                # Compilation failed
+                return
+            fn.signatures.append(str(cres.signature))
+            timings = cres.metadata.get("llvm_pass_timings")
+            for rec in timings or ():
+                fn.llvm[rec.name] += rec.timings.get_total_time()
+
+    def report(self):
+        """Returns the profile as a ``dict``, with the total compilation time
+        in seconds under ``"total_time"`` and a list of the per function
+        profiles, slowest first, under ``"functions"``.  Each function profile
+        is a ``dict`` with the keys:
+
+        - ``"name"``: the qualified name of the function.
+        - ``"signatures"``: the signatures compiled.
+        - ``"compile_time"``: the time spent compiling, including callees.
+        - ``"cache_load_time"``: the time spent looking up the cache.
+        - ``"passes"``: the time spent in each compiler pass, excluding the
+          compilation of other functions.
+        - ``"llvm"``: the time spent in each LLVM optimization stage, only
+          recorded when :envvar:`NUMBA_LLVM_PASS_TIMINGS` is enabled.
+        - ``"cache_hits"``, ``"cache_misses"``: the cache statistics of the
+          dispatcher, ``None`` if it is not cached.
+        """
+        with self._lock:
+            functions = [fn.as_dict() for fn in self._functions.values()]
+            total = sum(self._stacks.values())
+        functions.sort(key=lambda fn: -_function_time(fn))
+        return dict(total_time=total, functions=functions)
+
+    def folded_stacks(self):
+        """Returns the profile as a list of lines in the folded stacks format:
+        the labels of the nested compilations and passes separated by
+        semicolons, then the self time in microseconds.
+        """
+        with self._lock:
+            items = sorted(self._stacks.items())
+        lines = []
+        for labels, seconds in items:
+            usecs = round(seconds * 1e6)
+            if usecs > 0:
+                lines.append(f"{';'.join(labels)} {usecs}")
+        return lines
+
+    def summary(self, topn=10):
+        """Returns a text summary of the *topn* slowest functions to compile.
+        """
+        return format_report(self.report(), topn=topn)
+
+    def write_json(self, filename):
+        """Writes `report()` as JSON to *filename*.
+        """
+        with open(filename, "w") as f:
+            json.dump(self.report(), f, indent=2)
+
+    def write_folded(self, filename):
+        """Writes `folded_stacks()` to *filename*.
+        """
+        with open(filename, "w") as f:
+            for line in self.folded_stacks():
+                f.write(line + "\n")
+
+
+def _function_time(fn):
+    # Functions compiled without a dispatcher (e.g. with compile_internal())
+    # only have pass timings.
+    compile_time = max(fn["compile_time"], sum(fn["passes"].values()))
+    return fn["cache_load_time"] + compile_time
+
+
+def format_report(report, topn=10):
+    """Returns a text summary of the *topn* slowest functions to compile in
+    *report*, as returned by `CompileProfiler.report()`.
+    """
+    buf = [f"Total compilation time: {report['total_time']:.3f}s"]
+    for fn in report["functions"][:topn]:
+        nsigs = len(fn["signatures"])
+        line = (f"{fn['name']}: {_function_time(fn):.3f}s across "
+                f"{nsigs} signature(s)")
+        if fn["cache_hits"] is not None:
+            line += (f", {fn['cache_hits']} cache hit(s), "
+                     f"{fn['cache_misses']} cache miss(es)")
+        buf.append(line)
+        for kind in ("passes", "llvm"):
+            for name, seconds in list(fn[kind].items())[:5]:
+                buf.append(f"    {name}: {seconds:.3f}s")
+    return "\n".join(buf)
+
+
+@contextmanager
+def profile():
+    """A context manager profiling the compilations within its duration.
+
+    Returns
+    -------
+    res : CompileProfiler
+    """
+    profiler = CompileProfiler()
+    with ExitStack() as scope:
+        for kind in _profiled_kinds:
+            scope.enter_context(ev.install_listener(kind, profiler))
+        yield profiler
+
+
+def _setup_compile_profile_exit_handler():
+    """Setup a CompileProfiler for the whole process and an exit handler to
+    write its report to NUMBA_COMPILE_PROFILE.
+    """
+    profiler = CompileProfiler()
+    for kind in _profiled_kinds:
+        ev.register(kind, profiler)
+    filename = config.COMPILE_PROFILE
+
+    @atexit.register
+    def _write_compile_profile():
+        # The following output files are not multi-process safe.
+        profiler.write_json(filename)
+        profiler.write_folded(filename + ".folded")
@@ -779,6 +779,45 @@ class DictType(IterableType, InitialValue):
         return f"DictType({self.key_type}, {self.value_type})"
 
 
+class SetType(IterableType):
+    """Typed set type
+    """
+
+    mutable = True
+
+    def __init__(self, itemty):
+        assert not isinstance(itemty, TypeRef)
+        itemty = unliteral(itemty)
+        if isinstance(itemty, (Optional, NoneType)):
+            fmt = "Set.item_type cannot be of type {}"
+            raise TypingError(fmt.format(itemty))
+        self.item_type = itemty
+        self.dtype = itemty
+        name = "{}[{}]".format(self.__class__.__name__, itemty)
+        super(SetType, self).__init__(name)
+
+    @property
+    def key(self):
+        return self.item_type
+
+    def is_precise(self):
+        return not isinstance(self.item_type, Undefined)
+
+    @property
+    def dict_type(self):
+        """The type of the dictionary whose keys hold the items.
+        """
+        from numba.core.types import boolean
+        return DictType(self.item_type, boolean)
+
+    @property
+    def iterator_type(self):
+        return self.dict_type.iterator_type
+
+    def __repr__(self):
+        return f"SetType({self.item_type})"
+
+
 class LiteralStrKeyDict(Literal, ConstSized, Hashable):
     """A Dictionary of string keys to heterogeneous values (basically a
     namedtuple with dict semantics).
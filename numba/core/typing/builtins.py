@@ -3,7 +3,7 @@ import itertools
 import numpy as np
 import operator
 
-from numba.core import types, errors
+from numba.core import types, errors, utils
 from numba import prange
 from numba.parfors.parfor import internal_prange
 
@@ -69,7 +69,6 @@ class Slice(ConcreteTemplate):
 
 
 @infer_global(range, typing_key=range)
-@infer_global(prange, typing_key=prange)
 @infer_global(internal_prange, typing_key=internal_prange)
 class Range(ConcreteTemplate):
     cases = [
@@ -88,6 +87,41 @@ class Range(ConcreteTemplate):
     ]
 
 
+@infer_global(prange, typing_key=prange)
+class PRange(AbstractTemplate):
+    """
+    Typing of prange(), which accepts the range() arguments and an optional
+    literal `schedule` keyword.
+    """
+    schedules = ("static", "dynamic", "guided")
+    prefer_literal = True
+
+    def generic(self, args, kws):
+        kwargs = dict(kws)
+        schedule = kwargs.pop('schedule', None)
+        if kwargs:
+            msg = "Unsupported keywords: {!r}"
+            raise errors.TypingError(msg.format([k for k in kwargs.keys()]))
+        sig = self._select(Range.cases, args, {})
+        if sig is None or schedule is None:
+            return sig
+        if (not isinstance(schedule, types.StringLiteral) or
+                schedule.literal_value not in self.schedules):
+            msg = "prange() schedule must be a string literal, one of {}"
+            raise errors.TypingError(msg.format(", ".join(self.schedules)))
+
+        def prange_stub(start, stop, step, schedule=None):
+            pass
+        params = list(utils.pysignature(prange_stub).parameters.values())
+        if len(args) == 1:
+            params = params[1:2] + params[3:]
+        else:
+            params = params[:len(args)] + params[3:]
+        pysig = utils.pySignature(parameters=params)
+        return signature(sig.return_type, *sig.args,
+                         schedule).replace(pysig=pysig)
+
+
 @infer
 class GetIter(AbstractTemplate):
     key = "getiter"
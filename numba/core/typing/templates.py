@@ -12,7 +12,7 @@ from collections.abc import Sequence
 from types import MethodType, FunctionType, MappingProxyType
 
 import numba
-from numba.core import types, utils, targetconfig
+from numba.core import config, types, utils, targetconfig
 from numba.core.errors import (
     TypingError,
     InternalError,
@@ -812,6 +812,8 @@ class _OverloadFunctionTemplate(AbstractTemplate):
         # Make dispatcher
         jitdecor = jitter(**self._jit_options)
         disp = jitdecor(pyfunc)
+        if config.CACHE_OVERLOADS and not self._jit_options.get('cache'):
+            _enable_overload_caching(disp)
         # Make sure that the implementation can be fully compiled
         disp_type = types.Dispatcher(disp)
         disp_type.get_call_type(self.context, args, kws)
@@ -877,6 +879,28 @@ class _OverloadFunctionTemplate(AbstractTemplate):
         return info
 
 
+def _enable_overload_caching(disp):
+    """
+    Enable the on-disk caching of *disp*, the dispatcher of an `@overload`
+    implementation, if possible.  Implementations that cannot be cached are
+    compiled in every process as usual.
+    """
+    from numba.core.caching import OverloadCache
+    from numba.core.registry import CPUDispatcher
+
+    # Only the CPU target is supported
+    if not isinstance(disp, CPUDispatcher):
+        return
+    flags = targetconfig.ConfigStack.top_or_none()
+    options = "%s, %s" % (sorted(disp.targetoptions.items()),
+                          flags.summary() if flags is not None else None)
+    try:
+        disp._cache = OverloadCache(disp.py_func, options)
+    except RuntimeError:
+        # No usable cache locator, e.g. not defined in a file
+        pass
+
+
 def make_overload_template(func, overload_func, jit_options, strict,
                            inline, prefer_literal=False, **kwargs):
     """
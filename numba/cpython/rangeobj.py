@@ -27,12 +27,14 @@ def make_range_impl(int_type, range_state_type, range_iter_type):
 
     @lower_builtin(range, int_type)
     @lower_builtin(prange, int_type)
+    @lower_builtin(prange, int_type, types.StringLiteral)
     @lower_builtin(internal_prange, int_type)
     def range1_impl(context, builder, sig, args):
         """
         range(stop: int) -> range object
         """
-        [stop] = args
+        # prange() may carry a trailing schedule literal, which is ignored
+        [stop] = args[:1]
         state = RangeState(context, builder)
         state.start = context.get_constant(int_type, 0)
         state.stop = stop
@@ -44,12 +46,13 @@ def make_range_impl(int_type, range_state_type, range_iter_type):
 
     @lower_builtin(range, int_type, int_type)
     @lower_builtin(prange, int_type, int_type)
+    @lower_builtin(prange, int_type, int_type, types.StringLiteral)
     @lower_builtin(internal_prange, int_type, int_type)
     def range2_impl(context, builder, sig, args):
         """
         range(start: int, stop: int) -> range object
         """
-        start, stop = args
+        start, stop = args[:2]
         state = RangeState(context, builder)
         state.start = start
         state.stop = stop
@@ -61,12 +64,13 @@ def make_range_impl(int_type, range_state_type, range_iter_type):
 
     @lower_builtin(range, int_type, int_type, int_type)
     @lower_builtin(prange, int_type, int_type, int_type)
+    @lower_builtin(prange, int_type, int_type, int_type, types.StringLiteral)
     @lower_builtin(internal_prange, int_type, int_type, int_type)
     def range3_impl(context, builder, sig, args):
         """
         range(start: int, stop: int, step: int) -> range object
         """
-        [start, stop, step] = args
+        [start, stop, step] = args[:3]
         state = RangeState(context, builder)
         state.start = start
         state.stop = stop
@@ -168,6 +168,10 @@ def register_class_type(cls, spec, class_ctor, builder):
     class_ctor: the numba type to represent the jitclass
     builder: the internal jitclass builder
     """
+    # The overloads for the special methods of jitclass instances are only
+    # needed once a jitclass exists, install them on first use.
+    from numba.experimental.jitclass import overloads  # noqa: F401
+
     # Normalize spec
     if spec is None:
         spec = OrderedDict()
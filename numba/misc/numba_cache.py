@@ -0,0 +1,133 @@
+"""
+Command line helpers operating on the on-disk compilation cache.
+"""
+import importlib
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+
+def _resolve_dispatcher(module, qualname):
+    """
+    Import *module* and return the cached dispatcher found at *qualname*.
+    Raises ValueError if it cannot be found or does not use the cache.
+    """
+    from numba.core.caching import NullCache
+    from numba.core.dispatcher import Dispatcher
+
+    if module == '__main__' or '<locals>' in qualname:
+        raise ValueError("function is not importable")
+    obj = importlib.import_module(module)
+    for attr in qualname.split('.'):
+        obj = getattr(obj, attr)
+    if not isinstance(obj, Dispatcher):
+        raise ValueError("not a jitted function")
+    if isinstance(obj._cache, NullCache):
+        raise ValueError("caching is not enabled for this function")
+    return obj
+
+
+def _warm_function(module, qualname, signatures):
+    """
+    Compile the given signatures of a cached function, populating its cache.
+    Returns a list of (signature, error message or None).
+    """
+    try:
+        disp = _resolve_dispatcher(module, qualname)
+    except Exception as e:
+        msg = "%s: %s" % (type(e).__name__, e)
+        return [(str(sig), msg) for sig in signatures]
+    results = []
+    for sig in signatures:
+        try:
+            disp.compile(sig)
+        except Exception as e:
+            results.append((str(sig), "%s: %s" % (type(e).__name__, e)))
+        else:
+            results.append((str(sig), None))
+    return results
+
+
+def warm_cache(trace_file, jobs=None):
+    """
+    Populate the cache of every function recorded in the signature trace
+    file *trace_file* (see NUMBA_CACHE_TRACE).  Functions are compiled in
+    parallel over *jobs* processes (by default, one per CPU); all signatures
+    of a given function are compiled by the same process so that its cache
+    index is only written from one place.
+
+    Returns a dict mapping "module.qualname" to a list of
+    (signature, error message or None).
+    """
+    from numba.core.caching import load_cache_trace
+
+    trace = load_cache_trace(trace_file)
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    # Don't record the signatures compiled here back into a trace file
+    env_trace = os.environ.pop('NUMBA_CACHE_TRACE', None)
+    try:
+        ctx = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=max(1, jobs),
+                                 mp_context=ctx) as pool:
+            futures = {}
+            for (module, qualname), sigs in trace.items():
+                fut = pool.submit(_warm_function, module, qualname, sigs)
+                futures['%s.%s' % (module, qualname)] = fut
+            return {name: fut.result() for name, fut in futures.items()}
+    finally:
+        if env_trace is not None:
+            os.environ['NUMBA_CACHE_TRACE'] = env_trace
+
+
+def display_warm_cache(trace_file, jobs=None):
+    """
+    Run `warm_cache` and print a report.  Returns True if every signature
+    was compiled successfully.
+    """
+    results = warm_cache(trace_file, jobs=jobs)
+    ok = True
+    ncompiled = 0
+    for name, sigs in results.items():
+        for sig, error in sigs:
+            if error is None:
+                ncompiled += 1
+                print("%s%s: ok" % (name, sig))
+            else:
+                ok = False
+                print("%s%s: failed, %s" % (name, sig, error))
+    print("Warmed %d signature(s) of %d function(s)"
+          % (ncompiled, len(results)))
+    return ok
+
+
+def default_cache_dir():
+    """
+    Return the cache directory shared by all functions: NUMBA_CACHE_DIR if
+    set, otherwise the user-wide cache directory.  In-tree caches in
+    ``__pycache__`` directories must be given explicitly.
+    """
+    from numba.core import config
+    from numba.misc.appdirs import AppDirs
+
+    if config.CACHE_DIR:
+        return config.CACHE_DIR
+    return AppDirs(appname="numba", appauthor=False).user_cache_dir
+
+
+def display_cache_gc(cache_dir=None):
+    """
+    Garbage collect *cache_dir* (see `numba.core.caching.gc_cache_dir`),
+    enforcing NUMBA_CACHE_MAX_SIZE, and print a report.
+    """
+    from numba.core import config
+    from numba.core.caching import gc_cache_dir
+
+    if cache_dir is None:
+        cache_dir = default_cache_dir()
+    removed = gc_cache_dir(cache_dir, max_size=config.CACHE_MAX_SIZE)
+    for path, size in removed:
+        print("removed %s (%d bytes)" % (path, size))
+    freed = sum(size for _, size in removed)
+    print("Freed %d bytes in %s" % (freed, cache_dir))
+    return removed
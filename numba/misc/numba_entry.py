@@ -26,6 +26,20 @@ def make_parser():
                         help='Output system information about gdb')
     parser.add_argument('--sys-json', nargs=1,
                         help='Saves the system info dict as a json file')
+    parser.add_argument('--warm-cache', nargs=1, metavar='TRACE_FILE',
+                        help='Populate the cache of the functions recorded '
+                             'in a NUMBA_CACHE_TRACE signature trace file')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='Number of processes used by --warm-cache')
+    parser.add_argument('--cache-gc', nargs='?', const='', metavar='CACHE_DIR',
+                        help='Remove stale entries from the cache directory '
+                             '(default: NUMBA_CACHE_DIR or the user-wide '
+                             'cache directory) and enforce '
+                             'NUMBA_CACHE_MAX_SIZE')
+    parser.add_argument('--profile-compile', nargs=1, metavar='OUTPUT',
+                        help='Write a JSON report of where compilation time '
+                             'is spent to OUTPUT, and flame graph folded '
+                             'stacks to OUTPUT.folded')
     parser.add_argument('filename', nargs='?', help='Python source filename')
     return parser
 
@@ -53,6 +67,16 @@ def main():
             json.dump(info, f, indent=4)
         sys.exit(0)
 
+    if args.cache_gc is not None:
+        from .numba_cache import display_cache_gc
+        display_cache_gc(args.cache_gc or None)
+        sys.exit(0)
+
+    if args.warm_cache:
+        from .numba_cache import display_warm_cache
+        ok = display_warm_cache(args.warm_cache[0], jobs=args.jobs)
+        sys.exit(0 if ok else 1)
+
     os.environ['NUMBA_DUMP_ANNOTATION'] = str(int(args.annotate))
     if args.annotate_html is not None:
         try:
@@ -63,10 +87,22 @@ def main():
     os.environ['NUMBA_DUMP_LLVM'] = str(int(args.dump_llvm))
     os.environ['NUMBA_DUMP_OPTIMIZED'] = str(int(args.dump_optimized))
     os.environ['NUMBA_DUMP_ASSEMBLY'] = str(int(args.dump_assembly))
+    if args.profile_compile is not None:
+        os.environ['NUMBA_COMPILE_PROFILE'] = args.profile_compile[0]
 
     if args.filename:
         cmd = [sys.executable, args.filename]
-        subprocess.call(cmd)
+        returncode = subprocess.call(cmd)
+        if args.profile_compile is not None:
+            from numba.core.profiling import format_report
+            path = args.profile_compile[0]
+            if os.path.exists(path):
+                with open(path) as f:
+                    print(format_report(json.load(f)))
+            else:
+                print("numba: no compilation profile was written to %s"
+                      % path, file=sys.stderr)
+            sys.exit(returncode)
     else:
         print("numba: error: the following arguments are required: filename")
         sys.exit(1)
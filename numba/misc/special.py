@@ -14,8 +14,13 @@ def pndindex(*args):
 class prange(object):
     """ Provides a 1D parallel iterator that generates a sequence of integers.
     In non-parallel contexts, prange is identical to range.
+
+    The optional *schedule* keyword selects how the iterations are divided
+    among the threads: "static" (the default) splits them into equal blocks
+    up front, "dynamic" hands out small chunks to idle threads, and "guided"
+    hands out chunks that shrink as the loop nears completion.
     """
-    def __new__(cls, *args):
+    def __new__(cls, *args, schedule=None):
         return range(*args)
 
 
@@ -91,6 +96,45 @@ def literal_unroll(container):
     return container
 
 
+def parallel_scan(op, arr):
+    """Computes the inclusive scan of the 1D array *arr* with the binary
+    function *op*, i.e. element ``i`` of the result is
+    ``op(...op(op(arr[0], arr[1]), arr[2])..., arr[i])``. The result has the
+    dtype of *arr*.
+
+    *op* must be associative, and a jitted function in compiled code. In
+    functions compiled with ``parallel=True`` the scan is split between the
+    threads, so *op* is applied in a different order.
+    """
+    arr = np.asarray(arr)
+    if arr.ndim != 1:
+        raise ValueError("parallel_scan() requires a 1D array")
+    out = np.empty_like(arr)
+    if len(arr):
+        c = arr[0]
+        out[0] = c
+        for i in range(1, len(arr)):
+            c = op(c, arr[i])
+            out[i] = c
+    return out
+
+
+def thread_local(shape, dtype):
+    """Returns a per-thread scratch array of the given *shape* and *dtype*.
+
+    Outside of a parallel loop, this is equivalent to
+    ``np.empty(shape, dtype)``. Inside the body of a ``prange`` loop in a
+    function compiled with ``parallel=True``, the allocation is hoisted out
+    of the loop: one array is allocated per worker thread before the loop
+    runs, and every iteration executed by a thread gets that thread's array.
+    The contents of the array are therefore undefined at the start of an
+    iteration, and the array must not be kept beyond the iteration. With the
+    ``tbb`` threading layer, iterations that start a nested parallel region
+    may share their array with other iterations of the same thread.
+    """
+    return np.empty(shape, dtype)
+
+
 __all__ = [
     'typeof',
     'as_numba_type',
@@ -101,4 +145,6 @@ __all__ = [
     'gdb_init',
     'literally',
     'literal_unroll',
+    'parallel_scan',
+    'thread_local',
 ]
@@ -27,6 +27,7 @@ from numba.core.errors import (RequireLiteralValue, TypingError,
                                NumbaValueError, NumbaNotImplementedError,
                                NumbaTypeError, NumbaDeprecationWarning)
 from numba.cpython.unsafe.tuple import tuple_setitem
+from numba.misc.special import parallel_scan
 
 
 def _check_blas():
@@ -422,6 +423,24 @@ def array_cumprod(a):
         return array_cumprod_impl
 
 
+@overload(parallel_scan)
+def np_parallel_scan(op, arr):
+    if not (isinstance(arr, types.Array) and arr.ndim == 1):
+        raise TypingError('Argument "arr" must be a 1D array')
+
+    def parallel_scan_impl(op, arr):
+        out = np.empty(len(arr), arr.dtype)
+        if len(arr):
+            c = arr[0]
+            out[0] = c
+            for i in range(1, len(arr)):
+                c = op(c, arr[i])
+                out[i] = c
+        return out
+
+    return parallel_scan_impl
+
+
 @overload(np.mean)
 @overload_method(types.Array, "mean")
 def array_mean(a):
@@ -3909,6 +3928,70 @@ def np_digitize(x, bins, right=False):
 _range = range
 
 
+@register_jitable
+def _histogram_linear_bin(v, bin_min, bin_max, bins, bin_ratio):
+    """Return the index of the bin holding v out of `bins` equal width bins
+    spanning [bin_min, bin_max], or -1 if v is out of range or NaN.
+    """
+    b = math.floor((v - bin_min) * bin_ratio)
+    if 0 <= b < bins:
+        return int(b)
+    elif v == bin_max:
+        return bins - 1
+    return -1
+
+
+@register_jitable
+def _histogram_uniform_bins(bins):
+    """Whether the monotonic bin edges are close enough to evenly spaced
+    for _histogram_bin_index to find a value's bin arithmetically.
+    """
+    nbins = len(bins) - 1
+    # Computed in floating point, as the difference of integer edges may
+    # overflow
+    bin_min = np.float64(bins[0])
+    width = (np.float64(bins[nbins]) - bin_min) / nbins
+    if not width > 0:
+        return False
+    for i in _range(1, nbins):
+        error = abs(np.float64(bins[i]) - (bin_min + i * width))
+        if not error <= 0.25 * width:
+            return False
+    return True
+
+
+@register_jitable
+def _histogram_bin_index(v, bins, bin_ratio):
+    """Return the index of the bin holding v, which must lie within the
+    monotonic bin edges. If bin_ratio is non-zero the bins are uniform and
+    the index is computed arithmetically then corrected for rounding,
+    otherwise it is found by bisection.
+    """
+    nbins = len(bins) - 1
+    if bin_ratio != 0:
+        # Computed in floating point, as the difference of integer values
+        # may overflow
+        b = min(int((np.float64(v) - np.float64(bins[0])) * bin_ratio),
+                nbins - 1)
+        if v < bins[b]:
+            b -= 1
+        elif b < nbins - 1 and v >= bins[b + 1]:
+            b += 1
+        return b
+    # Bisect in bins[:-1]
+    lo = 0
+    hi = nbins - 1
+    while lo < hi:
+        # Note the `+ 1` is necessary to avoid an infinite
+        # loop where mid = lo => lo = mid
+        mid = (lo + hi + 1) >> 1
+        if v < bins[mid]:
+            hi = mid - 1
+        else:
+            lo = mid
+    return lo
+
+
 @overload(np.histogram)
 def np_histogram(a, bins=10, range=None):
     if isinstance(bins, (int, types.Integer)):
@@ -3943,12 +4026,10 @@ def np_histogram(a, bins=10, range=None):
                 if bin_max > bin_min:
                     bin_ratio = bins / (bin_max - bin_min)
                     for view in np.nditer(a):
-                        v = view.item()
-                        b = math.floor((v - bin_min) * bin_ratio)
-                        if 0 <= b < bins:
-                            hist[int(b)] += 1
-                        elif v == bin_max:
-                            hist[bins - 1] += 1
+                        b = _histogram_linear_bin(view.item(), bin_min,
+                                                  bin_max, bins, bin_ratio)
+                        if b >= 0:
+                            hist[b] += 1
 
                 bins_array = np.linspace(bin_min, bin_max, bins + 1)
                 return hist, bins_array
@@ -3969,23 +4050,19 @@ def np_histogram(a, bins=10, range=None):
             hist = np.zeros(nbins, np.intp)
 
             if nbins > 0:
+                # Evenly spaced bins (e.g. from np.linspace) are looked up
+                # arithmetically rather than by bisection.
+                if _histogram_uniform_bins(bins):
+                    bin_ratio = nbins / (np.float64(bin_max) -
+                                         np.float64(bin_min))
+                else:
+                    bin_ratio = 0.0
                 for view in np.nditer(a):
                     v = view.item()
                     if not bin_min <= v <= bin_max:
                         # Value is out of bounds, ignore (also catches NaNs)
                         continue
-                    # Bisect in bins[:-1]
-                    lo = 0
-                    hi = nbins - 1
-                    while lo < hi:
-                        # Note the `+ 1` is necessary to avoid an infinite
-                        # loop where mid = lo => lo = mid
-                        mid = (lo + hi + 1) >> 1
-                        if v < bins[mid]:
-                            hi = mid - 1
-                        else:
-                            lo = mid
-                    hist[lo] += 1
+                    hist[_histogram_bin_index(v, bins, bin_ratio)] += 1
 
             return hist, bins
 
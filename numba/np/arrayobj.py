@@ -30,6 +30,7 @@ from numba.core.types import StringLiteral
 from numba.core.extending import (register_jitable, overload, overload_method,
                                   intrinsic, overload_attribute)
 from numba.misc import quicksort, mergesort
+from numba.misc.special import thread_local
 from numba.cpython import slicing
 from numba.cpython.unsafe.tuple import tuple_setitem, build_full_slice_tuple
 from numba.core.extending import overload_classmethod
@@ -4374,6 +4375,22 @@ def ol_np_empty(shape, dtype=float):
         raise errors.TypingError(msg)
 
 
+@overload(thread_local)
+def ol_thread_local(shape, dtype):
+    nb_dtype = ty_parse_dtype(dtype)
+    ndim = ty_parse_shape(shape)
+    if nb_dtype is None or not ndim:
+        msg = ("Cannot parse input types to function "
+               f"thread_local({shape}, {dtype}), the shape must have at "
+               "least one dimension")
+        raise errors.TypingError(msg)
+    retty = types.Array(dtype=nb_dtype, ndim=ndim, layout='C')
+
+    def impl(shape, dtype):
+        return numpy_empty_nd(shape, dtype, retty)
+    return impl
+
+
 @intrinsic
 def numpy_empty_like_nd(tyctx, ty_prototype, ty_dtype, ty_retty_ref):
     ty_retty = ty_retty_ref.instance_type
@@ -23,8 +23,12 @@ class _BaseVectorize(object):
         return kwargs.pop('writable_args', ())
 
     @classmethod
-    def get_target_implementation(cls, kwargs):
+    def get_target_implementation(cls, kwargs, is_dynamic=False):
         target = kwargs.pop('target', 'cpu')
+        # Targets compiling signatures at call time have a dedicated
+        # implementation for functions decorated without signatures.
+        if is_dynamic and target in cls.dynamic_target_registry:
+            return cls.dynamic_target_registry[target]
         try:
             return cls.target_registry[target]
         except KeyError:
@@ -34,24 +38,30 @@ class _BaseVectorize(object):
 class Vectorize(_BaseVectorize):
     target_registry = DelayedRegistry({'cpu': dufunc.DUFunc,
                                        'parallel': ParallelUFuncBuilder,})
+    dynamic_target_registry = DelayedRegistry({
+        'parallel': dufunc.ParallelDUFunc,})
 
     def __new__(cls, func, **kws):
         identity = cls.get_identity(kws)
         cache = cls.get_cache(kws)
-        imp = cls.get_target_implementation(kws)
+        is_dyn = kws.pop('is_dynamic', False)
+        imp = cls.get_target_implementation(kws, is_dyn)
         return imp(func, identity=identity, cache=cache, targetoptions=kws)
 
 
 class GUVectorize(_BaseVectorize):
     target_registry = DelayedRegistry({'cpu': gufunc.GUFunc,
                                        'parallel': ParallelGUFuncBuilder,})
+    dynamic_target_registry = DelayedRegistry({
+        'parallel': gufunc.ParallelGUFunc,})
 
     def __new__(cls, func, signature, **kws):
         identity = cls.get_identity(kws)
         cache = cls.get_cache(kws)
-        imp = cls.get_target_implementation(kws)
+        imp = cls.get_target_implementation(kws,
+                                            kws.get('is_dynamic', False))
         writable_args = cls.get_writable_args(kws)
-        if imp is gufunc.GUFunc:
+        if isinstance(imp, type) and issubclass(imp, gufunc.GUFunc):
             is_dyn = kws.pop('is_dynamic', False)
             return imp(func, signature, identity=identity, cache=cache,
                        is_dynamic=is_dyn, targetoptions=kws,
@@ -126,7 +136,7 @@ def vectorize(ftylist_or_function=(), **kws):
         ftylist = ftylist_or_function
 
     def wrap(func):
-        vec = Vectorize(func, **kws)
+        vec = Vectorize(func, is_dynamic=not ftylist, **kws)
         for sig in ftylist:
             vec.add(sig)
         if len(ftylist) > 0:
@@ -8,6 +8,7 @@ from numba.core.typing.templates import AbstractTemplate, signature
 from numba.np.ufunc import _internal
 from numba.parfors import array_analysis
 from numba.np.ufunc import ufuncbuilder
+from numba.np.ufunc import parallel
 from numba.np import numpy_support
 
 
@@ -239,13 +240,19 @@ class DUFunc(serialize.ReduceMixin, _internal._DUFunc):
             self._dispatcher, self.targetoptions, sig)
         actual_sig = ufuncbuilder._finalize_ufunc_signature(
             cres, argtys, return_type)
-        dtypenums, ptr, env = ufuncbuilder._build_element_wise_ufunc_wrapper(
-            cres, actual_sig)
+        dtypenums, ptr, env = self._build_loop(cres, actual_sig)
         self._add_loop(int(ptr), dtypenums)
         self._keepalive.append((ptr, cres.library, env))
         self._lower_me.libs.append(cres.library)
         return cres
 
+    def _build_loop(self, cres, sig):
+        """
+        Build the Numpy ufunc loop calling the element-wise function
+        compiled in *cres* for signature *sig*.
+        """
+        return ufuncbuilder._build_element_wise_ufunc_wrapper(cres, sig)
+
     def _install_type(self, typingctx=None):
         """Constructs and installs a typing class for a DUFunc object in the
         input typing context.  If no typing context is given, then
@@ -339,4 +346,22 @@ class DUFunc(serialize.ReduceMixin, _internal._DUFunc):
             [(self._lower_me, self, sig) for sig in (sig0, sig1)])
 
 
+class ParallelDUFunc(DUFunc):
+    """
+    DUFunc whose loops split the iteration space between the threads of
+    the Numba thread pool, as ufuncs created by
+    ``@vectorize(signatures, target='parallel')`` do.
+    """
+
+    def __init__(self, py_func, identity=None, cache=False, targetoptions={}):
+        # Force nopython mode
+        targetoptions = dict(targetoptions, nopython=True)
+        super(ParallelDUFunc, self).__init__(py_func, identity=identity,
+                                             cache=cache,
+                                             targetoptions=targetoptions)
+
+    def _build_loop(self, cres, sig):
+        return parallel.build_element_wise_ufunc_wrapper(cres, sig)
+
+
 array_analysis.MAP_TYPES.append(DUFunc)
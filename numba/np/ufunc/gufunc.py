@@ -1,6 +1,7 @@
 from numba import typeof
 from numba.core import types
 from numba.np.ufunc.ufuncbuilder import GUFuncBuilder
+from numba.np.ufunc.parallel import ParallelGUFuncBuilder
 from numba.np.ufunc.sigparse import parse_signature
 from numba.np.numpy_support import ufunc_find_matching_loop
 from numba.core import serialize
@@ -14,6 +15,8 @@ class GUFunc(serialize.ReduceMixin):
     of call-time (just-in-time) compilation of fast loops
     specialized to inputs.
     """
+    # The class building the Numpy gufunc from the compiled kernels
+    _builder_class = GUFuncBuilder
 
     def __init__(self, py_func, signature, identity=None, cache=None,
                  is_dynamic=False, targetoptions={}, writable_args=()):
@@ -25,7 +28,7 @@ class GUFunc(serialize.ReduceMixin):
         # GUFunc cannot inherit from GUFuncBuilder because "identity"
         # is a property of GUFunc. Thus, we hold a reference to a GUFuncBuilder
         # object here
-        self.gufunc_builder = GUFuncBuilder(
+        self.gufunc_builder = self._builder_class(
             py_func, signature, identity, cache, targetoptions, writable_args)
         self.__name__ = self.gufunc_builder.py_func.__name__
         functools.update_wrapper(self, py_func)
@@ -191,3 +194,11 @@ class GUFunc(serialize.ReduceMixin):
             self.add(sig)
             self.build_ufunc()
         return self.ufunc(*args, **kwargs)
+
+
+class ParallelGUFunc(GUFunc):
+    """
+    Dynamic generalized universal function whose loops split the iteration
+    space between the threads of the Numba thread pool.
+    """
+    _builder_class = ParallelGUFuncBuilder
@@ -12,6 +12,13 @@
 #include <stdint.h>
 #include "gufunc_scheduler.h"
 
+#if defined(_WIN32)
+#define NOMINMAX
+#include <windows.h>
+#elif defined(__linux__)
+#include <sched.h>
+#endif
+
 #ifdef _MSC_VER
 #define THREAD_LOCAL(ty) __declspec(thread) ty
 #else
@@ -22,6 +29,26 @@
 // Default 0 value means one evenly-sized chunk of work per worker thread.
 static THREAD_LOCAL(uintp) parallel_chunksize = 0;
 
+// The schedule of the next parallel loop launched by this thread, one of the
+// NUMBA_SCHEDULE_* values.  With the static schedule, the chunks of work are
+// assigned to the threads ahead of time.  With the dynamic and guided
+// schedules, the threads take the next chunk not yet taken as they become
+// idle, the guided schedule using chunks of decreasing size.
+static THREAD_LOCAL(uintp) parallel_schedule = NUMBA_SCHEDULE_STATIC;
+
+// The number of threads the last guided schedule was sized for by
+// get_sched_size(), for use by the following do_scheduling_*() call.
+static THREAD_LOCAL(uintp) guided_num_threads = 0;
+
+// Number of chunks of work per thread with the dynamic schedule when no
+// chunksize is set.
+#define DYNAMIC_CHUNKS_PER_THREAD 16
+
+// The CPUs the worker threads are pinned to, worker thread i being pinned to
+// CPU affinity_cpus[i % affinity_cpus.size()].  Empty if the threads are not
+// pinned.  Set once before the threads are launched.
+static std::vector<int> affinity_cpus;
+
 // round not available on VS2010.
 double guround (double number) {
 	return number < 0.0 ? ceil(number - 0.5) : floor(number + 0.5);
@@ -110,12 +137,94 @@ extern "C" uintp get_parallel_chunksize() {
     return parallel_chunksize;
 }
 
+extern "C" uintp set_parallel_schedule(uintp schedule) {
+    uintp orig = parallel_schedule;
+    parallel_schedule = schedule;
+    return orig;
+}
+
+extern "C" uintp get_parallel_schedule() {
+    return parallel_schedule;
+}
+
+/*
+ * Compute the sizes of the chunks of a guided schedule of total iterations:
+ * each chunk gets the remaining iterations divided by the number of threads,
+ * but no fewer than min_chunk iterations.
+ */
+std::vector<uintp> guided_chunks(uintp total, uintp num_threads, uintp min_chunk) {
+    std::vector<uintp> ret;
+    uintp remaining = total;
+    if (min_chunk == 0) {
+        min_chunk = 1;
+    }
+    while (remaining > 0) {
+        uintp len = (remaining + num_threads - 1) / num_threads;
+        if (len < min_chunk) {
+            len = min_chunk;
+        }
+        if (len > remaining) {
+            len = remaining;
+        }
+        ret.push_back(len);
+        remaining -= len;
+    }
+    return ret;
+}
+
+extern "C" void set_thread_affinity(int *cpus, int count) {
+    affinity_cpus.assign(cpus, cpus + count);
+}
+
+/*
+ * Pin the calling thread, the worker thread at index slot, to its CPU.
+ * Returns whether the thread was pinned.
+ */
+extern "C" int pin_thread(int slot) {
+    if (affinity_cpus.empty() || slot < 0) {
+        return 0;
+    }
+    int cpu = affinity_cpus[slot % affinity_cpus.size()];
+#if defined(_WIN32)
+    if (cpu >= (int)(8 * sizeof(DWORD_PTR))) {
+        return 0;
+    }
+    return SetThreadAffinityMask(GetCurrentThread(), (DWORD_PTR)1 << cpu) != 0;
+#elif defined(__linux__)
+    if (cpu >= CPU_SETSIZE) {
+        return 0;
+    }
+    cpu_set_t cpuset;
+    CPU_ZERO(&cpuset);
+    CPU_SET(cpu, &cpuset);
+    return sched_setaffinity(0, sizeof(cpuset), &cpuset) == 0;
+#else
+    // Thread affinity isn't supported on this platform
+    return 0;
+#endif
+}
+
 extern "C" uintp get_sched_size(uintp num_threads, uintp num_dim, intp *starts, intp *ends) {
-    if (parallel_chunksize == 0) {
+    if (parallel_chunksize == 0 && parallel_schedule == NUMBA_SCHEDULE_STATIC) {
         return num_threads;
     }
     RangeActual ra(num_dim, starts, ends);
     uintp total_work_size = ra.total_size();
+    if (parallel_schedule == NUMBA_SCHEDULE_GUIDED && num_dim == 1) {
+        // Guided schedules of multidimensional loops fall back on evenly-sized
+        // chunks taken dynamically.
+        guided_num_threads = num_threads;
+        uintp num_divisions = guided_chunks(total_work_size, num_threads,
+                                            parallel_chunksize).size();
+        return num_divisions < num_threads ? num_threads : num_divisions;
+    }
+    if (parallel_chunksize == 0) {
+        uintp num_divisions = num_threads * DYNAMIC_CHUNKS_PER_THREAD;
+        if (num_divisions > total_work_size) {
+            num_divisions = total_work_size;
+        }
+        return num_divisions < num_threads ? num_threads : num_divisions;
+    }
     uintp num_divisions = total_work_size / parallel_chunksize;
     return num_divisions < num_threads ? num_threads : num_divisions;
 }
@@ -376,6 +485,44 @@ std::vector<RangeActual> create_schedule(const RangeActual &full_space, uintp nu
     }
 }
 
+/*
+ * Compute a guided schedule of a one-dimensional iteration space, made of the
+ * num_sched chunks computed by get_sched_size().  Returns an empty schedule
+ * if the iteration space doesn't divide into num_sched guided chunks.
+ */
+std::vector<RangeActual> create_guided_schedule(const RangeActual &full_space, uintp num_sched) {
+    std::vector<RangeActual> ret;
+    if (full_space.ndim() != 1 || guided_num_threads == 0) {
+        return ret;
+    }
+    uintp total = full_space.total_size();
+    std::vector<uintp> sizes = guided_chunks(total, guided_num_threads,
+                                             parallel_chunksize);
+    if (total <= num_sched || sizes.size() != num_sched) {
+        return ret;
+    }
+    intp cur = full_space.start[0];
+    for(uintp i = 0; i < sizes.size(); ++i) {
+        ret.push_back(RangeActual(cur, cur + (intp)sizes[i] - 1));
+        cur += sizes[i];
+    }
+    return ret;
+}
+
+/*
+ * Compute the schedule of the iteration space according to the current
+ * loop schedule.
+ */
+std::vector<RangeActual> schedule_iterations(const RangeActual &full_space, uintp num_sched) {
+    if (parallel_schedule == NUMBA_SCHEDULE_GUIDED) {
+        std::vector<RangeActual> ret = create_guided_schedule(full_space, num_sched);
+        if (!ret.empty()) {
+            return ret;
+        }
+    }
+    return create_schedule(full_space, num_sched);
+}
+
 /*
  *   Print the calculated schedule when in debug mode.
  */
@@ -411,7 +558,7 @@ extern "C" void do_scheduling_signed(uintp num_dim, intp *starts, intp *ends, ui
     if (num_threads == 0) return;
 
     RangeActual full_space(num_dim, starts, ends);
-    std::vector<RangeActual> ret = create_schedule(full_space, num_threads);
+    std::vector<RangeActual> ret = schedule_iterations(full_space, num_threads);
     if (debug) {
         print_schedule(ret);
     }
@@ -433,7 +580,7 @@ extern "C" void do_scheduling_unsigned(uintp num_dim, intp *starts, intp *ends,
     if (num_threads == 0) return;
 
     RangeActual full_space(num_dim, starts, ends);
-    std::vector<RangeActual> ret = create_schedule(full_space, num_threads);
+    std::vector<RangeActual> ret = schedule_iterations(full_space, num_threads);
     if (debug) {
         print_schedule(ret);
     }
@@ -33,6 +33,11 @@
     #define uintp unsigned
 #endif
 
+/* The loop schedules, see set_parallel_schedule() */
+#define NUMBA_SCHEDULE_STATIC 0
+#define NUMBA_SCHEDULE_DYNAMIC 1
+#define NUMBA_SCHEDULE_GUIDED 2
+
 #ifdef __cplusplus
 extern "C"
 {
@@ -42,7 +47,11 @@ void do_scheduling_signed(uintp num_dim, intp *starts, intp *ends, uintp num_thr
 void do_scheduling_unsigned(uintp num_dim, intp *starts, intp *ends, uintp num_threads, uintp *sched, intp debug);
 uintp set_parallel_chunksize(uintp);
 uintp get_parallel_chunksize(void);
+uintp set_parallel_schedule(uintp);
+uintp get_parallel_schedule(void);
 uintp get_sched_size(uintp num_threads, uintp num_dim, intp *starts, intp *ends);
+void set_thread_affinity(int *cpus, int count);
+int pin_thread(int slot);
 
 #ifdef __cplusplus
 }
@@ -57,6 +57,9 @@ static int _INIT_NUM_THREADS = -1;
 // This is the per-thread thread mask, each thread can carry its own mask.
 static THREAD_LOCAL(int) _TLS_num_threads = 0;
 
+// Whether this thread has been pinned to its CPU.
+static THREAD_LOCAL(int) _TLS_pinned = 0;
+
 static void
 set_num_threads(int count)
 {
@@ -153,6 +156,10 @@ parallel_for(void *fn, char **args, size_t *dimensions, size_t *steps, void *dat
         printf("\n");
     }
 
+    // Loops nested in this one, e.g. run by this thread as part of the
+    // team, get the default schedule
+    uintp schedule = set_parallel_schedule(NUMBA_SCHEDULE_STATIC);
+
     // Set the thread mask on the pragma such that the state is scope limited
     // and passed via a register on the OMP region call site, this limiting
     // global state and racing
@@ -164,8 +171,17 @@ parallel_for(void *fn, char **args, size_t *dimensions, size_t *steps, void *dat
         // tell the active thread team about the number of threads
         set_num_threads(agreed_nthreads);
 
-        #pragma omp for
-        for(ptrdiff_t r = 0; r < size; r++)
+        // pin the worker threads of the team, the thread launching the region
+        // being left alone
+        int tid = omp_get_thread_num();
+        if (tid != 0 && !_TLS_pinned)
+        {
+            pin_thread(tid);
+            _TLS_pinned = 1;
+        }
+
+        // Run the chunk of work at index r
+        auto run_chunk = [&](ptrdiff_t r)
         {
             memcpy(count_space, dimensions, arg_len * sizeof(size_t));
             count_space[0] = 1;
@@ -203,8 +219,24 @@ parallel_for(void *fn, char **args, size_t *dimensions, size_t *steps, void *dat
                 printf("\n");
             }
             func(array_arg_space, count_space, steps, data);
+        };
+
+        if (schedule != NUMBA_SCHEDULE_STATIC)
+        {
+            // The threads take the next chunk not yet taken as they become
+            // idle
+            #pragma omp for schedule(dynamic)
+            for(ptrdiff_t r = 0; r < size; r++)
+                run_chunk(r);
+        }
+        else
+        {
+            #pragma omp for
+            for(ptrdiff_t r = 0; r < size; r++)
+                run_chunk(r);
         }
     }
+    set_parallel_schedule(schedule);
 }
 
 static void launch_threads(int count)
@@ -256,7 +288,10 @@ MOD_INIT(omppool)
     SetAttrStringFromVoidPointer(m, get_thread_id);
     SetAttrStringFromVoidPointer(m, set_parallel_chunksize);
     SetAttrStringFromVoidPointer(m, get_parallel_chunksize);
+    SetAttrStringFromVoidPointer(m, set_parallel_schedule);
+    SetAttrStringFromVoidPointer(m, get_parallel_schedule);
     SetAttrStringFromVoidPointer(m, get_sched_size);
+    SetAttrStringFromVoidPointer(m, set_thread_affinity);
 
     PyObject *tmp = PyString_FromString(_OMP_VENDOR);
     PyObject_SetAttrString(m, "openmp_vendor", tmp);
@@ -23,6 +23,7 @@ from llvmlite import ir
 
 from numba.np.numpy_support import as_dtype
 from numba.core import types, cgutils, config, errors
+from numba.core.compiler_lock import global_compiler_lock
 from numba.core.typing import signature
 from numba.np.ufunc.wrappers import _wrapper_info
 from numba.np.ufunc import ufuncbuilder
@@ -46,6 +47,24 @@ def get_thread_count():
 NUM_THREADS = get_thread_count()
 
 
+def get_thread_affinity_cpus():
+    """
+    Gets the CPUs the threads of the threading layer are pinned to, as set by
+    :obj:`numba.config.THREAD_AFFINITY`. The worker thread ``i`` is pinned to
+    CPU ``cpus[i % len(cpus)]``. Returns an empty list if the threads are not
+    pinned.
+    """
+    affinity = config._parse_thread_affinity(config.THREAD_AFFINITY)
+    if affinity == 'none':
+        return []
+    if affinity == 'compact':
+        try:
+            return sorted(os.sched_getaffinity(0))
+        except AttributeError:
+            return list(range(os.cpu_count() or 1))
+    return list(affinity)
+
+
 def build_gufunc_kernel(library, ctx, info, sig, inner_ndim):
     """Wrap the original CPU ufunc/gufunc with a parallel dispatcher.
     This function will wrap gufuncs and ufuncs something like.
@@ -180,21 +199,27 @@ def build_gufunc_kernel(library, ctx, info, sig, inner_ndim):
 
 class ParallelUFuncBuilder(ufuncbuilder.UFuncBuilder):
     def build(self, cres, sig):
-        _launch_threads()
+        return build_element_wise_ufunc_wrapper(cres, cres.signature)
+
 
-        # Builder wrapper for ufunc entry point
-        ctx = cres.target_context
-        signature = cres.signature
-        library = cres.library
-        fname = cres.fndesc.llvm_func_name
+def build_element_wise_ufunc_wrapper(cres, signature):
+    '''Build a parallel wrapper for the ufunc loop entry point given by the
+    compilation result object, using the element-wise signature.
+    '''
+    _launch_threads()
+
+    # Builder wrapper for ufunc entry point
+    ctx = cres.target_context
+    library = cres.library
+    fname = cres.fndesc.llvm_func_name
 
+    with global_compiler_lock:
         info = build_ufunc_wrapper(library, ctx, fname, signature, cres)
         ptr = info.library.get_pointer_to_function(info.name)
-        # Get dtypes
-        dtypenums = [np.dtype(a.name).num for a in signature.args]
-        dtypenums.append(np.dtype(signature.return_type.name).num)
-        keepalive = ()
-        return dtypenums, ptr, keepalive
+    # Get dtypes
+    dtypenums = [as_dtype(a).num for a in signature.args]
+    dtypenums.append(as_dtype(signature.return_type).num)
+    return dtypenums, ptr, cres.environment
 
 
 def build_ufunc_wrapper(library, ctx, fname, signature, cres):
@@ -516,6 +541,12 @@ def _launch_threads():
             ll.add_symbol('do_scheduling_signed', lib.do_scheduling_signed)
             ll.add_symbol('do_scheduling_unsigned', lib.do_scheduling_unsigned)
 
+            cpus = get_thread_affinity_cpus()
+            if cpus:
+                set_thread_affinity = CFUNCTYPE(None, POINTER(c_int),
+                                                c_int)(lib.set_thread_affinity)
+                set_thread_affinity((c_int * len(cpus))(*cpus), len(cpus))
+
             launch_threads = CFUNCTYPE(None, c_int)(lib.launch_threads)
             launch_threads(NUM_THREADS)
 
@@ -546,6 +577,8 @@ def _load_threading_functions(lib):
     ll.add_symbol('set_parallel_chunksize', lib.set_parallel_chunksize)
     ll.add_symbol('get_parallel_chunksize', lib.get_parallel_chunksize)
     ll.add_symbol('get_sched_size', lib.get_sched_size)
+    ll.add_symbol('set_parallel_schedule', lib.set_parallel_schedule)
+    ll.add_symbol('get_parallel_schedule', lib.get_parallel_schedule)
     global _set_parallel_chunksize
     _set_parallel_chunksize = CFUNCTYPE(c_uint,
                                         c_uint)(lib.set_parallel_chunksize)
@@ -17,6 +17,7 @@ Implement parallel vectorize workqueue on top of Intel TBB.
 #include <string.h>
 #include <stdio.h>
 #include <thread>
+#include <atomic>
 #include "workqueue.h"
 
 #include "gufunc_scheduler.h"
@@ -48,6 +49,15 @@ static int _INIT_NUM_THREADS = -1;
 // This is the per-thread thread mask, each thread can carry its own mask.
 static THREAD_LOCAL(int) _TLS_num_threads = 0;
 
+// Whether this thread has been pinned to its CPU.
+static THREAD_LOCAL(bool) _TLS_pinned = false;
+
+// The pinning index of the next worker thread. The arena slot of a worker
+// changes from one arena to the next and two workers in different arenas
+// can have the same slot, so each worker is given its own index the first
+// time it enters an arena.
+static std::atomic<int> _next_pin_index(0);
+
 
 static void
 set_num_threads(int count)
@@ -97,6 +107,12 @@ public:
 
 void fix_tls_observer::on_scheduler_entry(bool worker) {
     set_num_threads(mask_val);
+    // pin the worker threads, the thread launching the region being left
+    // alone
+    if (worker && !_TLS_pinned) {
+        pin_thread(_next_pin_index.fetch_add(1));
+        _TLS_pinned = true;
+    }
 }
 
 static void
@@ -158,9 +174,12 @@ parallel_for(void *fn, char **args, size_t *dimensions, size_t *steps, void *dat
     tbb::task_arena limited(num_threads);
     fix_tls_observer observer(limited, num_threads);
 
+    // Loops nested in this one get the default schedule
+    uintp schedule = set_parallel_schedule(NUMBA_SCHEDULE_STATIC);
+
     limited.execute([&]{
         using range_t = tbb::blocked_range<size_t>;
-        tbb::parallel_for(range_t(0, dimensions[0]), [=](const range_t &range)
+        auto run_range = [=](const range_t &range)
         {
             size_t * count_space = (size_t *)alloca(sizeof(size_t) * arg_len);
             char ** array_arg_space = (char**)alloca(sizeof(char*) * array_count);
@@ -201,8 +220,20 @@ parallel_for(void *fn, char **args, size_t *dimensions, size_t *steps, void *dat
             }
             auto func = reinterpret_cast<void (*)(char **args, size_t *dims, size_t *steps, void *data)>(fn);
             func(array_arg_space, count_space, steps, data);
-        });
+        };
+        if (schedule != NUMBA_SCHEDULE_STATIC)
+        {
+            // Make each chunk of work a task of its own, for the idle threads
+            // to steal
+            tbb::parallel_for(range_t(0, dimensions[0], 1), run_range,
+                              tbb::simple_partitioner());
+        }
+        else
+        {
+            tbb::parallel_for(range_t(0, dimensions[0]), run_range);
+        }
     });
+    set_parallel_schedule(schedule);
 }
 
 static std::thread::id init_thread_id;
@@ -341,7 +372,10 @@ MOD_INIT(tbbpool)
     SetAttrStringFromVoidPointer(m, get_thread_id);
     SetAttrStringFromVoidPointer(m, set_parallel_chunksize);
     SetAttrStringFromVoidPointer(m, get_parallel_chunksize);
+    SetAttrStringFromVoidPointer(m, set_parallel_schedule);
+    SetAttrStringFromVoidPointer(m, get_parallel_schedule);
     SetAttrStringFromVoidPointer(m, get_sched_size);
+    SetAttrStringFromVoidPointer(m, set_thread_affinity);
 
     return MOD_SUCCESS_VAL(m);
 }
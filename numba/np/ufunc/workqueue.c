@@ -362,6 +362,60 @@ static void sync_tls(void *args, void *dims, void *steps, void *data) {
 };
 
 
+/* The state shared by the threads running the chunks of work of a
+ * parallel_for with a dynamic or guided schedule.
+ */
+typedef struct
+{
+    void (*func)(char **args, size_t *dims, size_t *steps, void *data);
+    char **args;
+    size_t *dimensions;
+    size_t *steps;
+    void *data;
+    size_t arg_len;
+    size_t array_count;
+    size_t total;
+    /* Index of the next chunk to run */
+    size_t next;
+} dynamic_loop_t;
+
+static size_t
+fetch_next_chunk(size_t *next)
+{
+#ifdef _MSC_VER
+#ifdef _WIN64
+    return (size_t)InterlockedExchangeAdd64((volatile LONG64 *)next, 1);
+#else
+    return (size_t)InterlockedExchangeAdd((volatile LONG *)next, 1);
+#endif
+#else
+    return __atomic_fetch_add(next, 1, __ATOMIC_RELAXED);
+#endif
+}
+
+/* The task of each thread of a parallel_for with a dynamic or guided
+ * schedule: run the next chunk not yet taken until all are done.
+ */
+static void
+dynamic_loop_task(void *args, void *dims, void *steps, void *data)
+{
+    dynamic_loop_t *loop = (dynamic_loop_t *)args;
+    size_t *count_space = (size_t *)alloca(sizeof(size_t) * loop->arg_len);
+    char **array_arg_space = (char **)alloca(sizeof(char*) * loop->array_count);
+    size_t i, j;
+
+    memcpy(count_space, loop->dimensions, loop->arg_len * sizeof(size_t));
+    count_space[0] = 1;
+    while ((i = fetch_next_chunk(&loop->next)) < loop->total)
+    {
+        for (j = 0; j < loop->array_count; j++)
+        {
+            array_arg_space[j] = loop->args[j] + loop->steps[j] * i;
+        }
+        loop->func(array_arg_space, count_space, loop->steps, loop->data);
+    }
+}
+
 static void
 parallel_for(void *fn, char **args, size_t *dimensions, size_t *steps, void *data,
              size_t inner_ndim, size_t array_count, int num_threads)
@@ -402,6 +456,8 @@ parallel_for(void *fn, char **args, size_t *dimensions, size_t *steps, void *dat
     ptrdiff_t offset;
     char * base;
     int old_queue_count = -1;
+    uintp schedule;
+    dynamic_loop_t loop;
 
     size_t step;
 
@@ -452,60 +508,81 @@ parallel_for(void *fn, char **args, size_t *dimensions, size_t *steps, void *dat
     old_queue_count = queue_count;
     queue_count = num_threads;
 
-    for (i = 0; i < num_threads; i++)
+    schedule = get_parallel_schedule();
+    if (schedule != NUMBA_SCHEDULE_STATIC)
     {
-        count_space = (size_t *)alloca(sizeof(size_t) * arg_len);
-        memcpy(count_space, dimensions, arg_len * sizeof(size_t));
-        if(i == num_threads - 1)
-        {
-            // Last thread takes all leftover
-            count_space[0] = remain;
-        }
-        else
+        loop.func = fn;
+        loop.args = args;
+        loop.dimensions = dimensions;
+        loop.steps = steps;
+        loop.data = data;
+        loop.arg_len = arg_len;
+        loop.array_count = array_count;
+        loop.total = total;
+        loop.next = 0;
+        for (i = 0; i < num_threads; i++)
         {
-            count_space[0] = count;
-            remain = remain - count;
+            add_task_internal(dynamic_loop_task, (void *)&loop, NULL, NULL,
+                              NULL, i);
         }
-
-        if(_DEBUG)
+    }
+    else
+    {
+        for (i = 0; i < num_threads; i++)
         {
-            printf("\n=================== THREAD %d ===================\n", i);
-            printf("\ncount_space: ");
-            for(j = 0; j < arg_len; j++)
+            count_space = (size_t *)alloca(sizeof(size_t) * arg_len);
+            memcpy(count_space, dimensions, arg_len * sizeof(size_t));
+            if(i == num_threads - 1)
             {
-                printf("%zd, ", count_space[j]);
+                // Last thread takes all leftover
+                count_space[0] = remain;
+            }
+            else
+            {
+                count_space[0] = count;
+                remain = remain - count;
             }
-            printf("\n");
-        }
-
-        array_arg_space = alloca(sizeof(char*) * array_count);
-
-        for(j = 0; j < array_count; j++)
-        {
-            base = args[j];
-            step = steps[j];
-            offset = step * count * i;
-            array_arg_space[j] = (char *)(base + offset);
 
             if(_DEBUG)
             {
-                printf("Index %zd\n", j);
-                printf("-->Got base %p\n", (void *)base);
-                printf("-->Got step %zd\n", step);
-                printf("-->Got offset %td\n", offset);
-                printf("-->Got addr %p\n", (void *)array_arg_space[j]);
+                printf("\n=================== THREAD %d ===================\n", i);
+                printf("\ncount_space: ");
+                for(j = 0; j < arg_len; j++)
+                {
+                    printf("%zd, ", count_space[j]);
+                }
+                printf("\n");
             }
-        }
 
-        if(_DEBUG)
-        {
-            printf("\narray_arg_space: ");
+            array_arg_space = alloca(sizeof(char*) * array_count);
+
             for(j = 0; j < array_count; j++)
             {
-                printf("%p, ", (void *)array_arg_space[j]);
+                base = args[j];
+                step = steps[j];
+                offset = step * count * i;
+                array_arg_space[j] = (char *)(base + offset);
+
+                if(_DEBUG)
+                {
+                    printf("Index %zd\n", j);
+                    printf("-->Got base %p\n", (void *)base);
+                    printf("-->Got step %zd\n", step);
+                    printf("-->Got offset %td\n", offset);
+                    printf("-->Got addr %p\n", (void *)array_arg_space[j]);
+                }
+            }
+
+            if(_DEBUG)
+            {
+                printf("\narray_arg_space: ");
+                for(j = 0; j < array_count; j++)
+                {
+                    printf("%p, ", (void *)array_arg_space[j]);
+                }
             }
+            add_task_internal(fn, (void *)array_arg_space, (void *)count_space, steps, data, i);
         }
-        add_task_internal(fn, (void *)array_arg_space, (void *)count_space, steps, data, i);
     }
 
     ready();
@@ -555,6 +632,7 @@ void thread_worker(void *arg)
     Queue *queue = (Queue*)arg;
     Task *task;
 
+    pin_thread((int)(queue - queues));
     while (1)
     {
         /* Wait for the queue to be in READY state (i.e. for some task
@@ -657,7 +735,10 @@ MOD_INIT(workqueue)
     SetAttrStringFromVoidPointer(m, get_thread_id);
     SetAttrStringFromVoidPointer(m, set_parallel_chunksize);
     SetAttrStringFromVoidPointer(m, get_parallel_chunksize);
+    SetAttrStringFromVoidPointer(m, set_parallel_schedule);
+    SetAttrStringFromVoidPointer(m, get_parallel_schedule);
     SetAttrStringFromVoidPointer(m, get_sched_size);
+    SetAttrStringFromVoidPointer(m, set_thread_affinity);
 
     return MOD_SUCCESS_VAL(m);
 }
@@ -23,13 +23,14 @@ from functools import reduce
 from collections import defaultdict, OrderedDict, namedtuple
 from contextlib import contextmanager
 import operator
+import warnings
 from dataclasses import make_dataclass
 
 from llvmlite import ir as lir
 from numba.core.imputils import impl_ret_untracked
 import numba.core.ir
 from numba.core import types, typing, utils, errors, ir, analysis, postproc, rewrites, typeinfer, config, ir_utils
-from numba import prange, pndindex
+from numba import prange, pndindex, thread_local
 from numba.np.npdatetime_helpers import datetime_minimum, datetime_maximum
 from numba.np.numpy_support import as_dtype, numpy_version
 from numba.core.typing.templates import infer_global, AbstractTemplate
@@ -446,6 +447,589 @@ def linspace_parallel_impl(return_type, *args):
     else:
         raise ValueError("parallel linspace with types {}".format(args))
 
+@register_jitable
+def num_parallel_chunks(n):
+    # One chunk per thread, but not so many that chunks become tiny.
+    return max(min(numba.get_num_threads(), n // 4096), 1)
+
+# 1D arrays with fewer elements than this are sorted serially.
+_PARALLEL_SORT_MIN_SIZE = 1 << 16
+
+@register_jitable
+def sort_lt(a, b):
+    # Orders NaNs last, as the serial sorts do.
+    return a < b or (b != b and a == a)
+
+# The serial sorts are called out-of-line so that they are not swapped for
+# their parallel implementations.
+@register_jitable
+def sort_serial(a):
+    a.sort()
+
+@register_jitable
+def argsort_serial(a):
+    return np.argsort(a)
+
+
+@register_jitable
+def sort_merge_runs(src, dst, lo, mid, hi):
+    # Merge the sorted runs src[lo:mid] and src[mid:hi] into dst[lo:hi].
+    i = lo
+    j = mid
+    k = lo
+    while i < mid and j < hi:
+        if sort_lt(src[j], src[i]):
+            dst[k] = src[j]
+            j += 1
+        else:
+            dst[k] = src[i]
+            i += 1
+        k += 1
+    while i < mid:
+        dst[k] = src[i]
+        i += 1
+        k += 1
+    while j < hi:
+        dst[k] = src[j]
+        j += 1
+        k += 1
+
+@register_jitable
+def argsort_merge_runs(keys, src, dst, lo, mid, hi):
+    # Merge the index runs src[lo:mid] and src[mid:hi] into dst[lo:hi],
+    # keeping equal keys in order.
+    i = lo
+    j = mid
+    k = lo
+    while i < mid and j < hi:
+        if sort_lt(keys[src[j]], keys[src[i]]):
+            dst[k] = src[j]
+            j += 1
+        else:
+            dst[k] = src[i]
+            i += 1
+        k += 1
+    while i < mid:
+        dst[k] = src[i]
+        i += 1
+        k += 1
+    while j < hi:
+        dst[k] = src[j]
+        j += 1
+        k += 1
+
+@register_jitable
+def argsort_stable(keys, idx, tmp, lo, hi):
+    # Stable sort of idx[lo:hi] = lo, ..., hi - 1 by keys, using tmp[lo:hi]
+    # as scratch. Runs of 32 are insertion sorted then merged bottom-up.
+    run = 32
+    for start in range(lo, hi, run):
+        stop = min(start + run, hi)
+        for i in range(start, stop):
+            j = i
+            while j > start and sort_lt(keys[i], keys[idx[j - 1]]):
+                idx[j] = idx[j - 1]
+                j -= 1
+            idx[j] = i
+    src = idx
+    dst = tmp
+    in_tmp = False
+    width = run
+    while width < hi - lo:
+        for start in range(lo, hi, 2 * width):
+            argsort_merge_runs(keys, src, dst, start,
+                               min(start + width, hi),
+                               min(start + 2 * width, hi))
+        src, dst = dst, src
+        in_tmp = not in_tmp
+        width *= 2
+    if in_tmp:
+        idx[lo:hi] = tmp[lo:hi]
+
+@register_jitable
+def radix_digit(x, shift, flip):
+    # The byte of x at bit offset shift, with flip xor-ed in so that the
+    # most significant byte of signed keys orders negative keys first.
+    return ((np.uint64(x) >> np.uint64(shift)) & np.uint64(0xff)) ^ flip
+
+@register_jitable
+def radix_count(src, counts, lo, hi, shift, flip):
+    # Histogram of the digits of src[lo:hi] into counts.
+    counts[:] = 0
+    for i in range(lo, hi):
+        counts[radix_digit(src[i], shift, flip)] += 1
+
+@register_jitable
+def radix_offsets(counts, n):
+    # Turn the per-chunk digit counts into the index where each chunk
+    # writes its first key of each digit. Keys are ordered by digit, then by
+    # chunk, so that the pass is stable. Returns False if all the keys have
+    # the same digit, in which case the pass can be skipped.
+    nchunks = counts.shape[0]
+    total = 0
+    for d in range(256):
+        digit_total = 0
+        for c in range(nchunks):
+            cnt = counts[c, d]
+            counts[c, d] = total + digit_total
+            digit_total += cnt
+        if digit_total == n:
+            return False
+        total += digit_total
+    return True
+
+@register_jitable
+def radix_scatter(src, dst, offsets, lo, hi, shift, flip):
+    # Move src[lo:hi] to dst at the offsets of their digits.
+    for i in range(lo, hi):
+        d = radix_digit(src[i], shift, flip)
+        dst[offsets[d]] = src[i]
+        offsets[d] += 1
+
+def _can_sort_parallel(arg):
+    return (isinstance(arg, types.npytypes.Array) and arg.ndim == 1 and
+            isinstance(arg.dtype, (types.Integer, types.Float)))
+
+def sort_parallel_impl(return_type, arg):
+    """Parallel sort of 1D arrays. Integer arrays are sorted with a least
+    significant digit radix sort, one byte per pass: each thread counts the
+    digits of a chunk of the array, then moves its keys to their place.
+    Passes on a byte that all the keys share are skipped. Float arrays are
+    merge sorted: each thread sorts a chunk of the array, then the sorted
+    chunks are merged pairwise in parallel.
+    """
+    if not _can_sort_parallel(arg):
+        return None
+
+    if isinstance(arg.dtype, types.Integer):
+        nbits = arg.dtype.bitwidth
+        sign_flip = np.uint64(0x80 if arg.dtype.signed else 0)
+        no_flip = np.uint64(0)
+
+        def radix_sort_1(in_arr):
+            n = len(in_arr)
+            res = in_arr.copy()
+            nchunks = numba.parfors.parfor.num_parallel_chunks(n)
+            if (n < numba.parfors.parfor._PARALLEL_SORT_MIN_SIZE or
+                    nchunks == 1):
+                numba.parfors.parfor.sort_serial(res)
+                return res
+            src = res
+            dst = np.empty_like(res)
+            counts = np.empty((nchunks, 256), np.intp)
+            for shift in range(0, nbits, 8):
+                flip = sign_flip if shift == nbits - 8 else no_flip
+                numba.parfors.parfor.init_prange()
+                for c in numba.parfors.parfor.internal_prange(nchunks):
+                    numba.parfors.parfor.radix_count(
+                        src, counts[c], c * n // nchunks,
+                        (c + 1) * n // nchunks, shift, flip)
+                if not numba.parfors.parfor.radix_offsets(counts, n):
+                    continue
+                numba.parfors.parfor.init_prange()
+                for c in numba.parfors.parfor.internal_prange(nchunks):
+                    numba.parfors.parfor.radix_scatter(
+                        src, dst, counts[c], c * n // nchunks,
+                        (c + 1) * n // nchunks, shift, flip)
+                src, dst = dst, src
+            return src
+        return radix_sort_1
+
+    def sort_1(in_arr):
+        n = len(in_arr)
+        res = in_arr.copy()
+        nchunks = numba.parfors.parfor.num_parallel_chunks(n)
+        if (n < numba.parfors.parfor._PARALLEL_SORT_MIN_SIZE or
+                nchunks == 1):
+            numba.parfors.parfor.sort_serial(res)
+            return res
+        numba.parfors.parfor.init_prange()
+        for c in numba.parfors.parfor.internal_prange(nchunks):
+            numba.parfors.parfor.sort_serial(
+                res[c * n // nchunks:(c + 1) * n // nchunks])
+        src = res
+        dst = np.empty_like(res)
+        width = 1
+        while width < nchunks:
+            npairs = (nchunks + 2 * width - 1) // (2 * width)
+            numba.parfors.parfor.init_prange()
+            for p in numba.parfors.parfor.internal_prange(npairs):
+                lo = 2 * p * width
+                mid = min(lo + width, nchunks)
+                hi = min(lo + 2 * width, nchunks)
+                numba.parfors.parfor.sort_merge_runs(
+                    src, dst, lo * n // nchunks, mid * n // nchunks,
+                    hi * n // nchunks)
+            src, dst = dst, src
+            width *= 2
+        return src
+    return sort_1
+
+def argsort_parallel_impl(return_type, arg, kind=None):
+    """Parallel stable merge argsort of 1D arrays, see sort_parallel_impl.
+    """
+    if not _can_sort_parallel(arg):
+        return None
+
+    def argsort_1(in_arr):
+        n = len(in_arr)
+        nchunks = numba.parfors.parfor.num_parallel_chunks(n)
+        if (n < numba.parfors.parfor._PARALLEL_SORT_MIN_SIZE or
+                nchunks == 1):
+            return numba.parfors.parfor.argsort_serial(in_arr)
+        res = np.empty(n, np.intp)
+        tmp = np.empty(n, np.intp)
+        numba.parfors.parfor.init_prange()
+        for c in numba.parfors.parfor.internal_prange(nchunks):
+            numba.parfors.parfor.argsort_stable(
+                in_arr, res, tmp, c * n // nchunks, (c + 1) * n // nchunks)
+        src = res
+        dst = tmp
+        width = 1
+        while width < nchunks:
+            npairs = (nchunks + 2 * width - 1) // (2 * width)
+            numba.parfors.parfor.init_prange()
+            for p in numba.parfors.parfor.internal_prange(npairs):
+                lo = 2 * p * width
+                mid = min(lo + width, nchunks)
+                hi = min(lo + 2 * width, nchunks)
+                numba.parfors.parfor.argsort_merge_runs(
+                    in_arr, src, dst, lo * n // nchunks, mid * n // nchunks,
+                    hi * n // nchunks)
+            src, dst = dst, src
+            width *= 2
+        return src
+
+    def argsort_2(in_arr, kind):
+        # The parallel argsort is stable, so it serves any kind.
+        n = len(in_arr)
+        if (n < numba.parfors.parfor._PARALLEL_SORT_MIN_SIZE or
+                numba.parfors.parfor.num_parallel_chunks(n) == 1):
+            res = np.empty(n, np.intp)
+            numba.parfors.parfor.argsort_stable(
+                in_arr, res, np.empty(n, np.intp), 0, n)
+            return res
+        return np.argsort(in_arr)
+
+    return argsort_1 if kind is None else argsort_2
+
+# Arrays with fewer elements than this are scanned serially.
+_PARALLEL_SCAN_MIN_SIZE = 1 << 15
+
+@register_jitable
+def scan_add(a, b):
+    return a + b
+
+@register_jitable
+def scan_mul(a, b):
+    return a * b
+
+def _scan_result_dtype(arg):
+    # Small integers and booleans are accumulated as intp, as np.cumsum does.
+    if ((arg.dtype in types.signed_domain and
+            arg.dtype.bitwidth < types.intp.bitwidth) or
+            arg.dtype == types.bool_):
+        return as_dtype(types.intp)
+    return as_dtype(arg.dtype)
+
+def _make_scan_parallel_impl(scan_op, dtype, with_op):
+    """Parallel two-pass inclusive scan of the flattened array with the
+    associative binary function scan_op. Each thread scans a chunk of the
+    array, the last elements of the chunks are then combined serially, and
+    finally each chunk but the first is offset by the preceding chunk's last
+    element in parallel. If with_op is set, the implementation takes the
+    op as a leading argument, which it ignores, and the array second.
+    """
+    def scan(op_or_arr, arr=None):
+        # with_op is a constant, the inliner prunes the other branch.
+        if with_op:
+            A = arr.ravel()
+        else:
+            A = op_or_arr.ravel()
+        n = len(A)
+        out = np.empty(n, dtype)
+        nchunks = numba.parfors.parfor.num_parallel_chunks(n)
+        if n < numba.parfors.parfor._PARALLEL_SCAN_MIN_SIZE or nchunks == 1:
+            if n > 0:
+                c = A[0]
+                out[0] = c
+                for i in range(1, n):
+                    c = scan_op(c, A[i])
+                    out[i] = c
+            return out
+        numba.parfors.parfor.init_prange()
+        for ch in numba.parfors.parfor.internal_prange(nchunks):
+            lo = ch * n // nchunks
+            hi = (ch + 1) * n // nchunks
+            c = A[lo]
+            out[lo] = c
+            for i in range(lo + 1, hi):
+                c = scan_op(c, A[i])
+                out[i] = c
+        for ch in range(1, nchunks):
+            last = (ch + 1) * n // nchunks - 1
+            out[last] = scan_op(out[ch * n // nchunks - 1], out[last])
+        numba.parfors.parfor.init_prange()
+        for ch in numba.parfors.parfor.internal_prange(nchunks - 1):
+            lo = (ch + 1) * n // nchunks
+            hi = (ch + 2) * n // nchunks
+            carry = out[lo - 1]
+            for i in range(lo, hi - 1):
+                out[i] = scan_op(carry, out[i])
+        return out
+
+    return scan
+
+def cumsum_parallel_impl(return_type, arg):
+    if not isinstance(arg, types.npytypes.Array):
+        return None
+    return _make_scan_parallel_impl(scan_add, _scan_result_dtype(arg), False)
+
+def cumprod_parallel_impl(return_type, arg):
+    if not isinstance(arg, types.npytypes.Array):
+        return None
+    return _make_scan_parallel_impl(scan_mul, _scan_result_dtype(arg), False)
+
+def parallel_scan_parallel_impl(return_type, op, arg):
+    if not (isinstance(op, types.Dispatcher) and
+            isinstance(arg, types.npytypes.Array) and arg.ndim == 1):
+        return None
+    return _make_scan_parallel_impl(op.dispatcher, as_dtype(arg.dtype), True)
+
+# Inputs with fewer elements than this are counted serially.
+_PARALLEL_HIST_MIN_SIZE = 1 << 15
+
+# The serial counts are called out-of-line so that they are not swapped for
+# their parallel implementations.
+@register_jitable
+def bincount_serial(a, weights, minlength):
+    return np.bincount(a, weights, minlength)
+
+@register_jitable
+def histogram_serial(a, bins, range):
+    return np.histogram(a, bins, range)
+
+@register_jitable
+def hist_num_chunks(n, nbins):
+    # Each chunk counts into its own private bins, which are then summed, so
+    # use fewer chunks when there are more bins than elements per chunk.
+    if n < _PARALLEL_HIST_MIN_SIZE:
+        return 1
+    return max(min(num_parallel_chunks(n), n // max(nbins, 1)), 1)
+
+@register_jitable
+def hist_chunk_bounds(a, lo, hi):
+    # Minimum and maximum of a[lo:hi], ignoring NaNs.
+    amin = np.inf
+    amax = -np.inf
+    for i in range(lo, hi):
+        v = a[i]
+        if amin > v:
+            amin = v
+        if amax < v:
+            amax = v
+    return amin, amax
+
+@register_jitable
+def bincount_chunk_bounds(a, lo, hi):
+    amin = a[lo]
+    amax = a[lo]
+    for i in range(lo + 1, hi):
+        amin = min(amin, a[i])
+        amax = max(amax, a[i])
+    return amin, amax
+
+@register_jitable
+def bincount_count_chunk(a, weights, priv, c, lo, hi):
+    if weights is None:
+        for i in range(lo, hi):
+            priv[c, a[i]] += 1
+    else:
+        for i in range(lo, hi):
+            priv[c, a[i]] += weights[i]
+
+# Argument checks raise, which inlined implementations cannot.
+@register_jitable
+def bincount_check_args(a, weights, minlength):
+    if weights is not None and len(a) != len(weights):
+        raise ValueError("bincount(): weights and list don't have "
+                         "the same length")
+    if minlength < 0:
+        raise ValueError("'minlength' must not be negative")
+
+@register_jitable
+def bincount_check_min(amin):
+    if amin < 0:
+        raise ValueError("bincount(): first argument must be "
+                         "non-negative")
+
+@register_jitable
+def hist_check_range(bins, bin_min, bin_max):
+    if bins <= 0:
+        raise ValueError("histogram(): `bins` should be a "
+                         "positive integer")
+    if not bin_min <= bin_max:
+        raise ValueError("histogram(): max must be larger than "
+                         "min in range parameter")
+
+@register_jitable
+def hist_check_bins(bins):
+    for i in range(len(bins) - 1):
+        # Note this also catches NaNs
+        if not bins[i] <= bins[i + 1]:
+            raise ValueError("histogram(): bins must increase "
+                             "monotonically")
+
+@register_jitable
+def hist_count_linear_chunk(a, priv, c, lo, hi, bin_min, bin_max, bin_ratio):
+    nbins = priv.shape[1]
+    for i in range(lo, hi):
+        b = numba.np.arraymath._histogram_linear_bin(a[i], bin_min, bin_max,
+                                                     nbins, bin_ratio)
+        if b >= 0:
+            priv[c, b] += 1
+
+@register_jitable
+def hist_count_edges_chunk(a, bins, priv, c, lo, hi, bin_ratio):
+    bin_min = bins[0]
+    bin_max = bins[len(bins) - 1]
+    for i in range(lo, hi):
+        v = a[i]
+        if bin_min <= v <= bin_max:
+            priv[c, numba.np.arraymath._histogram_bin_index(
+                v, bins, bin_ratio)] += 1
+
+@register_jitable
+def hist_merge_bin(priv, j):
+    # Sum bin j over the private bins of all chunks.
+    s = priv[0, j]
+    for c in range(1, priv.shape[0]):
+        s += priv[c, j]
+    return s
+
+def bincount_parallel_impl(return_type, a, weights=None, minlength=None):
+    """Parallel np.bincount of 1D integer arrays. Each thread counts a chunk
+    of the array into private bins, which are then summed in parallel.
+    """
+    if not (isinstance(a, types.npytypes.Array) and a.ndim == 1 and
+            isinstance(a.dtype, types.Integer)):
+        return None
+    if weights in (None, types.none):
+        dtype = np.intp
+    elif isinstance(weights, types.npytypes.Array) and weights.ndim == 1:
+        # weights is promoted to double, as in the serial implementation
+        dtype = np.float64
+    else:
+        return None
+
+    def bincount_impl(a, weights=None, minlength=0):
+        n = len(a)
+        nchunks = numba.parfors.parfor.num_parallel_chunks(n)
+        if n < numba.parfors.parfor._PARALLEL_HIST_MIN_SIZE or nchunks == 1:
+            return numba.parfors.parfor.bincount_serial(a, weights, minlength)
+        numba.parfors.parfor.bincount_check_args(a, weights, minlength)
+        minima = np.empty(nchunks, np.int64)
+        maxima = np.empty(nchunks, np.int64)
+        numba.parfors.parfor.init_prange()
+        for c in numba.parfors.parfor.internal_prange(nchunks):
+            amin, amax = numba.parfors.parfor.bincount_chunk_bounds(
+                a, c * n // nchunks, (c + 1) * n // nchunks)
+            minima[c] = amin
+            maxima[c] = amax
+        numba.parfors.parfor.bincount_check_min(minima.min())
+        nbins = max(maxima.max() + 1, minlength)
+        nchunks = numba.parfors.parfor.hist_num_chunks(n, nbins)
+        priv = np.zeros((nchunks, nbins), dtype)
+        numba.parfors.parfor.init_prange()
+        for c in numba.parfors.parfor.internal_prange(nchunks):
+            numba.parfors.parfor.bincount_count_chunk(
+                a, weights, priv, c, c * n // nchunks, (c + 1) * n // nchunks)
+        out = np.empty(nbins, dtype)
+        numba.parfors.parfor.init_prange()
+        for j in numba.parfors.parfor.internal_prange(nbins):
+            out[j] = numba.parfors.parfor.hist_merge_bin(priv, j)
+        return out
+
+    return bincount_impl
+
+def histogram_parallel_impl(return_type, a, bins=None, range=None):
+    """Parallel np.histogram, counting chunks of the flattened array into
+    private bins as bincount_parallel_impl does. Uniform bins given by
+    their number are computed arithmetically, as are evenly spaced bin edge
+    arrays, others are bisected.
+    """
+    if not isinstance(a, types.npytypes.Array) or a.ndim == 0:
+        return None
+    if bins is None or isinstance(bins, types.Integer):
+        if range in (None, types.none):
+            def histogram_1(a, bins=10, range=None):
+                A = a.ravel()
+                n = len(A)
+                nchunks = numba.parfors.parfor.num_parallel_chunks(n)
+                minima = np.empty(nchunks, np.float64)
+                maxima = np.empty(nchunks, np.float64)
+                numba.parfors.parfor.init_prange()
+                for c in numba.parfors.parfor.internal_prange(nchunks):
+                    amin, amax = numba.parfors.parfor.hist_chunk_bounds(
+                        A, c * n // nchunks, (c + 1) * n // nchunks)
+                    minima[c] = amin
+                    maxima[c] = amax
+                return np.histogram(a, bins, (minima.min(), maxima.max()))
+
+            return histogram_1
+
+        def histogram_2(a, bins=10, range=None):
+            bin_min, bin_max = range
+            numba.parfors.parfor.hist_check_range(bins, bin_min, bin_max)
+            A = a.ravel()
+            n = len(A)
+            nchunks = numba.parfors.parfor.hist_num_chunks(n, bins)
+            if nchunks == 1 or not bin_max > bin_min:
+                return numba.parfors.parfor.histogram_serial(a, bins, range)
+            bin_ratio = bins / (bin_max - bin_min)
+            priv = np.zeros((nchunks, bins), np.intp)
+            numba.parfors.parfor.init_prange()
+            for c in numba.parfors.parfor.internal_prange(nchunks):
+                numba.parfors.parfor.hist_count_linear_chunk(
+                    A, priv, c, c * n // nchunks, (c + 1) * n // nchunks,
+                    bin_min, bin_max, bin_ratio)
+            hist = np.empty(bins, np.intp)
+            numba.parfors.parfor.init_prange()
+            for j in numba.parfors.parfor.internal_prange(bins):
+                hist[j] = numba.parfors.parfor.hist_merge_bin(priv, j)
+            return hist, np.linspace(bin_min, bin_max, bins + 1)
+
+        return histogram_2
+
+    if not (isinstance(bins, types.npytypes.Array) and bins.ndim == 1):
+        return None
+
+    def histogram_3(a, bins=10, range=None):
+        nbins = len(bins) - 1
+        A = a.ravel()
+        n = len(A)
+        nchunks = numba.parfors.parfor.hist_num_chunks(n, nbins)
+        if nchunks == 1 or nbins < 1:
+            return numba.parfors.parfor.histogram_serial(a, bins, range)
+        numba.parfors.parfor.hist_check_bins(bins)
+        if numba.np.arraymath._histogram_uniform_bins(bins):
+            bin_ratio = nbins / (bins[nbins] - bins[0])
+        else:
+            bin_ratio = 0.0
+        priv = np.zeros((nchunks, nbins), np.intp)
+        numba.parfors.parfor.init_prange()
+        for c in numba.parfors.parfor.internal_prange(nchunks):
+            numba.parfors.parfor.hist_count_edges_chunk(
+                A, bins, priv, c, c * n // nchunks, (c + 1) * n // nchunks,
+                bin_ratio)
+        hist = np.empty(nbins, np.intp)
+        numba.parfors.parfor.init_prange()
+        for j in numba.parfors.parfor.internal_prange(nbins):
+            hist[j] = numba.parfors.parfor.hist_merge_bin(priv, j)
+        return hist, bins
+
+    return histogram_3
+
 swap_functions_map = {
     ('argmin', 'numpy'): lambda r,a: argmin_parallel_impl,
     ('argmax', 'numpy'): lambda r,a: argmax_parallel_impl,
@@ -461,6 +1045,14 @@ swap_functions_map = {
     ('dot', 'numpy'): dot_parallel_impl,
     ('arange', 'numpy'): arange_parallel_impl,
     ('linspace', 'numpy'): linspace_parallel_impl,
+    ('sort', 'numpy'): sort_parallel_impl,
+    ('argsort', 'numpy'): argsort_parallel_impl,
+    ('cumsum', 'numpy'): cumsum_parallel_impl,
+    ('cumprod', 'numpy'): cumprod_parallel_impl,
+    ('parallel_scan', 'numba'): parallel_scan_parallel_impl,
+    ('parallel_scan', 'numba.misc.special'): parallel_scan_parallel_impl,
+    ('bincount', 'numpy'): bincount_parallel_impl,
+    ('histogram', 'numpy'): histogram_parallel_impl,
 }
 
 def fill_parallel_impl(return_type, arr, val):
@@ -482,8 +1074,23 @@ def fill_parallel_impl(return_type, arr, val):
             return None
     return fill_1
 
+def sort_inplace_parallel_impl(return_type, arr):
+    """Parallel implementation of ndarray.sort, see sort_parallel_impl.
+    """
+    if not _can_sort_parallel(arr):
+        return None
+
+    def sort_1(in_arr):
+        if len(in_arr) < numba.parfors.parfor._PARALLEL_SORT_MIN_SIZE:
+            numba.parfors.parfor.sort_serial(in_arr)
+        else:
+            in_arr[:] = np.sort(in_arr)
+        return None
+    return sort_1
+
 replace_functions_ndarray = {
     'fill': fill_parallel_impl,
+    'sort': sort_inplace_parallel_impl,
 }
 
 @register_jitable
@@ -598,6 +1205,9 @@ class Parfor(ir.Expr, ir.Stmt):
         # for this parfor.  This lowerer field will also prevent parfors from
         # being fused unless they have use the same lowerer.
         self.lowerer = None
+        # The loop schedule requested through prange(..., schedule=...).  If
+        # None, the schedule given in the parallel options is used instead.
+        self.schedule = None
         if config.DEBUG_ARRAY_OPT_STATS:
             fmt = 'Parallel for-loop #{} is produced from pattern \'{}\' at {}'
             print(fmt.format(
@@ -610,6 +1220,15 @@ class Parfor(ir.Expr, ir.Stmt):
     def get_loop_nest_vars(self):
         return [x.index_variable for x in self.loop_nests]
 
+    def get_schedule(self):
+        """get the loop schedule ("static", "dynamic" or "guided") used to
+        divide the iteration space of this parfor among the threads.
+        """
+        if self.schedule is not None:
+            return self.schedule
+        options = getattr(self.flags, 'auto_parallel', None)
+        return getattr(options, 'schedule', 'static')
+
     def list_vars(self):
         """list variables used (read/written) in this parfor by
         traversing the body and combining block uses.
@@ -1482,6 +2101,7 @@ class PreParforPass(object):
                             func_def = get_definition(self.func_ir, expr.func)
                             callname = find_callname(self.func_ir, expr)
                             repl_func = self.replace_functions_map.get(callname, None)
+                            args = expr.args
                             # Handle method on array type
                             if (repl_func is None and
                                 len(callname) == 2 and
@@ -1491,18 +2111,28 @@ class PreParforPass(object):
                                 repl_func = replace_functions_ndarray.get(callname[0], None)
                                 if repl_func is not None:
                                     # Add the array that the method is on to the arg list.
-                                    expr.args.insert(0, callname[1])
+                                    args = [callname[1]] + args
 
                             require(repl_func is not None)
-                            typs = tuple(self.typemap[x.name] for x in expr.args)
+                            typs = tuple(self.typemap[x.name] for x in args)
                             kws_typs = {k: self.typemap[x.name] for k, x in expr.kws}
                             try:
                                 new_func =  repl_func(lhs_typ, *typs, **kws_typs)
                             except:
                                 new_func = None
                             require(new_func is not None)
-                            # bind arguments to the new_func
-                            typs = utils.pysignature(new_func).bind(*typs, **kws_typs).args
+                            # Only rewrite the call once it is known to be
+                            # replaced, the original call must keep its
+                            # arguments otherwise.
+                            expr.args = args
+                            # bind arguments to the new_func, the inliner
+                            # passes omitted arguments their default values
+                            bound = utils.pysignature(new_func).bind(*typs, **kws_typs)
+                            bound.apply_defaults()
+                            typs = tuple(
+                                v if isinstance(v, types.Type) else
+                                types.unliteral(self.typingctx.resolve_value_type(v))
+                                for v in bound.args)
 
                             g = copy.copy(self.func_ir.func_id.func.__globals__)
                             g['numba'] = numba
@@ -1520,12 +2150,11 @@ class PreParforPass(object):
                                             typs, self.typemap, self.calltypes, work_list)
                             call_table = get_call_table(new_blocks, topological_ordering=False)
 
-                            # find the prange in the new blocks and record it for use in diagnostics
+                            # find the pranges in the new blocks and record them for use in diagnostics
                             for call in call_table:
                                 for k, v in call.items():
-                                    if v[0] == 'internal_prange':
+                                    if v and v[0] == 'internal_prange':
                                         swapped[k] = [callname, repl_func.__name__, func_def, block.body[i].loc]
-                                        break
                             return True
                         if guard(replace_func):
                             self.stats['replaced_func'] += 1
@@ -2120,16 +2749,29 @@ class ConvertNumpyPass:
             return False
         if call_name in ['zeros', 'ones']:
             return True
+        if call_name == 'empty' and self._first_touch_empty(expr):
+            return True
         if mod_name == 'numpy.random' and call_name in random_calls:
             return True
         # TODO: add more calls
         return False
 
+    def _first_touch_empty(self, expr):
+        """check if the array allocated by this np.empty() call should be
+        first touched in parallel, i.e. zero-filled by a parfor, so that its
+        pages are placed close to the pinned threads that use them.
+        """
+        if config.THREAD_AFFINITY == 'none':
+            return False
+        arr_typ = self.pass_states.calltypes[expr].return_type
+        return isinstance(arr_typ.dtype, (types.Number, types.Boolean))
+
     def _numpy_to_parfor(self, equiv_set, lhs, expr):
         call_name, mod_name = find_callname(self.pass_states.func_ir, expr)
         args = expr.args
         kws = dict(expr.kws)
-        if call_name in ['zeros', 'ones'] or mod_name == 'numpy.random':
+        if (call_name in ['zeros', 'ones', 'empty'] or
+                mod_name == 'numpy.random'):
             return self._numpy_map_to_parfor(equiv_set, call_name, lhs, args, kws, expr)
         # return error if we couldn't handle it (avoid rewrite infinite loop)
         raise errors.UnsupportedRewriteError(
@@ -2169,7 +2811,7 @@ class ConvertNumpyPass:
         index_var, index_var_typ = _make_index_var(
             pass_states.typemap, scope, index_vars, body_block)
 
-        if call_name == 'zeros':
+        if call_name in ('zeros', 'empty'):
             value = ir.Const(el_typ(0), loc)
         elif call_name == 'ones':
             value = ir.Const(el_typ(1), loc)
@@ -2636,6 +3278,7 @@ class ConvertLoopPass:
                                     equiv_set,
                                     ("prange", loop_kind, loop_replacing),
                                     pass_states.flags, races=races)
+                    parfor.schedule = self._get_loop_schedule(inst.value)
 
                     blocks[loop.header].body = [parfor]
                     # We have to insert the header_body after the parfor because in
@@ -2657,6 +3300,17 @@ class ConvertLoopPass:
                         print("parfor from loop")
                         parfor.dump()
 
+    def _get_loop_schedule(self, call):
+        """get the schedule requested by a prange(..., schedule=...) call or
+        None if the call doesn't specify one.
+        """
+        kws = dict(call.kws)
+        if 'schedule' not in kws:
+            return None
+        sched_typ = self.pass_states.typemap[kws['schedule'].name]
+        assert isinstance(sched_typ, types.StringLiteral)
+        return sched_typ.literal_value
+
     def _is_parallel_loop(self, func_var, call_table):
         # prange can be either getattr (numba.prange) or global (prange)
         if func_var not in call_table:
@@ -3081,6 +3735,9 @@ class ParforPreLoweringPass(ParforPassStates):
             lower_parfor_sequential(
                 self.typingctx, self.func_ir, self.typemap, self.calltypes, self.metadata)
         else:
+            # allocate the thread_local() arrays once per thread
+            hoist_thread_locals(self.func_ir.blocks, self.typemap,
+                                self.calltypes, self.typingctx)
             # prepare for parallel lowering
             # add parfor params to parfors here since lowering is destructive
             # changing the IR after this is not allowed
@@ -4155,6 +4812,15 @@ def try_fuse(equiv_set, parfor1, parfor2, metadata, func_ir, typemap):
         report = FusionReport(parfor1.id, parfor2.id, msg)
         return None, report
 
+    # fusion of parfors with different loop schedules is not possible
+    if parfor1.get_schedule() != parfor2.get_schedule():
+        dprint("try_fuse: parfors different schedules")
+        msg = "- fusion failed: loop schedule mismatch, %s != %s"
+        report = FusionReport(parfor1.id, parfor2.id,
+                              msg % (parfor1.get_schedule(),
+                                     parfor2.get_schedule()))
+        return None, report
+
     # fusion of parfors with different dimensions not supported yet
     if len(parfor1.loop_nests) != len(parfor2.loop_nests):
         dprint("try_fuse: parfors number of dimensions mismatch")
@@ -4996,6 +5662,203 @@ def _get_saved_call_nodes(fname, saved_globals, saved_getattrs, block_defs, rena
     nodes.reverse()
     return nodes
 
+def hoist_thread_locals(blocks, typemap, calltypes, typingctx):
+    """hoist thread_local() allocations out of the bodies of the outermost
+    parfors. For each allocation, an array with an extra leading dimension of
+    the number of threads is allocated in the init block of the parfor, and
+    the allocation in the loop body is replaced by the row of that array of
+    the executing thread. The shape may be built in the loop body, e.g. from
+    an inline tuple, as long as its sizes are constants or defined before the
+    loop; allocations with sizes computed in the loop body are left in place.
+    """
+    for block in blocks.values():
+        for _, parfor in _find_parfors(block.body):
+            _hoist_thread_locals_parfor(parfor, typemap, calltypes, typingctx)
+
+
+def _hoist_thread_locals_parfor(parfor, typemap, calltypes, typingctx):
+    from numba.np.ufunc.parallel import _iget_num_threads, _iget_thread_id
+
+    loop_defs = set()
+    _get_parfor_body_defs(parfor, loop_defs)
+    loop_values = _get_parfor_body_values(parfor)
+    scope = parfor.init_block.scope
+    loc = parfor.init_block.loc
+    init_nodes = []
+    num_threads_var = None
+    for block in _get_parfor_body_blocks(parfor):
+        new_body = []
+        for stmt in block.body:
+            if not (isinstance(stmt, ir.Assign) and
+                    _is_thread_local_call(stmt.value, typemap)):
+                new_body.append(stmt)
+                continue
+            call = stmt.value
+            shape_var = call.args[0] if call.args else dict(call.kws)['shape']
+            size_nodes = []
+            sizes = _get_thread_local_sizes(shape_var, loop_defs,
+                                            loop_values, typemap, scope, loc,
+                                            size_nodes)
+            if sizes is None:
+                msg = ("\nThe thread_local() allocation could not be hoisted "
+                       "out of the parallel loop because its shape is "
+                       "computed in the loop body. A new array is allocated "
+                       "in every iteration.")
+                warnings.warn(errors.NumbaPerformanceWarning(msg, stmt.loc))
+                new_body.append(stmt)
+                continue
+            if num_threads_var is None:
+                num_threads_var = _mk_parallel_intrinsic_call(
+                    _iget_num_threads, "$thread_local_num_threads", typemap,
+                    calltypes, typingctx, scope, loc, init_nodes)
+            init_nodes.extend(size_nodes)
+            # buf = np.empty((num_threads,) + shape, dtype)
+            arr_typ = typemap[stmt.target.name]
+            buf_typ = arr_typ.copy(ndim=arr_typ.ndim + 1)
+            buf_var = ir.Var(scope, mk_unique_var("$thread_local_buf"), loc)
+            typemap[buf_var.name] = buf_typ
+            init_nodes.extend(mk_alloc(typingctx, typemap, calltypes, buf_var,
+                                       (num_threads_var,) + tuple(sizes),
+                                       buf_typ.dtype, scope, loc, buf_typ))
+            # arr = buf[thread_id]
+            thread_id_var = _mk_parallel_intrinsic_call(
+                _iget_thread_id, "$thread_local_thread_id", typemap, calltypes,
+                typingctx, block.scope, stmt.loc, new_body)
+            getitem = ir.Expr.getitem(buf_var, thread_id_var, stmt.loc)
+            calltypes[getitem] = signature(arr_typ, buf_typ, types.intp)
+            new_body.append(ir.Assign(getitem, stmt.target, stmt.loc))
+        block.body = new_body
+    parfor.init_block.body.extend(init_nodes)
+
+
+def _get_parfor_body_defs(parfor, defs):
+    """add the names of all the variables assigned in the loop body of the
+    parfor, including its loop indices and nested parfors, to defs.
+    """
+    defs.update(l.index_variable.name for l in parfor.loop_nests)
+    for block in parfor.loop_body.values():
+        for stmt in block.body:
+            if isinstance(stmt, ir.Assign):
+                defs.add(stmt.target.name)
+            elif isinstance(stmt, Parfor):
+                defs.update(s.target.name for s in stmt.init_block.body
+                            if isinstance(s, ir.Assign))
+                _get_parfor_body_defs(stmt, defs)
+
+
+def _get_parfor_body_values(parfor):
+    """return a dict mapping the names of the variables assigned exactly once
+    in the loop body of the parfor, including nested parfors, to their value.
+    """
+    values = {}
+    assigned = set()
+    for block in _get_parfor_body_blocks(parfor):
+        for stmt in block.body:
+            if isinstance(stmt, ir.Assign):
+                name = stmt.target.name
+                if name in assigned:
+                    values.pop(name, None)
+                else:
+                    values[name] = stmt.value
+                    assigned.add(name)
+    return values
+
+
+def _get_parfor_body_blocks(parfor):
+    """yield the blocks of the loop body of the parfor, including the init
+    blocks and loop bodies of nested parfors.
+    """
+    for block in parfor.loop_body.values():
+        yield block
+        for _, inner in _find_parfors(block.body):
+            yield inner.init_block
+            yield from _get_parfor_body_blocks(inner)
+
+
+def _is_thread_local_call(expr, typemap):
+    if not (isinstance(expr, ir.Expr) and expr.op == 'call'):
+        return False
+    fnty = typemap[expr.func.name]
+    return (isinstance(fnty, types.Function) and
+            fnty.typing_key is thread_local)
+
+
+def _get_loop_value(var, loop_defs, loop_values):
+    """follow the copies of var in the loop body of a parfor and return the
+    variable defined outside the loop it refers to, or the value assigned to
+    it in the loop body, or None if it is assigned more than once.
+    """
+    while var.name in loop_defs:
+        value = loop_values.get(var.name)
+        if not isinstance(value, ir.Var):
+            return value
+        var = value
+    return var
+
+
+def _get_thread_local_sizes(shape_var, loop_defs, loop_values, typemap, scope,
+                            loc, nodes):
+    """return the sizes of the shape of a thread_local() allocation as a list
+    of ints and variables defined outside the parfor, or None if a size is
+    computed in the loop body. A shape tuple built in the loop body, e.g.
+    thread_local((n, 3), dtype), is rebuilt from its items.
+    """
+    shape_typ = typemap[shape_var.name]
+    if isinstance(shape_typ, types.BaseTuple):
+        size_typs = shape_typ.types
+    else:
+        size_typs = (shape_typ,)
+    if all(isinstance(t, types.IntegerLiteral) for t in size_typs):
+        return [t.literal_value for t in size_typs]
+    shape = _get_loop_value(shape_var, loop_defs, loop_values)
+    if isinstance(shape, ir.Expr) and shape.op == 'build_tuple':
+        items = shape.items
+    elif isinstance(shape, ir.Var):
+        if not isinstance(shape_typ, types.BaseTuple):
+            return [shape]
+        items = []
+        for i, size_typ in enumerate(size_typs):
+            size_var = ir.Var(scope, mk_unique_var("$thread_local_size"), loc)
+            typemap[size_var.name] = size_typ
+            getitem = ir.Expr.static_getitem(shape, i, None, loc)
+            nodes.append(ir.Assign(getitem, size_var, loc))
+            items.append(size_var)
+        return items
+    elif not isinstance(shape_typ, types.BaseTuple):
+        items = [shape_var]
+    else:
+        return None
+    sizes = []
+    for item, size_typ in zip(items, size_typs):
+        if isinstance(size_typ, types.IntegerLiteral):
+            sizes.append(size_typ.literal_value)
+            continue
+        size = _get_loop_value(item, loop_defs, loop_values)
+        if isinstance(size, ir.Const) and isinstance(size.value, int):
+            size = size.value
+        elif not isinstance(size, ir.Var):
+            return None
+        sizes.append(size)
+    return sizes
+
+
+def _mk_parallel_intrinsic_call(fn, name, typemap, calltypes, typingctx,
+                                scope, loc, nodes):
+    """append the nodes of a call to the threading intrinsic fn, that takes
+    no argument and returns an intp, to nodes and return the result variable.
+    """
+    fnty = typingctx.resolve_value_type(fn)
+    fn_var = ir.Var(scope, mk_unique_var("$" + fn.__name__), loc)
+    typemap[fn_var.name] = fnty
+    nodes.append(ir.Assign(ir.Global(fn.__name__, fn, loc), fn_var, loc))
+    call = ir.Expr.call(fn_var, [], (), loc)
+    calltypes[call] = fnty.get_call_type(typingctx, (), {})
+    res_var = ir.Var(scope, mk_unique_var(name), loc)
+    typemap[res_var.name] = types.intp
+    nodes.append(ir.Assign(call, res_var, loc))
+    return res_var
+
+
 def repr_arrayexpr(arrayexpr):
     """Extract operators from arrayexpr to represent it abstractly as a string.
     """
@@ -40,6 +40,10 @@ from numba.core.errors import (
 )
 from numba.parfors.parfor_lowering_utils import ParforLoweringBuilder
 
+# The loop schedules, matching the NUMBA_SCHEDULE_* values of
+# numba/np/ufunc/gufunc_scheduler.h
+_parallel_schedules = {"static": 0, "dynamic": 1, "guided": 2}
+
 
 class ParforLower(lowering.Lower):
     """This is a custom lowering class that extends standard lowering so as
@@ -383,7 +387,8 @@ def _lower_parfor_parallel_std(lowerer, parfor):
         parfor.init_block,
         index_var_typ,
         parfor.races,
-        exp_name_to_tuple_var)
+        exp_name_to_tuple_var,
+        schedule=parfor.get_schedule())
 
     if nredvars > 0:
         _parfor_lowering_finalize_reduction(
@@ -567,14 +572,6 @@ def _emit_binop_reduce_call(binop, lowerer, thread_count_var, reduce_info):
             c *= redarr[i]
         return c
 
-    kernel = {
-        operator.iadd: reduction_add,
-        operator.isub: reduction_add,
-        operator.imul: reduction_mul,
-        operator.ifloordiv: reduction_mul,
-        operator.itruediv: reduction_mul,
-    }[binop]
-
     ctx = lowerer.context
     builder = lowerer.builder
     redarr_typ = reduce_info.redarr_typ
@@ -596,13 +593,147 @@ def _emit_binop_reduce_call(binop, lowerer, thread_count_var, reduce_info):
     arg_thread_count = lowerer.loadvar(thread_count_var.name)
     args = (arg_thread_count, arg_arr, reduce_info.init_val)
     sig = signature(
-        reduce_info.redvar_typ, types.uintp, redarr_typ, reduce_info.redvar_typ,
+        reduce_info.redvar_typ, types.intp, redarr_typ, reduce_info.redvar_typ,
     )
 
+    op = _reduce_binop_kind[binop]
+    redvar_typ = reduce_info.redvar_typ
+    if isinstance(redvar_typ, types.Array) and redvar_typ.ndim > 0:
+        kernel = _get_array_reduce_kernel(op, ctx, sig)
+    else:
+        kernel = {
+            "add": reduction_add,
+            "mul": reduction_mul,
+        }[op]
+
     redvar_result = ctx.compile_internal(builder, kernel, sig, args)
     return redvar_result
 
 
+# How the per-thread partial results of an inplace-binop reduction are
+# combined. Subtraction and division reductions accumulate negated and
+# reciprocal partials respectively.
+_reduce_binop_kind = {
+    operator.iadd: "add",
+    operator.isub: "add",
+    operator.imul: "mul",
+    operator.ifloordiv: "mul",
+    operator.itruediv: "mul",
+}
+
+# Array reductions with at least this many elements are combined by a
+# parallel loop over the elements rather than on the calling thread.
+_PARALLEL_COMBINE_MIN_SIZE = 1 << 15
+
+# The parallel combine kernels by operator. The kernels take flattened
+# arrays, so each is compiled once per dtype and shared by the reductions of
+# any dimension.
+_parallel_combine_cache = {}
+
+
+def _get_parallel_combine(op, sig):
+    """Get the kernel folding the rows of a ``(thread_count, out.size)``
+    reduction buffer into the flattened C-contiguous array ``out``, with the
+    elements split between the threads, and its compile result for *sig*.
+
+    The kernels are compiled lazily as this module is imported while numba
+    itself is being initialized.
+    """
+    disp = _parallel_combine_cache.get(op)
+    if disp is None:
+        disp = _parallel_combine_cache[op] = _make_parallel_combine(op)
+    cres = disp.overloads.get(sig.args)
+    if cres is None:
+        disp.compile(sig)
+        cres = disp.overloads[sig.args]
+    return disp, cres
+
+
+def _make_parallel_combine(op):
+    """Make the parallel combine kernel of the reduction operator *op*.
+    """
+    from numba import njit, prange
+
+    if op == "add":
+        def parallel_combine(thread_count, src, dst):
+            for j in prange(dst.size):
+                acc = dst[j]
+                for i in range(thread_count):
+                    acc += src[i, j]
+                dst[j] = acc
+    else:
+        def parallel_combine(thread_count, src, dst):
+            for j in prange(dst.size):
+                acc = dst[j]
+                for i in range(thread_count):
+                    acc *= src[i, j]
+                dst[j] = acc
+
+    return njit(parallel=True)(parallel_combine)
+
+
+def _get_array_reduce_kernel(op, ctx, sig):
+    """Get the kernel combining the per-thread partial arrays of an array
+    reduction into the reduction variable.
+
+    The partial arrays are folded pairwise in the reduction buffer, so the
+    combine is a tree of depth ``log2(thread_count)`` whose levels are
+    whole-row array operations. Large C-contiguous reductions are instead
+    combined by all threads, each taking a share of the elements.
+    """
+    thread_count_typ, redarr_typ, redvar_typ = sig.args
+    use_parallel = redvar_typ.layout == "C"
+    if use_parallel:
+        combine_sig = signature(types.none, thread_count_typ,
+                                redarr_typ.copy(ndim=2),
+                                redvar_typ.copy(ndim=1))
+        parallel_combine, cres = _get_parallel_combine(op, combine_sig)
+        # The kernel may have been compiled by another target context, so
+        # make its implementation known to this one.
+        ctx.insert_user_function(cres.entry_point, cres.fndesc,
+                                 [cres.library])
+    else:
+        parallel_combine = None
+    min_size = _PARALLEL_COMBINE_MIN_SIZE
+
+    if op == "add":
+        def reduction_array(thread_count, redarr, init):
+            if use_parallel and init.size >= min_size:
+                parallel_combine(
+                    thread_count,
+                    redarr.reshape((thread_count, init.size)),
+                    init.reshape(init.size))
+                return init
+            step = 1
+            while step < thread_count:
+                for i in range(0, thread_count - step, 2 * step):
+                    row = redarr[i]
+                    row += redarr[i + step]
+                step *= 2
+            c = init
+            c += redarr[0]
+            return c
+    else:
+        def reduction_array(thread_count, redarr, init):
+            if use_parallel and init.size >= min_size:
+                parallel_combine(
+                    thread_count,
+                    redarr.reshape((thread_count, init.size)),
+                    init.reshape(init.size))
+                return init
+            step = 1
+            while step < thread_count:
+                for i in range(0, thread_count - step, 2 * step):
+                    row = redarr[i]
+                    row *= redarr[i + step]
+                step *= 2
+            c = init
+            c *= redarr[0]
+            return c
+
+    return reduction_array
+
+
 def _is_inplace_binop_and_rhs_is_init(inst, redvar_name):
     """Is ``inst`` an inplace-binop and the RHS is the reduction init?
     """
@@ -1604,7 +1735,7 @@ def replace_var_with_array(vars, loop_body, typemap, calltypes):
 
 def call_parallel_gufunc(lowerer, cres, gu_signature, outer_sig, expr_args, expr_arg_types,
                          loop_ranges, redvars, reddict, redarrdict, init_block, index_var_typ, races,
-                         exp_name_to_tuple_var):
+                         exp_name_to_tuple_var, schedule="static"):
     '''
     Adds the call to the gufunc function from the main function.
     '''
@@ -1731,6 +1862,17 @@ def call_parallel_gufunc(lowerer, cres, gu_signature, outer_sig, expr_args, expr
     num_threads = builder.call(get_num_threads, [])
     current_chunksize = builder.call(get_chunksize, [])
 
+    # Select the loop schedule for the scheduling and launch of this parfor.
+    # The static schedule is the default so it doesn't need to be set.
+    if schedule != "static":
+        set_schedule = cgutils.get_or_insert_function(
+            builder.module,
+            llvmlite.ir.FunctionType(uintp_t, [uintp_t]),
+            name="set_parallel_schedule")
+        schedule_kind = context.get_constant(types.uintp,
+                                             _parallel_schedules[schedule])
+        current_schedule = builder.call(set_schedule, [schedule_kind])
+
     with cgutils.if_unlikely(builder, builder.icmp_signed('<=', num_threads,
                                                   num_threads.type(0))):
         cgutils.printf(builder, "num_threads: %d\n", num_threads)
@@ -1747,7 +1889,6 @@ def call_parallel_gufunc(lowerer, cres, gu_signature, outer_sig, expr_args, expr
                                                   context.get_constant(types.uintp, num_dim),
                                                   dim_starts,
                                                   dim_stops])
-    builder.call(set_chunksize, [zero])
 
     multiplier = context.get_constant(types.uintp, num_dim * 2)
     sched_size = builder.mul(num_divisions, multiplier)
@@ -1771,6 +1912,9 @@ def call_parallel_gufunc(lowerer, cres, gu_signature, outer_sig, expr_args, expr
                 types.uintp, num_dim), dim_starts, dim_stops, num_divisions,
             sched, context.get_constant(
                     types.intp, debug_flag)])
+    # The chunksize is reset after the scheduling so that parallel regions
+    # nested in the kernel don't inherit it.
+    builder.call(set_chunksize, [zero])
 
     # Get the LLVM vars for the Numba IR reduction array vars.
     redarrs = [lowerer.loadvar(redarrdict[x].name) for x in redvars]
@@ -1963,6 +2107,8 @@ def call_parallel_gufunc(lowerer, cres, gu_signature, outer_sig, expr_args, expr
         cgutils.printf(builder, "after calling kernel %p\n", fn)
 
     builder.call(set_chunksize, [current_chunksize])
+    if schedule != "static":
+        builder.call(set_schedule, [current_schedule])
 
     for k, v in rv_to_arg_dict.items():
         arg, rv_arg = v
@@ -24,7 +24,7 @@ __all__ = ['Compiler']
 NULL = ir.Constant(lt._void_star, None)
 ZERO = ir.Constant(lt._int32, 0)
 ONE = ir.Constant(lt._int32, 1)
-METH_VARARGS_AND_KEYWORDS = ir.Constant(lt._int32, 1|2)
+METH_FASTCALL_AND_KEYWORDS = ir.Constant(lt._int32, 0x0080|2)
 
 
 def get_header():
@@ -244,7 +244,7 @@ class _ModuleCompiler(object):
             method_def_const = ir.Constant.literal_struct(
                 (method_name,
                  ir.Constant.bitcast(lfunc, lt._void_star),
-                 METH_VARARGS_AND_KEYWORDS,
+                 METH_FASTCALL_AND_KEYWORDS,
                  NULL))
             method_defs.append(method_def_const)
 
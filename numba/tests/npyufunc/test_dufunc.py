@@ -87,6 +87,44 @@ class TestDUFunc(MemoryLeakMixin, unittest.TestCase):
         self.assertEqual(duadd.ntypes, len(duadd.types))
 
 
+class TestParallelDUFunc(MemoryLeakMixin, unittest.TestCase):
+
+    _numba_parallel_test_ = False
+
+    def test_lazy_compile(self):
+        @vectorize(target='parallel')
+        def duadd(a0, a1):
+            return a0 + a1
+
+        self.assertIsInstance(duadd, dufunc.ParallelDUFunc)
+        self.assertEqual(duadd.ntypes, 0)
+        X = np.arange(1000).reshape((10, 100))
+        np.testing.assert_array_equal(duadd(X, X), X + X)
+        self.assertEqual(duadd.ntypes, 1)
+        Y = np.linspace(0, 1, 1000)
+        np.testing.assert_array_equal(duadd(Y, Y), Y + Y)
+        self.assertEqual(duadd.ntypes, 2)
+        self.assertEqual(duadd(1, 2), 3)
+
+    def test_npm_call(self):
+        duadd = vectorize(target='parallel')(pyuadd)
+
+        @njit
+        def npmadd(a0, a1):
+            return duadd(a0, a1)
+
+        X = np.linspace(0, 1.9, 20)
+        np.testing.assert_array_equal(npmadd(X, X), X + X)
+
+    def test_pickling(self):
+        duadd = vectorize(target='parallel')(pyuadd)
+        X = np.arange(100.)
+        duadd(X, X)
+        rebuilt = pickle.loads(pickle.dumps(duadd))
+        self.assertIsInstance(rebuilt, dufunc.ParallelDUFunc)
+        np.testing.assert_array_equal(rebuilt(X, X), X + X)
+
+
 class TestDUFuncPickling(MemoryLeakMixin, unittest.TestCase):
     def check(self, ident, result_type):
         buf = pickle.dumps(ident)
@@ -5,6 +5,7 @@ import numpy as np
 
 from numba import void, float32, int64, jit, guvectorize
 from numba.np.ufunc import GUVectorize
+from numba.np.ufunc.gufunc import ParallelGUFunc
 from numba.tests.support import tag, TestCase
 
 
@@ -264,6 +265,16 @@ class TestDynamicGUFunc(TestCase):
         self.assertPreciseEqual(x, np.array([2, 4, 3, 4]))
 
 
+class TestDynamicGUFuncParallel(TestDynamicGUFunc):
+    _numba_parallel_test_ = False
+    target = 'parallel'
+
+    def test_parallel_gufunc_type(self):
+        gufunc = GUVectorize(matmulcore, '(m,n),(n,p)->(m,p)',
+                             target=self.target, is_dynamic=True)
+        self.assertIsInstance(gufunc, ParallelGUFunc)
+
+
 class TestGUVectorizeScalar(TestCase):
     """
     Nothing keeps user from out-of-bound memory access
@@ -2,7 +2,8 @@ from itertools import product, combinations_with_replacement
 
 import numpy as np
 
-from numba import jit, typeof
+from numba import jit, typeof, parallel_scan
+from numba.core.errors import TypingError
 from numba.core.compiler import compile_isolated
 from numba.np.numpy_support import numpy_version
 from numba.tests.support import TestCase, MemoryLeakMixin, tag
@@ -615,6 +616,25 @@ class TestArrayReductions(MemoryLeakMixin, TestCase):
     def test_array_cumprod_global(self):
         self.check_cumulative(array_cumprod_global)
 
+    def test_parallel_scan(self):
+        @jit(nopython=True)
+        def op(a, b):
+            return max(a, b)
+
+        def pyfunc(arr):
+            return parallel_scan(op, arr)
+
+        cfunc = jit(nopython=True)(pyfunc)
+        for arr in (np.array([3, 1, 4, 1, 5, 9, 2, 6]),
+                    np.linspace(2, 8, 6)[::-1], np.zeros(0)):
+            self.assertPreciseEqual(cfunc(arr), pyfunc(arr))
+            self.assertPreciseEqual(cfunc(arr), np.maximum.accumulate(arr))
+
+        with self.assertRaises(TypingError) as raises:
+            cfunc(np.zeros((2, 2)))
+        self.assertIn('Argument "arr" must be a 1D array',
+                      str(raises.exception))
+
     def check_aggregation_magnitude(self, pyfunc, is_prod=False):
         """
         Check that integer overflows are avoided (issue #931).
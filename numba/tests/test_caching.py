@@ -10,9 +10,15 @@ import sys
 import traceback
 import unittest
 import warnings
+from unittest import mock
 from numba import njit
-from numba.core import codegen
-from numba.core.caching import _UserWideCacheLocator
+from numba.core import caching, codegen
+from numba.core.caching import (
+    _UserWideCacheLocator,
+    evict_cache_dir,
+    find_dependency_files,
+    gc_cache_dir,
+)
 from numba.core.errors import NumbaWarning
 from numba.parfors import parfor
 from numba.tests.support import (
@@ -834,6 +840,310 @@ class TestMultiprocessCache(BaseCacheTest):
         self.assertEqual(res, n * (n - 1) // 2)
 
 
+class TestSQLiteCache(DispatcherCacheUsecasesTest):
+    """
+    Tests for the single database cache store (NUMBA_CACHE_BACKEND=sqlite).
+    """
+
+    def setUp(self):
+        super().setUp()
+        # Set through the environment so that the subprocesses use the
+        # same store.
+        cm = override_env_config('NUMBA_CACHE_BACKEND', 'sqlite')
+        cm.__enter__()
+        self.addCleanup(cm.__exit__, None, None, None)
+
+    def test_caching(self):
+        self.check_pycache(0)
+        mod = self.import_module()
+        self.check_pycache(0)
+
+        f = mod.add_usecase
+        self.assertPreciseEqual(f(2, 3), 6)
+        self.assertPreciseEqual(f(2.5, 3), 6.5)
+        # All entries are in a single file
+        self.assertEqual(self.cache_contents(), ['index.nbdb'])
+        self.check_hits(f, 0, 2)
+
+        f = mod.add_objmode_usecase
+        self.assertPreciseEqual(f(2, 3), 6)
+        self.check_hits(f, 0, 1)
+        self.check_pycache(1)
+
+        mod = self.import_module()
+        f = mod.add_usecase
+        self.assertPreciseEqual(f(2, 3), 6)
+        self.assertPreciseEqual(f(2.5, 3), 6.5)
+        self.check_hits(f, 2, 0)
+
+        # Check the code runs ok from another process
+        self.run_in_separate_process()
+
+    def test_cache_invalidate(self):
+        mod = self.import_module()
+        f = mod.add_usecase
+        self.assertPreciseEqual(f(2, 3), 6)
+
+        # This should change the functions' results
+        with open(self.modfile, "a") as f:
+            f.write("\nZ = 10\n")
+
+        mod = self.import_module()
+        f = mod.add_usecase
+        self.assertPreciseEqual(f(2, 3), 15)
+        self.check_hits(f, 0, 1)
+
+    def test_recompile(self):
+        mod = self.import_module()
+        f = mod.add_usecase
+        self.assertPreciseEqual(f(2, 3), 6)
+
+        mod = self.import_module()
+        f = mod.add_usecase
+        mod.Z = 10
+        self.assertPreciseEqual(f(2, 3), 6)
+        f.recompile()
+        self.assertPreciseEqual(f(2, 3), 15)
+
+        # Freshly recompiled version is re-used from other imports
+        mod = self.import_module()
+        f = mod.add_usecase
+        self.assertPreciseEqual(f(2, 3), 15)
+        self.check_hits(f, 1, 0)
+
+    def test_max_size(self):
+        import sqlite3
+
+        with override_config('CACHE_MAX_SIZE', 1):
+            mod = self.import_module()
+            mod.add_usecase(2, 3)
+            mod.add_usecase(2.5, 3)
+        # Each save evicts all the entries
+        conn = sqlite3.connect(os.path.join(self.cache_dir, 'index.nbdb'))
+        try:
+            (count,), = conn.execute("SELECT COUNT(*) FROM overloads")
+        finally:
+            conn.close()
+        self.assertEqual(count, 0)
+
+    def test_unknown_backend(self):
+        with override_config('CACHE_BACKEND', 'nonexistent'):
+            with self.assertRaises(ValueError) as raises:
+                self.import_module()
+        self.assertIn("Unknown cache backend 'nonexistent'",
+                      str(raises.exception))
+
+
+class TestCacheWarming(DispatcherCacheUsecasesTest):
+    """
+    Tests for recording signatures with NUMBA_CACHE_TRACE and populating
+    the cache from them with `numba --warm-cache`.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.trace_file = os.path.join(self.tempdir, "trace.jsonl")
+        cm = override_env_config('NUMBA_CACHE_TRACE', self.trace_file)
+        cm.__enter__()
+        self.addCleanup(cm.__exit__, None, None, None)
+
+    def run_warm_cache(self, *args):
+        env = os.environ.copy()
+        env.pop('NUMBA_CACHE_TRACE')
+        env['PYTHONPATH'] = os.pathsep.join(
+            [self.tempdir] + [p for p in sys.path if p])
+        cmd = [sys.executable, "-m", "numba", "--warm-cache", self.trace_file]
+        return subprocess.run(cmd + list(args), stdout=subprocess.PIPE,
+                              stderr=subprocess.PIPE, env=env, timeout=600)
+
+    def test_trace_signatures(self):
+        mod = self.import_module()
+        mod.add_usecase(2, 3)
+        mod.add_usecase(2.5, 3)
+        mod.add_usecase(2, 3)
+        # Functions that are not cached are not traced
+        mod.add_nocache_usecase(2, 3)
+        with open(self.trace_file) as f:
+            self.assertEqual(len(f.readlines()), 2)
+
+        from numba.core.caching import load_cache_trace
+        trace = load_cache_trace(self.trace_file)
+        self.assertEqual(list(trace), [(self.modname, 'add_usecase')])
+        sigs = trace[self.modname, 'add_usecase']
+        self.assertEqual([str(sig) for sig in sigs],
+                         ['(int64, int64)', '(float64, int64)'])
+
+    def test_warm_cache(self):
+        mod = self.import_module()
+        self.assertPreciseEqual(mod.add_usecase(2, 3), 6)
+        self.assertPreciseEqual(mod.add_usecase(2.5, 3), 6.5)
+        self.assertPreciseEqual(mod.outer(2, 3), 0)
+        shutil.rmtree(self.cache_dir)
+
+        res = self.run_warm_cache("-j", "2")
+        self.assertEqual(res.returncode, 0, res.stderr.decode())
+        # The callee of outer() is traced too
+        self.assertIn("Warmed 4 signature(s) of 3 function(s)",
+                      res.stdout.decode())
+
+        mod = self.import_module()
+        f = mod.add_usecase
+        self.assertPreciseEqual(f(2, 3), 6)
+        self.assertPreciseEqual(f(2.5, 3), 6.5)
+        self.check_hits(f, 2, 0)
+        f = mod.outer
+        self.assertPreciseEqual(f(2, 3), 0)
+        self.check_hits(f, 1, 0)
+
+    def test_warm_cache_failure(self):
+        with open(self.trace_file, "w") as f:
+            f.write('{"module": "%s", "qualname": "nonexistent", '
+                    '"signature": "()", "argtypes": "gAUpLg=="}\n'
+                    % self.modname)
+        res = self.run_warm_cache()
+        self.assertEqual(res.returncode, 1)
+        self.assertIn("nonexistent(): failed, AttributeError",
+                      res.stdout.decode())
+
+
+class TestCacheGC(DispatcherCacheUsecasesTest):
+    """
+    Tests for the cache size cap and garbage collection.
+    """
+
+    def data_files(self):
+        return sorted(fn for fn in self.cache_contents()
+                      if fn.endswith('.nbc'))
+
+    def test_gc_fresh(self):
+        mod = self.import_module()
+        mod.add_usecase(2, 3)
+        mod.add_usecase(2.5, 3)
+        self.check_pycache(3)
+        self.assertEqual(gc_cache_dir(self.cache_dir), [])
+        self.check_pycache(3)
+
+    def test_gc_stale_source(self):
+        mod = self.import_module()
+        mod.add_usecase(2, 3)
+        mod.simple_usecase(2)
+        self.check_pycache(4)
+        # Changing the source invalidates all the entries of the file
+        with open(self.modfile, "a") as f:
+            f.write("\nZ = 10\n")
+        removed = gc_cache_dir(self.cache_dir)
+        self.assertEqual(len(removed), 4)
+        self.check_pycache(0)
+
+    def test_gc_other_stamp_mode(self):
+        # The index is checked with the stamp mode it was written with
+        with override_config('CACHE_SOURCE_STAMP', 'hash'):
+            mod = self.import_module()
+            mod.add_usecase(2, 3)
+            mod.add_usecase(2.5, 3)
+        self.check_pycache(3)
+        with override_config('CACHE_SOURCE_STAMP', 'mtime'):
+            self.assertEqual(gc_cache_dir(self.cache_dir), [])
+        self.check_pycache(3)
+        # Touching the source doesn't change its hash
+        st = os.stat(self.modfile)
+        os.utime(self.modfile, (st.st_atime, st.st_mtime + 10))
+        with override_config('CACHE_SOURCE_STAMP', 'mtime'):
+            self.assertEqual(gc_cache_dir(self.cache_dir), [])
+        self.check_pycache(3)
+        with open(self.modfile, "a") as f:
+            f.write("\nZ = 10\n")
+        with override_config('CACHE_SOURCE_STAMP', 'mtime'):
+            self.assertEqual(len(gc_cache_dir(self.cache_dir)), 3)
+        self.check_pycache(0)
+
+    def test_gc_orphan_data(self):
+        mod = self.import_module()
+        mod.add_usecase(2, 3)
+        index, = [fn for fn in self.cache_contents() if fn.endswith('.nbi')]
+        orphan = index[:-len('.nbi')] + '.42.nbc'
+        with open(os.path.join(self.cache_dir, orphan), 'wb') as f:
+            f.write(b'x' * 10)
+        removed = gc_cache_dir(self.cache_dir)
+        self.assertEqual(removed, [(os.path.join(self.cache_dir, orphan), 10)])
+        self.check_pycache(2)
+
+    def test_evict_least_recently_loaded(self):
+        mod = self.import_module()
+        mod.add_usecase(2, 3)
+        mod.add_usecase(2.5, 3)
+        data_files = self.data_files()
+        self.assertEqual(len(data_files), 2)
+        # Make all entries look like they were loaded long ago, then load
+        # one of them.
+        for fn in data_files:
+            path = os.path.join(self.cache_dir, fn)
+            os.utime(path, (0, os.stat(path).st_mtime))
+        mtimes = self.get_cache_mtimes()
+        mod = self.import_module()
+        f = mod.add_usecase
+        self.assertPreciseEqual(f(2, 3), 6)
+        self.check_hits(f, 1, 0)
+        # Loading doesn't change the modification times
+        self.assertEqual(self.get_cache_mtimes(), mtimes)
+
+        total = sum(os.path.getsize(os.path.join(self.cache_dir, fn))
+                    for fn in self.cache_contents())
+        removed = evict_cache_dir(self.cache_dir, total - 1)
+        self.assertEqual(len(removed), 1)
+        self.check_pycache(2)
+
+        mod = self.import_module()
+        f = mod.add_usecase
+        self.assertPreciseEqual(f(2, 3), 6)
+        self.assertPreciseEqual(f(2.5, 3), 6.5)
+        self.check_hits(f, 1, 1)
+
+    def test_max_size(self):
+        with override_config('CACHE_MAX_SIZE', 1):
+            mod = self.import_module()
+            mod.add_usecase(2, 3)
+            mod.add_usecase(2.5, 3)
+        # Only the index remains
+        self.assertEqual(self.data_files(), [])
+        self.check_pycache(1)
+
+    def test_max_size_estimate(self):
+        # The directory is only scanned on the first save while it is
+        # estimated to be under the limit.
+        caching._cache_dir_sizes.clear()
+        scan = mock.Mock(wraps=caching._evict_cache_dir)
+        with override_config('CACHE_MAX_SIZE', 1 << 30), \
+                mock.patch.object(caching, '_evict_cache_dir', scan):
+            mod = self.import_module()
+            mod.add_usecase(2, 3)
+            mod.add_usecase(2.5, 3)
+            mod.simple_usecase(2)
+        self.assertEqual(scan.call_count, 1)
+        self.check_pycache(5)
+
+    def test_cli(self):
+        mod = self.import_module()
+        mod.add_usecase(2, 3)
+        with open(self.modfile, "a") as f:
+            f.write("\nZ = 10\n")
+        cmd = [sys.executable, "-m", "numba", "--cache-gc", self.cache_dir]
+        res = subprocess.run(cmd, stdout=subprocess.PIPE,
+                             stderr=subprocess.PIPE, timeout=600)
+        self.assertEqual(res.returncode, 0, res.stderr.decode())
+        self.assertIn("Freed", res.stdout.decode())
+        self.check_pycache(0)
+
+
+class TestSQLiteMultiprocessCache(TestMultiprocessCache):
+
+    def setUp(self):
+        super().setUp()
+        cm = override_env_config('NUMBA_CACHE_BACKEND', 'sqlite')
+        cm.__enter__()
+        self.addCleanup(cm.__exit__, None, None, None)
+
+
 @skip_if_typeguard
 class TestCacheFileCollision(unittest.TestCase):
     _numba_parallel_test_ = False
@@ -1017,6 +1327,202 @@ def function2(x):
         self.assertEqual(popen.returncode, 0, msg)
 
 
+class TestCacheSourceStamps(TestCase):
+    """
+    Tests for the invalidation of cache entries when the source of the
+    function or of its callees in other files changes.
+    """
+
+    _numba_parallel_test_ = False
+
+    source_text_caller = """
+from numba import njit
+import callee_mod
+from callee_mod import callee
+
+@njit(cache=True)
+def caller(x):
+    return callee(x)
+
+@njit(cache=True)
+def caller_attr(x):
+    return callee_mod.callee(x)
+
+print(caller(1), caller_attr(1),
+      sum(caller.stats.cache_hits.values()),
+      sum(caller_attr.stats.cache_hits.values()))
+"""
+    source_text_callee = """
+from numba import njit
+
+@njit(cache=True)
+def callee(x):
+    return x + %d
+"""
+
+    def setUp(self):
+        self.tempdir = temp_directory('test_cache_source_stamps')
+        self.caller_file = os.path.join(self.tempdir, 'caller_mod.py')
+        with open(self.caller_file, 'w') as fout:
+            fout.write(self.source_text_caller)
+        self.callee_file = os.path.join(self.tempdir, 'callee_mod.py')
+        self.write_callee(1)
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def write_callee(self, value):
+        with open(self.callee_file, 'w') as fout:
+            fout.write(self.source_text_callee % value)
+
+    def run_caller(self, **env_vars):
+        env = os.environ.copy()
+        env.update(env_vars)
+        env['PYTHONPATH'] = os.pathsep.join(
+            [self.tempdir] + [p for p in sys.path if p])
+        res = subprocess.run([sys.executable, self.caller_file],
+                             stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                             env=env, timeout=600)
+        self.assertEqual(res.returncode, 0, res.stderr.decode())
+        return [int(x) for x in res.stdout.decode().split()]
+
+    def test_callee_changed(self):
+        self.assertEqual(self.run_caller(), [2, 2, 0, 0])
+        self.assertEqual(self.run_caller(), [2, 2, 1, 1])
+        # A change to the callee in another file invalidates the callers
+        self.write_callee(2)
+        self.assertEqual(self.run_caller(), [3, 3, 0, 0])
+        self.assertEqual(self.run_caller(), [3, 3, 1, 1])
+
+    def test_find_dependency_files(self):
+        sys.path.insert(0, self.tempdir)
+        try:
+            mod = import_dynamic('callee_mod')
+        finally:
+            sys.path.remove(self.tempdir)
+            sys.modules.pop('callee_mod', None)
+
+        def caller(x):
+            return mod.callee(x)
+
+        self.assertEqual(find_dependency_files(caller), [self.callee_file])
+        self.assertEqual(find_dependency_files(mod.callee.py_func), [])
+
+    def test_mtime_stamp(self):
+        self.assertEqual(self.run_caller(), [2, 2, 0, 0])
+        # Touching the file invalidates the entries
+        st = os.stat(self.caller_file)
+        os.utime(self.caller_file, (st.st_atime, st.st_mtime + 10))
+        self.assertEqual(self.run_caller(), [2, 2, 0, 0])
+
+    def test_hash_stamp(self):
+        self.assertEqual(self.run_caller(NUMBA_CACHE_SOURCE_STAMP='hash'),
+                         [2, 2, 0, 0])
+        # Touching the files (e.g. a fresh checkout) keeps the entries
+        for path in (self.caller_file, self.callee_file):
+            st = os.stat(path)
+            os.utime(path, (st.st_atime, st.st_mtime + 10))
+        self.assertEqual(self.run_caller(NUMBA_CACHE_SOURCE_STAMP='hash'),
+                         [2, 2, 1, 1])
+        # The entries are checked the way they were stamped, whatever the
+        # current mode
+        self.assertEqual(self.run_caller(NUMBA_CACHE_SOURCE_STAMP='mtime'),
+                         [2, 2, 1, 1])
+        # Changing the contents invalidates them
+        self.write_callee(2)
+        self.assertEqual(self.run_caller(NUMBA_CACHE_SOURCE_STAMP='hash'),
+                         [3, 3, 0, 0])
+
+    def test_hash_memoized(self):
+        # The hash of a file is computed once per modification time and size
+        sha256 = mock.Mock(wraps=caching.hashlib.sha256)
+        with mock.patch.object(caching.hashlib, 'sha256', sha256):
+            stamp = caching._source_file_stamp(self.callee_file, 'hash')
+            self.assertEqual(
+                caching._source_file_stamp(self.callee_file, 'hash'), stamp)
+            self.assertEqual(sha256.call_count, 1)
+            self.write_callee(22)
+            self.assertNotEqual(
+                caching._source_file_stamp(self.callee_file, 'hash'), stamp)
+            self.assertEqual(sha256.call_count, 2)
+
+
+class TestOverloadCache(TestCase):
+    """
+    Tests for the caching of `@overload` implementations across processes
+    (NUMBA_CACHE_OVERLOADS).
+    """
+
+    _numba_parallel_test_ = False
+
+    source_text = """
+from numba import njit
+from numba.core import types
+from numba.extending import overload
+
+def scale(x, k):
+    pass
+
+@overload(scale)
+def ol_scale(x, k):
+    factor = 2 if isinstance(x, types.Float) else 3
+    def impl(x, k):
+        return x * k * factor
+    return impl
+
+@njit
+def caller(x):
+    return scale(x, 2)
+
+results = caller(1), caller(1.5)
+fnty = caller.typingctx.resolve_value_type(scale)
+impls = [disp for template in fnty.templates
+         for disp, _ in template._impl_cache.values()]
+print(*results, sum(sum(disp.stats.cache_hits.values()) for disp in impls))
+"""
+
+    def setUp(self):
+        self.tempdir = temp_directory('test_overload_cache')
+        self.cache_dir = os.path.join(self.tempdir, 'cache')
+        self.modfile = os.path.join(self.tempdir, 'overload_mod.py')
+        with open(self.modfile, 'w') as fout:
+            fout.write(self.source_text)
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def run_module(self, cache_overloads):
+        env = os.environ.copy()
+        env['NUMBA_CACHE_DIR'] = self.cache_dir
+        env['NUMBA_CACHE_OVERLOADS'] = str(cache_overloads)
+        env['PYTHONPATH'] = os.pathsep.join(p for p in sys.path if p)
+        res = subprocess.run([sys.executable, self.modfile],
+                             stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                             env=env, timeout=600)
+        self.assertEqual(res.returncode, 0, res.stderr.decode())
+        return [float(x) for x in res.stdout.decode().split()]
+
+    def cached_impls(self):
+        found = []
+        for dirpath, _, names in os.walk(self.cache_dir):
+            found += [fn for fn in names
+                      if fn.startswith('overload_mod.ol_scale')
+                      and fn.endswith('.nbi')]
+        return found
+
+    def test_caching(self):
+        self.assertEqual(self.run_module(1), [6, 6, 0])
+        self.assertEqual(len(self.cached_impls()), 1)
+        # A new process loads both implementations from the cache, even
+        # though the calling function isn't cached
+        self.assertEqual(self.run_module(1), [6, 6, 2])
+
+    def test_disabled(self):
+        self.assertEqual(self.run_module(0), [6, 6, 0])
+        self.assertEqual(self.cached_impls(), [])
+        self.assertEqual(self.run_module(0), [6, 6, 0])
+
+
 class TestCFuncCache(BaseCacheTest):
 
     here = os.path.dirname(__file__)
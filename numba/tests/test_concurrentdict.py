@@ -0,0 +1,141 @@
+import numpy as np
+
+from numba import njit, prange
+from numba.core import types
+from numba.core.errors import TypingError
+from numba.typed import ConcurrentDict, Dict, List
+from numba.tests.support import (TestCase, MemoryLeakMixin,
+                                 skip_parfors_unsupported)
+import unittest
+
+
+@njit
+def add(a, b):
+    return a + b
+
+
+class TestConcurrentDict(MemoryLeakMixin, TestCase):
+
+    def test_basic(self):
+        cd = ConcurrentDict(types.int64, types.float64)
+        self.assertEqual(len(cd), 0)
+        cd[3] = 1.5
+        cd[-7] = 2.5
+        self.assertEqual(len(cd), 2)
+        self.assertEqual(cd[3], 1.5)
+        self.assertIn(-7, cd)
+        self.assertNotIn(4, cd)
+        self.assertIsNone(cd.get(4))
+        self.assertEqual(cd.get(4, 9.0), 9.0)
+        self.assertEqual(cd.setdefault(4, 1.0), 1.0)
+        self.assertEqual(cd.setdefault(4, 2.0), 1.0)
+        self.assertEqual(sorted(cd), [-7, 3, 4])
+        self.assertEqual(dict(cd.to_dict()), {3: 1.5, -7: 2.5, 4: 1.0})
+        self.disable_leak_check()
+        with self.assertRaises(KeyError):
+            cd[100]
+
+    def test_combine(self):
+        cd = ConcurrentDict(types.unicode_type, types.int64)
+        cd.combine("a", 1, add)
+        cd.combine("a", 2, add)
+        cd.combine("b", 5, add)
+        self.assertEqual(dict(cd.to_dict()), {"a": 3, "b": 5})
+
+    def test_combine_raises(self):
+        @njit
+        def checked_add(a, b):
+            if b < 0:
+                raise ValueError("negative")
+            return a + b
+
+        cd = ConcurrentDict(types.int64, types.int64, 1)
+        cd.combine(1, 1, checked_add)
+        self.disable_leak_check()
+        with self.assertRaises(ValueError):
+            cd.combine(1, -1, checked_add)
+        # The shard's lock was not left taken
+        cd.combine(1, 2, checked_add)
+        cd[2] = 5
+        self.assertEqual(dict(cd.to_dict()), {1: 3, 2: 5})
+
+    def test_merge_self(self):
+        cd = ConcurrentDict(types.int64, types.int64, 4)
+        for k in range(20):
+            cd[k] = k
+        cd.merge(cd, add)
+        self.assertEqual(dict(cd.to_dict()), {k: 2 * k for k in range(20)})
+
+    def test_n_shards(self):
+        @njit
+        def foo(n_shards, n):
+            cd = ConcurrentDict(types.int64, types.int64, n_shards)
+            for i in range(n):
+                cd[i] = i
+            return len(cd.shards), len(cd)
+
+        self.assertEqual(foo(1, 10), (1, 10))
+        self.assertEqual(foo(5, 100), (8, 100))
+        with self.assertRaises(ValueError) as raises:
+            self.disable_leak_check()
+            foo(0, 1)
+        self.assertIn("n_shards must be a positive integer",
+                      str(raises.exception))
+
+    def test_bad_types(self):
+        @njit
+        def foo():
+            return ConcurrentDict(1, types.int64)
+
+        with self.assertRaises(TypingError) as raises:
+            foo()
+        self.assertIn("key_type must be a Numba type", str(raises.exception))
+
+    def test_merge_list_of_dicts(self):
+        dicts = List()
+        for j in range(4):
+            d = Dict.empty(types.int64, types.int64)
+            for k in range(j, 10):
+                d[k] = 1
+            dicts.append(d)
+        cd = ConcurrentDict(types.int64, types.int64)
+        cd.merge(dicts, add)
+        self.assertEqual(dict(cd.to_dict()),
+                         {k: min(k + 1, 4) for k in range(10)})
+
+        other = ConcurrentDict(types.int64, types.int64, 4)
+        other[0] = 10
+        other[42] = 1
+        cd.merge(other, add)
+        self.assertEqual(cd[0], 11)
+        self.assertEqual(cd[42], 1)
+
+    @skip_parfors_unsupported
+    def test_prange_groupby(self):
+        @njit(parallel=True)
+        def groupby(keys, vals):
+            cd = ConcurrentDict(types.int64, types.float64, 8)
+            for i in prange(keys.size):
+                cd.combine(keys[i], vals[i], add)
+            return cd
+
+        @njit(parallel=True)
+        def first_seen(keys):
+            cd = ConcurrentDict(types.int64, types.int64)
+            for i in prange(keys.size):
+                cd.setdefault(keys[i], 1)
+            return cd
+
+        rng = np.random.RandomState(0)
+        keys = rng.randint(0, 50, 10000)
+        vals = rng.random_sample(10000)
+        cd = groupby(keys, vals)
+        expect = np.bincount(keys, weights=vals, minlength=50)
+        self.assertEqual(len(cd), 50)
+        got = np.array([cd[k] for k in range(50)])
+        np.testing.assert_allclose(got, expect)
+        self.assertEqual(sorted(first_seen(keys)), list(range(50)))
+
+
+if __name__ == '__main__':
+    unittest.main()
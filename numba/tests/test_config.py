@@ -125,6 +125,30 @@ class TestConfig(TestCase):
         self.assertIn(source_compiled, out.decode('utf-8'))
 
 
+class TestThreadAffinity(TestCase):
+
+    # Disable parallel testing due to envvars modification
+    _numba_parallel_test_ = False
+
+    def test_parse(self):
+        parse = config._parse_thread_affinity
+        self.assertEqual(parse('none'), 'none')
+        self.assertEqual(parse('Compact'), 'compact')
+        self.assertEqual(parse('3'), (3,))
+        self.assertEqual(parse('0-2,5,8-9'), (0, 1, 2, 5, 8, 9))
+        self.assertEqual(parse([4, 2]), (4, 2))
+        for invalid in ('', 'spread', '3-1', '-1', '0,,1'):
+            with self.assertRaises(ValueError):
+                parse(invalid)
+
+    def test_env(self):
+        with override_env_config('NUMBA_THREAD_AFFINITY', '0-1,4'):
+            self.assertEqual(config.THREAD_AFFINITY, (0, 1, 4))
+        with override_env_config('NUMBA_THREAD_AFFINITY', 'compact'):
+            self.assertEqual(config.THREAD_AFFINITY, 'compact')
+        self.assertEqual(config.THREAD_AFFINITY, 'none')
+
+
 class TestNumbaOptLevel(TestCase):
     # Tests that the setting of NUMBA_OPT influences the "cheap" module pass.
     # Spot checks NUMBA_OPT={'max', '3', '0'}
@@ -1186,6 +1186,66 @@ class TestTypedDict(MemoryLeakMixin, TestCase):
         self.check_stringify(str)
 
 
+class TestDictArrays(MemoryLeakMixin, TestCase):
+
+    def test_from_arrays(self):
+        keys = np.arange(1000, dtype=np.int32)[::-1]
+        values = np.linspace(0, 1, 1000)
+        d = Dict.from_arrays(keys, values)
+        self.assertEqual(typeof(d), types.DictType(int32, float64))
+        self.assertEqual(dict(d), dict(zip(keys, values)))
+        self.assertEqual(list(d.keys()), list(keys))
+
+        # later duplicates replace earlier ones
+        d = Dict.from_arrays(np.array([1, 2, 1]), np.array([1, 2, 3]))
+        self.assertEqual(dict(d), {1: 3, 2: 2})
+
+    def test_from_arrays_errors(self):
+        self.disable_leak_check()
+        with self.assertRaises(ValueError) as raises:
+            Dict.from_arrays(np.arange(3), np.arange(2))
+        self.assertIn("same length", str(raises.exception))
+        with self.assertRaises(TypeError):
+            Dict.from_arrays([1, 2], np.arange(2))
+        with self.assertRaises(TypingError):
+            Dict.from_arrays(np.zeros((2, 2)), np.arange(2))
+
+    def test_get_many(self):
+        d = Dict.from_arrays(np.arange(10), np.arange(10) * 1.5)
+        keys = np.array([3, -1, 9, 10], dtype=np.int8)
+        got = d.get_many(keys, -2.)
+        self.assertPreciseEqual(got, np.array([4.5, -2., 13.5, -2.]))
+        self.assertPreciseEqual(d.get_many(keys[:0], 0.), np.empty(0))
+
+        d = Dict.empty(int64, types.unicode_type)
+        with self.assertRaises(TypingError) as raises:
+            d.get_many(np.arange(2), 'a')
+        self.assertIn("number or boolean values", str(raises.exception))
+
+    def test_keys_values_arrays(self):
+        d = Dict.empty(int64, types.boolean)
+        for k in (5, 2, 9, 4):
+            d[k] = k % 2 == 0
+        del d[9]
+        self.assertPreciseEqual(d.keys_array(), np.array([5, 2, 4]))
+        self.assertPreciseEqual(d.values_array(),
+                                np.array([False, True, True]))
+        self.assertPreciseEqual(Dict().keys_array(), np.empty(0))
+
+    def test_compiled(self):
+        @njit
+        def impl(keys, values, queries):
+            d = Dict.from_arrays(keys, values)
+            return d.get_many(queries, 0), d.keys_array(), d.values_array()
+
+        keys = np.array([3, 1, 2])
+        values = np.array([30, 10, 20])
+        got = impl(keys, values, np.array([1, 7, 3]))
+        self.assertPreciseEqual(got[0], np.array([10, 0, 30]))
+        self.assertPreciseEqual(got[1], keys)
+        self.assertPreciseEqual(got[2], values)
+
+
 class DictIterableCtor:
 
     def test_iterable_type_constructor(self):
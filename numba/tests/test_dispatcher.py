@@ -1,8 +1,10 @@
+import functools
 import multiprocessing
 import platform
 import threading
 import pickle
 import weakref
+from concurrent.futures import ThreadPoolExecutor
 from itertools import chain
 from io import StringIO
 
@@ -18,6 +20,7 @@ from numba.core.dispatcher import Dispatcher
 from numba.tests.support import needs_lapack, SerialMixin
 from numba.testing.main import _TIMEOUT as _RUNNER_TIMEOUT
 import unittest
+from unittest import mock
 
 
 _TEST_TIMEOUT = _RUNNER_TIMEOUT - 60.
@@ -546,6 +549,98 @@ class TestDispatcher(BaseTest):
         expected_sigs = [(types.complex128,)]
         self.assertEqual(jitfoo.signatures, expected_sigs)
 
+    def test_dispatch_many_signatures(self):
+        # Calls cycling over more signatures than the dispatcher remembers
+        # in its inline cache of recent resolutions must still dispatch to
+        # the right overload.
+        def foo(x, y):
+            return x + y
+
+        values = [np.int8(1), np.int16(2), np.int32(3), 4, np.float32(5.5),
+                  6.5, 7j, np.uint8(8)]
+        jitfoo = jit(nopython=True)(foo)
+        for _ in range(3):
+            for x in values:
+                for y in (1, 2.5):
+                    result = jitfoo(x, y)
+                    self.assertPreciseEqual(result, foo(x, y))
+        self.assertEqual(len(jitfoo.signatures), 2 * len(values))
+
+        # Arrays are remembered by dtype, dimension and layout
+        def bar(a):
+            return a.sum()
+
+        a = np.arange(12.0).reshape(3, 4)
+        arrays = [a, a.T, a[:, ::2], a.astype(np.int32), a.ravel(),
+                  a.astype(np.float32), a.copy(order='F')]
+        jitbar = jit(nopython=True)(bar)
+        for _ in range(3):
+            for arr in arrays:
+                self.assertPreciseEqual(jitbar(arr), bar(arr))
+        self.assertEqual(len(jitbar.signatures), 6)
+
+        # Compiling a new overload or clearing the dispatcher invalidates
+        # the resolutions remembered
+        jitfoo = jit(nopython=True)(foo)
+        jitfoo.compile("(float64, float64)")
+        jitfoo.disable_compile()
+        self.assertPreciseEqual(jitfoo(1.5, 2.0), 3.5)
+        self.assertPreciseEqual(jitfoo(1, 2), 3.0)
+        jitfoo.disable_compile(False)
+        jitfoo.compile("(int64, int64)")
+        jitfoo.disable_compile()
+        self.assertPreciseEqual(jitfoo(1, 2), 3)
+        self.assertPreciseEqual(jitfoo(1.5, 2.0), 3.5)
+        jitfoo._reset_overloads()
+        with self.assertRaises(TypeError):
+            jitfoo(1.5, 2.0)
+
+    def test_call_forms(self):
+        # Calls using the vectorcall protocol with positional arguments only
+        # and the ones falling back on an arguments tuple must agree.
+        def foo(x, y=2):
+            return x * y
+
+        jitfoo = jit(nopython=True)(foo)
+        self.assertPreciseEqual(jitfoo(3, 4), 12)
+        self.assertPreciseEqual(jitfoo(3), 6)
+        self.assertPreciseEqual(jitfoo(3, y=5), 15)
+        self.assertPreciseEqual(jitfoo(*(3, 4)), 12)
+        self.assertPreciseEqual(jitfoo(**dict(x=3, y=4)), 12)
+        self.assertPreciseEqual(list(map(jitfoo, [1, 2], [3, 4])), [3, 8])
+        self.assertPreciseEqual(functools.partial(jitfoo, 7)(2), 14)
+        with self.assertRaises(TypeError) as raises:
+            jitfoo(1, 2, 3)
+        self.assertIn("too many arguments: expected 2, got 3",
+                      str(raises.exception))
+
+        # The compiled wrapper takes the positional arguments only
+        cfunc = jitfoo.overloads[(types.intp, types.intp)].entry_point
+        self.assertPreciseEqual(cfunc(3, 4), 12)
+        with self.assertRaises(TypeError) as raises:
+            cfunc(3)
+        self.assertIn("foo expected 2 arguments, got 1",
+                      str(raises.exception))
+        # Keyword arguments are ignored, as they were with the tuple and
+        # dict calling convention
+        self.assertPreciseEqual(cfunc(3, 4, y=5), 12)
+
+    def test_vectorcall_flag(self):
+        # Dispatcher subclasses get the vectorcall flag when they are
+        # created, unless they override __call__.
+        have_vectorcall = 1 << 11  # Py_TPFLAGS_HAVE_VECTORCALL
+
+        class Plain(Dispatcher):
+            pass
+
+        class Overriding(Dispatcher):
+            def __call__(self, *args, **kwargs):
+                return super().__call__(*args, **kwargs)
+
+        self.assertTrue(Dispatcher.__flags__ & have_vectorcall)
+        self.assertTrue(Plain.__flags__ & have_vectorcall)
+        self.assertFalse(Overriding.__flags__ & have_vectorcall)
+
     def test_dispatcher_raises_for_invalid_decoration(self):
         # For context see https://github.com/numba/numba/issues/4750.
 
@@ -733,6 +828,114 @@ class TestDispatcherMethods(TestCase):
         self.assertPreciseEqual(foo(1), 3)
         self.assertPreciseEqual(foo(1.5), 3)
 
+    def test_precompile_async(self):
+        foo = jit(nopython=True)(add)
+        futures = foo.precompile_async(["(int64, int64)",
+                                        "(float64, float64)"])
+        self.assertEqual(len(futures), 2)
+        for fut in futures:
+            fut.result()
+        self.assertEqual(len(foo.signatures), 2)
+        self.assertPreciseEqual(foo(1, 2), 3)
+        self.assertPreciseEqual(foo(1.5, 2.0), 3.5)
+        # Nothing was compiled after the background compilations
+        self.assertEqual(len(foo.signatures), 2)
+        self.assertEqual(sum(foo.stats.cache_misses.values()), 2)
+        self.assertFalse(foo._pending_compiles)
+
+    def test_precompile_async_compiled(self):
+        foo = jit(nopython=True)(add)
+        self.assertPreciseEqual(foo(1, 2), 3)
+        executor = mock.Mock()
+        [fut] = foo.precompile_async(["(int64, int64)"], executor=executor)
+        # Already compiled signatures are not submitted
+        self.assertTrue(fut.done())
+        self.assertIs(fut.result(),
+                      foo.overloads[(types.int64, types.int64)].entry_point)
+        executor.submit.assert_not_called()
+
+    def test_precompile_async_waits_for_pending(self):
+        foo = jit(nopython=True)(add)
+        release = threading.Event()
+        results = []
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Block the executor so the compilation stays pending
+            executor.submit(release.wait)
+            [fut] = foo.precompile_async(["(int64, int64)"],
+                                         executor=executor)
+            # Scheduling the same signature again reuses the future
+            [fut2] = foo.precompile_async(["(int64, int64)"],
+                                          executor=executor)
+            self.assertIs(fut, fut2)
+
+            t = threading.Thread(target=lambda: results.append(foo(1, 2)))
+            t.start()
+            self.assertFalse(fut.done())
+            release.set()
+            t.join()
+            fut.result()
+        self.assertEqual(results, [3])
+        self.assertEqual(len(foo.signatures), 1)
+        # The call waited for the background compilation instead of
+        # compiling the signature itself.
+        self.assertEqual(sum(foo.stats.cache_misses.values()), 1)
+
+    def test_precompile_async_error(self):
+        foo = jit(nopython=True)(add)
+        [fut] = foo.precompile_async(["(unicode_type, int64)"])
+        with self.assertRaises(errors.TypingError):
+            fut.result()
+        self.assertFalse(foo._pending_compiles)
+
+    def test_precompile_async_disabled(self):
+        foo = jit("(int64, int64)", nopython=True)(add)
+        with self.assertRaises(RuntimeError):
+            foo.precompile_async(["(float64, float64)"])
+
+    def test_submit(self):
+        foo = jit(nopython=True, nogil=True)(addsub_defaults)
+        fut = foo.submit(1, z=5)
+        self.assertPreciseEqual(fut.result(), 4)
+        # Defaults are folded like in a regular call, so the call below
+        # reuses the same overload.
+        self.assertPreciseEqual(foo(1, z=5), 4)
+        self.assertEqual(len(foo.signatures), 1)
+        futures = [foo.submit(i, i / 2) for i in range(10)]
+        self.assertEqual([f.result() for f in futures],
+                         [addsub_defaults(i, i / 2) for i in range(10)])
+
+    def test_submit_errors(self):
+        foo = jit(nopython=True)(add)
+        # Typing errors are raised in the calling thread
+        with self.assertRaises(errors.TypingError):
+            foo.submit(1, "a")
+        with self.assertRaises(TypeError):
+            foo.submit(1)
+
+        @jit(nopython=True)
+        def bar(x):
+            return 1 // x
+
+        self.assertIsInstance(bar.submit(0).exception(), ZeroDivisionError)
+
+    def test_submit_disabled_compile(self):
+        foo = jit("(int64, int64)", nopython=True)(add)
+        self.assertPreciseEqual(foo.submit(1.5, 2).result(), 3)
+        with self.assertRaises(TypeError) as raises:
+            foo.submit(1j, 2)
+        self.assertIn("No matching definition", str(raises.exception))
+
+    def test_async_call(self):
+        import asyncio
+
+        foo = jit(nopython=True, nogil=True)(add)
+
+        async def main():
+            return await asyncio.gather(*(foo.async_call(i, 1)
+                                          for i in range(5)))
+
+        self.assertEqual(asyncio.run(main()), [1, 2, 3, 4, 5])
+
     def test_inspect_llvm(self):
         # Create a jited function
         @jit
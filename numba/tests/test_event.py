@@ -67,12 +67,28 @@ class TestEvent(TestCase):
             # Check that all fields are there
             data = event.data
             self.assertIsInstance(data['name'], str)
+            self.assertIsInstance(data['pass_name'], str)
             self.assertIsInstance(data['qualname'], str)
             self.assertIsInstance(data['module'], str)
             self.assertIsInstance(data['flags'], str)
             self.assertIsInstance(data['args'], str)
             self.assertIsInstance(data['return_type'], str)
 
+    def test_cache_load_event(self):
+        @njit
+        def foo(x):
+            return x + x
+
+        with ev.install_recorder("numba:cache_load") as recorder:
+            foo(2)
+
+        self.assertEqual(len(recorder.buffer), 2)
+        (_, start), (_, end) = recorder.buffer
+        self.assertTrue(start.is_start)
+        self.assertTrue(end.is_end)
+        self.assertIs(start.data['dispatcher'], foo)
+        self.assertEqual(tuple(start.data['args']), foo.signatures[0])
+
     def test_install_listener(self):
         ut = self
 
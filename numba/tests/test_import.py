@@ -70,7 +70,8 @@ class TestNumbaImport(TestCase):
                    'numba.np.npyimpl',
                    'numba.typed.typeddict',
                    'numba.typed.typedlist',
-                   'numba.experimental.jitclass.base',]
+                   'numba.experimental.jitclass.base',
+                   'numba.experimental.jitclass.overloads',]
 
         code1 = """if 1:
             import sys
@@ -93,6 +94,36 @@ class TestNumbaImport(TestCase):
             unexpected = set(banlist) & set(modlist)
             self.assertFalse(unexpected, "some modules unexpectedly imported")
 
+    def test_import_time_deferred_modules(self):
+        """
+        Tests that the slow to import modules deferred to the first
+        compilation, the first use of the cache or the first jitclass are
+        not imported by 'import numba'. Uses the interpreter's -X importtime
+        report so that the slowest imports are shown on failure.
+        """
+        deferred = ['importlib.metadata',
+                    'sqlite3',
+                    'numba.experimental.jitclass.overloads',]
+
+        _, err = run_in_subprocess("import numba", flags=["-X", "importtime"])
+        cumulative = {}
+        for line in err.decode().splitlines():
+            if not line.startswith("import time:"):
+                continue
+            # "import time: self [us] | cumulative | imported package"
+            _, cum, name = line.split("|")
+            try:
+                cumulative[name.strip()] = int(cum)
+            except ValueError:  # the header line
+                pass
+        self.assertIn('numba', cumulative)
+
+        imported = set(deferred) & set(cumulative)
+        slowest = sorted(cumulative.items(), key=lambda x: x[1], reverse=True)
+        msg = ("some modules unexpectedly imported, slowest imports (us): %s"
+               % slowest[:20])
+        self.assertFalse(imported, msg)
+
     def test_no_accidental_warnings(self):
         # checks that importing Numba isn't accidentally triggering warnings due
         # to e.g. deprecated use of import locations from Python's stdlib
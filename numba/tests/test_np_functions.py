@@ -1401,6 +1401,15 @@ class TestNPFunctions(MemoryLeakMixin, TestCase):
 
         check_values(values)
 
+        # Evenly spaced integer bin edges near the int64 limits, whose
+        # differences overflow int64
+        info = np.iinfo(np.int64)
+        bins = np.int64([info.min, info.min // 2, 0, info.max // 2,
+                         info.max])
+        values = np.int64([info.min, info.min + 1, -5, 0, 5, info.max // 2,
+                           info.max - 1, info.max])
+        check(values, bins)
+
     def _test_correlate_convolve(self, pyfunc):
         cfunc = jit(nopython=True)(pyfunc)
         # only 1d arrays are accepted, test varying lengths
@@ -690,6 +690,46 @@ class TestMiscBackendIssues(ThreadLayerTestHelper):
                         "Concurrent access has been detected.")
             self.assertIn(expected, e_msg)
 
+    @linux_only
+    def test_thread_affinity(self):
+        """
+        Tests the worker threads are pinned to the CPUs set by
+        NUMBA_THREAD_AFFINITY and the launching thread is left alone
+        """
+        runme = """if 1:
+            import os
+            import threading
+            from numba import njit, prange
+            import numpy as np
+
+            @njit(parallel=True)
+            def foo(n):
+                acc = 0
+                for i in prange(n):
+                    acc += i
+                return acc
+
+            main_cpus = os.sched_getaffinity(0)
+            cpu = min(main_cpus)
+            foo(1000)
+            assert os.sched_getaffinity(0) == main_cpus
+            main_tid = threading.get_native_id()
+            tids = [int(t) for t in os.listdir('/proc/self/task')]
+            workers = [t for t in tids if t != main_tid]
+            assert workers
+            for tid in workers:
+                assert os.sched_getaffinity(tid) == {cpu}, tid
+        """
+        backends = ['workqueue'] + (['omp'] if _HAVE_OMP_POOL else [])
+        for backend in backends:
+            with self.subTest(backend=backend):
+                cmdline = [sys.executable, '-c', runme]
+                env = os.environ.copy()
+                env['NUMBA_THREADING_LAYER'] = backend
+                env['NUMBA_NUM_THREADS'] = "3"
+                env['NUMBA_THREAD_AFFINITY'] = str(min(os.sched_getaffinity(0)))
+                self.run_cmd(cmdline, env=env)
+
     @unittest.skipUnless(_HAVE_OS_FORK, "Test needs fork(2)")
     def test_workqueue_handles_fork_from_non_main_thread(self):
         # For context see #7872, but essentially the multiprocessing pool
@@ -32,6 +32,7 @@ from numba.core import (types, typing, errors, ir, rewrites,
 from numba.extending import (overload_method, register_model,
                              typeof_impl, unbox, NativeValue, models)
 from numba.core.registry import cpu_target
+from numba.core.runtime import rtsys
 from numba.core.annotations import type_annotations
 from numba.core.ir_utils import (find_callname, guard, build_definitions,
                             get_definition, is_getitem, is_setitem,
@@ -1762,6 +1763,55 @@ class TestParfors(TestParforsBase):
 
         self.check(test_impl, 100)
 
+    def test_large_array_reduction(self):
+        # Large enough for the partial results of the threads to be
+        # combined in parallel.
+        def test_impl(n):
+            result1 = np.zeros(1 << 16)
+            result2 = np.ones((1 << 8, 1 << 8))
+
+            for i in numba.prange(n):
+                result1 += i
+                result2 *= 1.01
+
+            return result1 + result2.ravel()
+
+        self.check(test_impl, 100)
+
+    def test_parallel_combine_shared(self):
+        # The reductions of a dtype share one parallel combine kernel
+        # whatever their dimension.
+        from numba.parfors import parfor_lowering
+
+        def test_impl(n):
+            result1 = np.zeros(1 << 16)
+            result2 = np.zeros((1 << 8, 1 << 8))
+            result3 = np.zeros((1 << 4, 1 << 6, 1 << 6))
+
+            for i in numba.prange(n):
+                result1 += i
+                result2 += i
+                result3 += i
+
+            return result1.sum() + result2.sum() + result3.sum()
+
+        self.check(test_impl, 100)
+        disp = parfor_lowering._parallel_combine_cache["add"]
+        float64_sigs = [sig for sig in disp.overloads
+                        if sig[1].dtype == types.float64]
+        self.assertEqual(len(float64_sigs), 1)
+
+    def test_non_contiguous_array_reduction(self):
+        def test_impl(n):
+            result = np.zeros((1 << 9, 1 << 9))[::2, 1::2]
+
+            for i in numba.prange(n):
+                result += i
+
+            return result
+
+        self.check(test_impl, 100)
+
     def test_preparfor_canonicalize_kws(self):
         # test canonicalize_array_math typing for calls with kw args
         def test_impl(A):
@@ -1771,6 +1821,166 @@ class TestParfors(TestParforsBase):
         A = np.arange(n)
         self.check(test_impl, A)
 
+    def test_sort(self):
+        def test_impl(A):
+            return np.sort(A)
+
+        cfunc = njit(parallel=True)(test_impl)
+        rng = np.random.default_rng(0)
+        A = rng.random(200000)
+        A[::7] = np.nan
+        for arr in (A, rng.integers(0, 50, 200000), rng.random(100)):
+            np.testing.assert_array_equal(cfunc(arr), test_impl(arr))
+        self.assertGreaterEqual(countParfors(test_impl, (types.float64[::1],)),
+                                1)
+
+    def test_sort_inplace(self):
+        def test_impl(A):
+            B = A.copy()
+            B.sort()
+            return B
+
+        cfunc = njit(parallel=True)(test_impl)
+        rng = np.random.default_rng(0)
+        A = rng.integers(-1000, 1000, 200000)
+        np.testing.assert_array_equal(cfunc(A), test_impl(A))
+
+    def test_sort_integers(self):
+        # Integer keys are radix sorted
+        def test_impl(A):
+            return np.sort(A)
+
+        cfunc = njit(parallel=True)(test_impl)
+        rng = np.random.default_rng(0)
+        for dtype in (np.int8, np.uint16, np.int32, np.int64, np.uint64):
+            info = np.iinfo(dtype)
+            A = rng.integers(info.min, info.max, 200000, dtype=dtype,
+                             endpoint=True)
+            np.testing.assert_array_equal(cfunc(A), test_impl(A))
+        # Keys sharing their high bytes skip those passes
+        A = rng.integers(-5, 5, 200000)
+        np.testing.assert_array_equal(cfunc(A), test_impl(A))
+        A = np.full(200000, 7)
+        np.testing.assert_array_equal(cfunc(A), test_impl(A))
+
+    def test_sort_inplace_unsupported(self):
+        # Arrays the parallel sort doesn't handle keep the serial sort
+        def test_impl(A):
+            B = A.copy()
+            B.sort()
+            return B
+
+        cfunc = njit(parallel=True)(test_impl)
+        rng = np.random.default_rng(0)
+        # Complex arrays aren't orderable in Numba, so they never type.
+        A = rng.random(1000) < 0.5
+        np.testing.assert_array_equal(cfunc(A), test_impl(A))
+        A = rng.random((30, 40))
+        np.testing.assert_array_equal(cfunc(A), test_impl(A))
+
+    def test_argsort(self):
+        def test_impl(A):
+            return np.argsort(A)
+
+        def test_impl_stable(A):
+            return A.argsort(kind='mergesort')
+
+        rng = np.random.default_rng(0)
+        A = rng.permutation(200000).astype(np.float64)
+        np.testing.assert_array_equal(njit(parallel=True)(test_impl)(A),
+                                      test_impl(A))
+        # ties keep their order
+        cfunc = njit(parallel=True)(test_impl_stable)
+        for arr in (rng.integers(0, 50, 200000), rng.integers(0, 50, 100)):
+            np.testing.assert_array_equal(cfunc(arr), test_impl_stable(arr))
+
+    def test_cumsum(self):
+        def test_impl(A):
+            return np.cumsum(A)
+
+        def test_impl_method(A):
+            return A.cumprod()
+
+        rng = np.random.default_rng(0)
+        A = rng.integers(0, 10, 100000).astype(np.int32)
+        self.check(test_impl, A)
+        self.check(test_impl, A.reshape((1000, 100)))
+        self.check(test_impl, A[:100])
+        self.check(test_impl_method, 1 + rng.random(100000) * 1e-5)
+        self.assertGreaterEqual(countParfors(test_impl, (types.int32[::1],)),
+                                1)
+
+    def test_parallel_scan(self):
+        @njit
+        def op(a, b):
+            return max(a, b)
+
+        def test_impl(A):
+            return numba.parallel_scan(op, A)
+
+        cfunc = njit(parallel=True)(test_impl)
+        rng = np.random.default_rng(0)
+        for arr in (rng.random(100000), rng.integers(0, 1000, 100)):
+            np.testing.assert_array_equal(cfunc(arr),
+                                          np.maximum.accumulate(arr))
+
+    def test_bincount(self):
+        def test_impl(A):
+            return np.bincount(A)
+
+        def test_impl_weights(A, w):
+            return np.bincount(A, w, 10)
+
+        def test_impl_minlength(A):
+            return np.bincount(A, minlength=300000)
+
+        rng = np.random.default_rng(0)
+        w = rng.random(200000)
+        for hi in (5, 1000, 200000):
+            A = rng.integers(0, hi, 200000)
+            self.check(test_impl, A)
+            self.check(test_impl_weights, A, w)
+            self.check(test_impl_minlength, A)
+        self.check(test_impl, A[:100])
+        self.assertGreaterEqual(countParfors(test_impl, (types.int64[::1],)),
+                                1)
+
+        cfunc = njit(parallel=True)(test_impl)
+        A[1000] = -1
+        with self.assertRaises(ValueError) as raises:
+            cfunc(A)
+        self.assertIn("first argument must be non-negative",
+                      str(raises.exception))
+
+    def test_histogram(self):
+        def test_impl(A, bins):
+            return np.histogram(A, bins)[0]
+
+        def test_impl_edges(A, bins):
+            return np.histogram(A, bins)
+
+        def test_impl_range(A):
+            return np.histogram(A, 20, (-1., 1.5))[0]
+
+        rng = np.random.default_rng(0)
+        A = rng.standard_normal(200000)
+        B = rng.standard_normal((400, 500))
+        for bins in (7, np.linspace(-2, 2, 11)):
+            self.check(test_impl, B, bins)
+        cfunc = njit(parallel=True)(test_impl_edges)
+        for bins in (7, 5000, np.linspace(-2, 2, 11),
+                     np.array([-3., -1, 0, 0.5, 4])):
+            for arr in (A, A[:100]):
+                got = cfunc(arr, bins)
+                expected = test_impl_edges(arr, bins)
+                np.testing.assert_array_equal(got[0], expected[0])
+                np.testing.assert_allclose(got[1], expected[1])
+        A[::1000] = np.nan
+        self.check(test_impl_range, A)
+        self.check(test_impl_range, rng.integers(-2, 3, 200000))
+        self.assertGreaterEqual(countParfors(test_impl_range,
+                                             (types.float64[::1],)), 1)
+
     def test_preparfor_datetime64(self):
         # test array.dtype transformation for datetime64
         def test_impl(A):
@@ -2339,6 +2549,69 @@ class TestParforsLeaks(MemoryLeakMixin, TestParforsBase):
         arr = np.arange(10).astype(np.float64)
         self.check(test_impl, arr)
 
+    def test_thread_local(self):
+        def test_impl(n, shape):
+            out = np.empty(n)
+            for i in prange(n):
+                a = numba.thread_local(3, np.float64)
+                b = numba.thread_local(shape, np.float64)
+                a[:] = i
+                b[:] = a.sum()
+                out[i] = b.sum()
+            return out
+
+        cfunc = njit(parallel=True)(test_impl)
+        for shape in (4, (2, 3)):
+            expected = test_impl(100, shape)
+            np.testing.assert_array_equal(cfunc(100, shape), expected)
+            # The output and one array per thread_local() call are
+            # allocated, whatever the number of iterations.
+            old = rtsys.get_allocation_stats()
+            np.testing.assert_array_equal(cfunc(100, shape), expected)
+            new = rtsys.get_allocation_stats()
+            self.assertEqual(new.alloc - old.alloc, 3)
+
+    def test_thread_local_inline_shape(self):
+        def test_impl(n, m):
+            out = np.empty(n)
+            for i in prange(n):
+                a = numba.thread_local((m, 3), np.float64)
+                a[:] = i
+                out[i] = a.sum()
+            return out
+
+        cfunc = njit(parallel=True)(test_impl)
+        with warnings.catch_warnings(record=True) as raised_warnings:
+            warnings.simplefilter('always', errors.NumbaPerformanceWarning)
+            expected = test_impl(100, 2)
+            np.testing.assert_array_equal(cfunc(100, 2), expected)
+        msgs = [str(w.message) for w in raised_warnings
+                if w.category is errors.NumbaPerformanceWarning]
+        self.assertFalse(any("thread_local() allocation could not be hoisted"
+                             in msg for msg in msgs))
+        old = rtsys.get_allocation_stats()
+        np.testing.assert_array_equal(cfunc(100, 2), expected)
+        new = rtsys.get_allocation_stats()
+        self.assertEqual(new.alloc - old.alloc, 2)
+
+    def test_thread_local_not_hoisted(self):
+        def test_impl(n):
+            out = np.empty(n)
+            for i in prange(n):
+                a = numba.thread_local(i + 1, np.float64)
+                a[:] = 1
+                out[i] = a.sum()
+            return out
+
+        cfunc = njit(parallel=True)(test_impl)
+        with warnings.catch_warnings(record=True) as raised_warnings:
+            warnings.simplefilter('always', errors.NumbaPerformanceWarning)
+            np.testing.assert_array_equal(cfunc(10), test_impl(10))
+        msgs = [str(w.message) for w in raised_warnings
+                if w.category is errors.NumbaPerformanceWarning]
+        self.assertTrue(any("thread_local() allocation could not be hoisted"
+                            in msg for msg in msgs))
+
 
 @skip_parfors_unsupported
 class TestParforsSlice(TestParforsBase):
@@ -2675,6 +2948,23 @@ class TestParforsOptions(TestParforsBase):
                          comprehension=False, setitem=False, prange=False,
                          reduction=False, numpy=False), 0)
 
+    def test_first_touch_empty(self):
+        # np.empty() allocations are zero-filled by a parfor when the threads
+        # are pinned, so that they are first touched in parallel
+        def test_impl(n):
+            a = np.empty(n)
+            b = np.empty((n, 3), dtype=np.int32)
+            c = np.empty(n, dtype=np.dtype('M8[s]'))
+            return a, b, c
+
+        args = (types.intp,)
+        self.assertEqual(countParfors(test_impl, args), 0)
+        with override_env_config('NUMBA_THREAD_AFFINITY', 'compact'):
+            self.assertEqual(countParfors(test_impl, args), 2)
+            a, b, _ = njit(parallel=True)(test_impl)(10)
+            np.testing.assert_array_equal(a, np.zeros(10))
+            np.testing.assert_array_equal(b, np.zeros((10, 3)))
+
 
 @skip_parfors_unsupported
 class TestParforsBitMask(TestParforsBase):
@@ -4474,6 +4764,137 @@ class TestParforChunksizing(TestCase):
         self.assertIn(msg, str(raised.exception))
 
 
+@skip_parfors_unsupported
+class TestParforScheduling(TestCase):
+    """
+    Tests the dynamic and guided loop schedules in ParallelAccelerator.
+    """
+    _numba_parallel_test_ = False
+
+    def setUp(self):
+        set_parallel_chunksize(0)
+
+    def tearDown(self):
+        set_parallel_chunksize(0)
+
+    def test_prange_schedule(self):
+        # The iterations have very different costs so that the threads take
+        # differing numbers of chunks.
+        def test_dynamic(n):
+            res = np.zeros(n)
+            for i in prange(n, schedule="dynamic"):
+                acc = 0.
+                for j in range(i):
+                    acc += j
+                res[i] = acc
+            return res
+
+        def test_guided(n):
+            res = np.zeros(n)
+            for i in prange(n, schedule="guided"):
+                acc = 0.
+                for j in range(i):
+                    acc += j
+                res[i] = acc
+            return res
+
+        for test_impl in (test_dynamic, test_guided):
+            cfunc = njit(parallel=True)(test_impl)
+            for n in (1, 3, 997, 1000):
+                np.testing.assert_allclose(cfunc(n), test_impl(n))
+
+    def test_prange_schedule_start(self):
+        @njit(parallel=True)
+        def test_impl(n):
+            res = np.zeros(n)
+            for i in prange(3, n, schedule="guided"):
+                res[i] = i
+            return res
+
+        np.testing.assert_array_equal(test_impl(100),
+                                      test_impl.py_func(100))
+
+    def test_prange_schedule_reduction(self):
+        @njit(parallel=True)
+        def test_impl(n):
+            acc = 0
+            for i in prange(n, schedule="dynamic"):
+                acc += i
+            return acc
+
+        for n in (1, 10, 1001):
+            self.assertEqual(test_impl(n), test_impl.py_func(n))
+
+    def test_prange_schedule_with_chunksize(self):
+        # With the guided schedule the chunksize is the smallest chunk.
+        @njit(parallel=True)
+        def test_impl(cs, n):
+            res = np.zeros(n)
+            inner_cs = np.full(n, -13)
+            with numba.parallel_chunksize(cs):
+                for i in prange(n, schedule="guided"):
+                    inner_cs[i] = numba.get_parallel_chunksize()
+                    res[i] = 13
+            return res, inner_cs
+
+        for n in (1000, 997):
+            for cs in (1, 7, 64):
+                res, inner_cs = test_impl(cs, n)
+                self.assertTrue(np.all(res == 13))
+                self.assertTrue(np.all(inner_cs == 0))
+
+    def test_parallel_option_schedule(self):
+        def test_impl(a):
+            return (a * 2).sum()
+
+        a = np.arange(100.).reshape(10, 10)
+        for sched in ("dynamic", "guided"):
+            fn = njit(parallel={'schedule': sched})(test_impl)
+            self.assertEqual(fn(a), test_impl(a))
+
+    def test_prange_schedule_sequential(self):
+        @njit
+        def test_impl(n):
+            acc = 0
+            for i in prange(n, schedule="dynamic"):
+                acc += i
+            return acc
+
+        self.assertEqual(test_impl(10), 45)
+        self.assertEqual(test_impl.py_func(10), 45)
+
+    def test_no_fusion_across_schedules(self):
+        def test_impl(n):
+            a = np.zeros(n)
+            b = np.zeros(n)
+            for i in prange(n, schedule="dynamic"):
+                a[i] = i
+            for i in prange(n):
+                b[i] = i
+            return a + b
+
+        self.assertEqual(countParfors(test_impl, (types.intp,)), 3)
+
+    def test_prange_schedule_invalid(self):
+        @njit(parallel=True)
+        def test_impl(n):
+            acc = 0
+            for i in prange(n, schedule="fastest"):
+                acc += i
+            return acc
+
+        with self.assertRaises(errors.TypingError) as raised:
+            test_impl(10)
+        self.assertIn("prange() schedule must be a string literal",
+                      str(raised.exception))
+
+    def test_parallel_option_schedule_invalid(self):
+        with self.assertRaises(ValueError) as raised:
+            cpu.ParallelOptions({'schedule': 'fastest'})
+        self.assertIn("Unrecognized parallel schedule",
+                      str(raised.exception))
+
+
 @skip_parfors_unsupported
 @x86_only
 class TestParforsVectorizer(TestPrangeBase):
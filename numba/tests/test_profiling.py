@@ -0,0 +1,164 @@
+import os
+import json
+import subprocess
+import sys
+import unittest
+from textwrap import dedent
+from tempfile import TemporaryDirectory
+
+from numba import njit
+from numba.core import event as ev, profiling
+from numba.tests.support import TestCase, override_config, run_in_subprocess
+
+
+def callee(x):
+    return x + 1
+
+
+class TestCompileProfiler(TestCase):
+    """
+    Test the aggregated compile-time profiles.
+    """
+
+    def setUp(self):
+        self.callee = njit(callee)
+        cfunc = self.callee
+
+        def caller(x):
+            return cfunc(x) * 2
+
+        self.caller = njit(caller)
+        self.caller_name = f"{__name__}.{caller.__qualname__}"
+        self.callee_name = f"{__name__}.callee"
+
+    def get_functions(self, report):
+        return {fn["name"]: fn for fn in report["functions"]}
+
+    def test_report(self):
+        registered = {k: len(v) for k, v in ev._registered.items()}
+        with profiling.profile() as prof:
+            self.caller(1)
+        # The listener is removed on exit
+        self.assertEqual({k: len(v) for k, v in ev._registered.items()
+                          if k in registered}, registered)
+
+        report = prof.report()
+        self.assertGreater(report["total_time"], 0)
+        functions = self.get_functions(report)
+        caller_prof = functions[self.caller_name]
+        callee_prof = functions[self.callee_name]
+        self.assertEqual(caller_prof["signatures"], ["(int64,) -> int64"])
+        self.assertEqual(callee_prof["signatures"], ["(int64,) -> int64"])
+        # The callee is compiled during the compilation of the caller
+        self.assertGreater(caller_prof["compile_time"],
+                           callee_prof["compile_time"])
+        self.assertEqual(report["functions"][0]["name"], self.caller_name)
+        for fn in (caller_prof, callee_prof):
+            self.assertIn("nopython_type_inference", fn["passes"])
+            self.assertIn("native_lowering", fn["passes"])
+            # Pass times exclude the compilation of callees
+            self.assertLessEqual(sum(fn["passes"].values()),
+                                 fn["compile_time"])
+            self.assertIsNone(fn["cache_hits"])
+            self.assertIsNone(fn["cache_misses"])
+            self.assertEqual(fn["llvm"], {})
+        # The report is serializable
+        json.dumps(report)
+
+        summary = prof.summary()
+        self.assertIn(f"{self.caller_name}: ", summary)
+        self.assertIn("across 1 signature(s)", summary)
+
+    def test_folded_stacks(self):
+        with profiling.profile() as prof:
+            self.caller(1)
+        stacks = {}
+        for line in prof.folded_stacks():
+            labels, usecs = line.rsplit(" ", 1)
+            stacks[tuple(labels.split(";"))] = int(usecs)
+        caller_frame = f"{self.caller_name}(int64)"
+        callee_frame = f"{self.callee_name}(int64)"
+        self.assertIn((caller_frame, "nopython_type_inference"), stacks)
+        # The callee is compiled during the type inference of the caller
+        nested = [labels for labels in stacks
+                  if labels[:3] == (caller_frame, "nopython_type_inference",
+                                    callee_frame)]
+        self.assertTrue(nested)
+        # The total time is the sum of the self times
+        self.assertAlmostEqual(sum(stacks.values()) / 1e6,
+                               prof.report()["total_time"], delta=1e-3)
+
+    def test_llvm_timings(self):
+        with override_config('LLVM_PASS_TIMINGS', True):
+            with profiling.profile() as prof:
+                self.callee(1)
+        callee_prof = self.get_functions(prof.report())[self.callee_name]
+        self.assertIn("Module passes (full optimization)", callee_prof["llvm"])
+
+    def test_write(self):
+        with profiling.profile() as prof:
+            self.callee(1)
+        with TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "profile.json")
+            prof.write_json(path)
+            with open(path) as f:
+                self.assertEqual(json.load(f)["functions"][0]["name"],
+                                 self.callee_name)
+            path = os.path.join(tmpdir, "profile.folded")
+            prof.write_folded(path)
+            with open(path) as f:
+                lines = f.read().splitlines()
+            self.assertEqual(lines, prof.folded_stacks())
+
+    def test_env_var(self):
+        code = """
+            from numba import njit
+
+            @njit(cache=True)
+            def foo(x):
+                return x + 1
+
+            foo(1)
+        """
+        with TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "profile.json")
+            env = os.environ.copy()
+            env['NUMBA_COMPILE_PROFILE'] = path
+            env['NUMBA_CACHE_DIR'] = tmpdir
+            script = os.path.join(tmpdir, "script.py")
+            with open(script, "w") as f:
+                f.write(dedent(code))
+            code = ("import runpy; "
+                    f"runpy.run_path({script!r}, run_name='__main__')")
+            # The second run loads foo from the cache
+            for hits, misses in ((0, 1), (1, 0)):
+                run_in_subprocess(code, env=env)
+                with open(path) as f:
+                    report = json.load(f)
+                functions = {fn["name"]: fn for fn in report["functions"]}
+                foo = functions["__main__.foo"]
+                self.assertEqual(foo["cache_hits"], hits)
+                self.assertEqual(foo["cache_misses"], misses)
+                with open(path + ".folded") as f:
+                    self.assertIn("__main__.foo(int64)", f.read())
+
+    def test_cli_failing_script(self):
+        # A script failing before the profile is written reports its exit
+        # status rather than a missing profile.
+        with TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "profile.json")
+            script = os.path.join(tmpdir, "script.py")
+            with open(script, "w") as f:
+                f.write("raise SystemExit(3)\n")
+            cmd = [sys.executable, "-m", "numba", script,
+                   "--profile-compile", path]
+            res = subprocess.run(cmd, stdout=subprocess.PIPE,
+                                 stderr=subprocess.PIPE, timeout=600)
+            self.assertEqual(res.returncode, 3)
+            stderr = res.stderr.decode()
+            self.assertIn("no compilation profile was written", stderr)
+            self.assertNotIn("Traceback", stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
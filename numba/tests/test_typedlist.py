@@ -822,6 +822,105 @@ class TestExtend(MemoryLeakMixin, TestCase):
         self.assertTrue(l._typed)
 
 
+class TestArrayInterop(MemoryLeakMixin, TestCase):
+
+    def test_from_array(self):
+        for arr in (np.arange(10, dtype=np.int32), np.linspace(0, 1, 7),
+                    np.array([True, False]), np.array([1 + 2j, 3j]),
+                    np.arange(10)[::3], np.empty(0)):
+            l = List.from_array(arr)
+            self.assertEqual(l._dtype, typeof(arr).dtype)
+            self.assertEqual(list(l), list(arr))
+
+        with self.assertRaises(TypeError) as raises:
+            List.from_array(np.zeros((2, 2)))
+        self.assertIn("one-dimensional", str(raises.exception))
+        with self.assertRaises(TypeError) as raises:
+            List.from_array(np.array(['a']))
+        self.assertIn("numbers or booleans", str(raises.exception))
+
+    def test_from_array_njit(self):
+        @njit
+        def impl(arr):
+            return List.from_array(arr)
+
+        arr = np.arange(100.)
+        self.assertEqual(list(impl(arr)), list(arr))
+
+    def test_list_from_array(self):
+        arr = np.arange(1000, dtype=np.uint8)
+        l = List(arr)
+        self.assertEqual(l._dtype, types.uint8)
+        self.assertEqual(list(l), list(arr))
+
+    def test_extend_array(self):
+        @njit
+        def impl(a, b):
+            l = List()
+            l.extend(a)
+            l.extend(b)
+            return l
+
+        a = np.arange(10)
+        b = np.arange(10, dtype=np.int32)[::-2]
+        self.assertEqual(list(impl(a, b)), list(a) + list(b))
+
+    def test_extend_from_buffer(self):
+        import array
+        l = List()
+        l.extend_from_buffer(array.array('i', [1, 2, 3]))
+        self.assertEqual(l._dtype, types.int32)
+        l.extend_from_buffer(np.arange(4, 8, dtype=np.int64).reshape((2, 2)))
+        l.extend_from_buffer(b'\x08')
+        self.assertEqual(list(l), list(range(1, 9)))
+
+        with self.assertRaises(TypeError):
+            l.extend_from_buffer([1, 2])
+
+    def test_extend_immutable(self):
+        self.disable_leak_check()
+        l = List.from_array(np.arange(3))
+        l._make_immutable()
+        with self.assertRaises(ValueError) as raises:
+            l.extend(np.arange(2))
+        self.assertIn("list is immutable", str(raises.exception))
+
+    def test_array_export(self):
+        l = List.from_array(np.arange(10.))
+        arr = np.asarray(l)
+        self.assertEqual(arr.dtype, np.float64)
+        self.assertPreciseEqual(arr, np.arange(10.))
+        # the array views the list's storage
+        arr[0] = 42
+        self.assertEqual(l[0], 42)
+        self.assertPreciseEqual(np.asarray(l), arr)
+        # the list is immutable while viewed
+        self.disable_leak_check()
+        view = arr[2:]
+        del arr
+        with self.assertRaises(ValueError) as raises:
+            l.append(1.)
+        self.assertIn("list is immutable", str(raises.exception))
+        del view
+        l.append(1.)
+        self.assertEqual(len(l), 11)
+        self.assertTrue(l._is_mutable())
+
+    def test_array_export_copies(self):
+        l = List.from_array(np.arange(5, dtype=np.int32))
+        arr = np.array(l, copy=True)
+        arr[0] = 10
+        self.assertEqual(l[0], 0)
+        arr = np.asarray(l, dtype=np.float64)
+        self.assertPreciseEqual(arr, np.arange(5.))
+        # no view is alive
+        l.append(5)
+
+        l = List(['a', 'b'])
+        self.assertPreciseEqual(np.asarray(l), np.array(['a', 'b']))
+        self.assertEqual(np.asarray(List()).shape, (0,))
+
+
 @njit
 def cmp(a, b):
     return a < b, a <= b, a == b, a != b, a >= b, a > b
@@ -0,0 +1,143 @@
+import numpy as np
+
+from numba import njit, typeof
+from numba.core import types
+from numba.core.errors import TypingError
+from numba.typed import Set
+from numba.tests.support import TestCase, MemoryLeakMixin
+import unittest
+
+
+class TestTypedSet(MemoryLeakMixin, TestCase):
+
+    def test_basic(self):
+        s = Set()
+        self.assertEqual(len(s), 0)
+        self.assertNotIn(1, s)
+        s.add(1)
+        s.add(2)
+        s.add(1)
+        self.assertEqual(len(s), 2)
+        self.assertIn(2, s)
+        self.assertEqual(typeof(s), types.SetType(types.int64))
+        s.discard(1)
+        s.discard(10)
+        self.assertEqual(list(s), [2])
+        s.remove(2)
+        self.assertEqual(len(s), 0)
+        self.disable_leak_check()
+        with self.assertRaises(KeyError):
+            s.remove(2)
+        with self.assertRaises(KeyError):
+            s.pop()
+
+    def test_empty_and_from_array(self):
+        s = Set.empty(types.float64, n_items=10)
+        self.assertEqual(len(s), 0)
+        self.assertEqual(s.item_type, types.float64)
+
+        arr = np.array([[3, 1], [2, 3]], dtype=np.int32)
+        s = Set.from_array(arr)
+        self.assertEqual(s.item_type, types.int32)
+        self.assertEqual(sorted(s), [1, 2, 3])
+        np.testing.assert_equal(s.to_array(), [3, 1, 2])
+
+        s = Set(np.array([1.5, 1.5, 2.5]))
+        self.assertEqual(sorted(s), [1.5, 2.5])
+
+    def test_algebra(self):
+        a_items = {1, 2, 3, 4}
+        b_items = {3, 4, 5}
+        a = Set(a_items)
+        b = Set(b_items)
+        self.assertEqual(set(a | b), a_items | b_items)
+        self.assertEqual(set(a & b), a_items & b_items)
+        self.assertEqual(set(a - b), a_items - b_items)
+        self.assertEqual(set(a ^ b), a_items ^ b_items)
+        self.assertEqual(set(a.union([7])), a_items | {7})
+        self.assertEqual(set(a.intersection(np.array([1, 9]))), {1})
+        self.assertEqual(set(a.difference([1])), a_items - {1})
+        self.assertEqual(set(a.symmetric_difference([1, 9])),
+                         a_items ^ {1, 9})
+        self.assertFalse(a <= b)
+        self.assertTrue(Set([3, 4]) <= b)
+        self.assertTrue(a >= Set([1, 2]))
+        self.assertTrue(a.issubset(range(10)))
+        self.assertTrue(a.isdisjoint([8, 9]))
+        self.assertFalse(a.isdisjoint(b))
+        self.assertEqual(a, Set(a_items))
+        self.assertNotEqual(a, b)
+
+        c = a.copy()
+        c &= b
+        self.assertEqual(set(c), a_items & b_items)
+        c = a.copy()
+        c -= c
+        self.assertEqual(len(c), 0)
+        c = a.copy()
+        c ^= b
+        self.assertEqual(set(c), a_items ^ b_items)
+        self.assertEqual(set(a), a_items)
+
+    def test_compiled(self):
+        @njit
+        def foo(a, b):
+            u = a | b
+            u.add(100)
+            total = 0
+            for x in u:
+                total += x
+            a.discard(1)
+            return u, total, a.isdisjoint(b)
+
+        a = Set([1, 2, 3])
+        b = Set([3, 4])
+        u, total, disjoint = foo(a, b)
+        self.assertIsInstance(u, Set)
+        self.assertEqual(set(u), {1, 2, 3, 4, 100})
+        self.assertEqual(total, 110)
+        self.assertFalse(disjoint)
+        # The set is passed by reference, not reflected
+        self.assertEqual(set(a), {2, 3})
+
+    def test_compiled_construction(self):
+        @njit
+        def foo(arr):
+            s = Set.from_array(arr)
+            e = Set.empty(types.int64)
+            e.update(arr)
+            e.add(-1)
+            e -= s
+            return s, e, s.pop() in s
+
+        s, e, popped_in = foo(np.arange(5))
+        self.assertEqual(len(s), 4)
+        self.assertEqual(set(e), {-1})
+        self.assertFalse(popped_in)
+
+    def test_unicode_items(self):
+        @njit
+        def foo(s):
+            t = s.copy()
+            t.add("c")
+            return t & s, "c" in t
+
+        s = Set(["a", "b"])
+        t, found = foo(s)
+        self.assertEqual(set(t), {"a", "b"})
+        self.assertTrue(found)
+
+    def test_bad_from_array(self):
+        @njit
+        def foo(x):
+            return Set.from_array(x)
+
+        with self.assertRaises(TypingError) as raises:
+            foo(1)
+        self.assertIn("from_array() expects an array", str(raises.exception))
+        with self.assertRaises(TypeError):
+            Set.from_array([1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
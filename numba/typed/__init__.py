@@ -4,6 +4,8 @@ import importlib
 _delayed_symbols = {
     "Dict": ".typeddict",
     "List": ".typedlist",
+    "Set": ".typedset",
+    "ConcurrentDict": ".concurrentdict",
 }
 
 
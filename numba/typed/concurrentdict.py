@@ -0,0 +1,439 @@
+"""
+A sharded typed dictionary that can be mutated concurrently, e.g. from the
+body of a ``prange`` loop.
+
+The mapping is split into a power-of-two number of shards, each of which is
+an ordinary ``numba.typed.Dict`` guarded by its own spin lock. A key always
+lives in the shard selected by its hash, so operations on keys in different
+shards never contend and the shards never need to be reconciled.
+
+User functions are never called with a lock held: ``combine`` reads the old
+value, applies the function and stores the result only if the shard was not
+written in between, as told by the shard's version, retrying otherwise.
+"""
+import operator
+
+import numpy as np
+
+from numba import njit, prange
+from numba.core import types, cgutils
+from numba.core.errors import TypingError
+from numba.core.extending import (
+    intrinsic,
+    overload,
+    overload_method,
+    register_jitable,
+)
+from numba.experimental import structref
+from numba.typed import Dict, List
+from numba.typed.typedobjectutils import _nonoptional
+
+
+_DEFAULT_SHARDS = 64
+
+# 2**64 / golden ratio, used to spread hashes over the shards (Fibonacci
+# hashing). The high bits of the product select the shard so that the low
+# bits, which each shard's dictionary uses for its own slots, stay random.
+_FIB_MULT = 0x9E3779B97F4A7C15
+
+
+@structref.register
+class ConcurrentDictType(types.StructRef):
+    """The Numba type of a ConcurrentDict.
+    """
+    def preprocess_fields(self, fields):
+        return tuple((name, types.unliteral(typ)) for name, typ in fields)
+
+    @property
+    def dict_type(self):
+        return self.field_dict['shards'].item_type
+
+    @property
+    def key_type(self):
+        return self.dict_type.key_type
+
+    @property
+    def value_type(self):
+        return self.dict_type.value_type
+
+
+@intrinsic
+def _lock_acquire(typingctx, locks, i):
+    """Spin until the lock ``locks[i]`` is taken by the caller.
+    """
+    sig = types.void(locks, types.intp)
+
+    def codegen(context, builder, sig, args):
+        [tlocks, _] = sig.args
+        [locks, i] = args
+        ary = context.make_array(tlocks)(context, builder, locks)
+        ptr = cgutils.get_item_pointer(context, builder, tlocks, ary, [i])
+        free = ptr.type.pointee(0)
+        taken = ptr.type.pointee(1)
+
+        bb_spin = builder.append_basic_block('lock.spin')
+        bb_done = builder.append_basic_block('lock.done')
+        builder.branch(bb_spin)
+        with builder.goto_block(bb_spin):
+            res = builder.cmpxchg(ptr, free, taken, 'acquire', 'monotonic')
+            builder.cbranch(builder.extract_value(res, 1), bb_done, bb_spin)
+        builder.position_at_end(bb_done)
+        return context.get_dummy_value()
+
+    return sig, codegen
+
+
+@intrinsic
+def _lock_release(typingctx, locks, i):
+    """Release the lock ``locks[i]`` held by the caller.
+    """
+    sig = types.void(locks, types.intp)
+
+    def codegen(context, builder, sig, args):
+        [tlocks, _] = sig.args
+        [locks, i] = args
+        ary = context.make_array(tlocks)(context, builder, locks)
+        ptr = cgutils.get_item_pointer(context, builder, tlocks, ary, [i])
+        align = context.get_abi_alignment(ptr.type.pointee)
+        builder.store_atomic(ptr.type.pointee(0), ptr, 'release', align)
+        return context.get_dummy_value()
+
+    return sig, codegen
+
+
+@register_jitable
+def _num_shards(n_shards):
+    if n_shards < 1:
+        raise ValueError("n_shards must be a positive integer")
+    n = 1
+    while n < n_shards:
+        n <<= 1
+    return n
+
+
+@register_jitable
+def _shard_index(cd, key):
+    h = np.uint64(hash(key)) * np.uint64(_FIB_MULT)
+    return np.intp((h >> np.uint64(32)) & cd.mask)
+
+
+def _as_instance_type(ty, name):
+    if isinstance(ty, (types.TypeRef, types.NumberClass)):
+        return ty.instance_type
+    raise TypingError(f"{name} must be a Numba type, got {ty}")
+
+
+class ConcurrentDict(structref.StructRefProxy):
+    """A typed dictionary that supports concurrent mutation.
+
+    ``ConcurrentDict(key_type, value_type, n_shards=64)`` creates an empty
+    mapping; ``n_shards`` is rounded up to a power of two. Instances can be
+    used in Python and passed to jit functions, where every operation is
+    safe to call from concurrent ``prange`` iterations.
+    """
+
+    def __len__(self):
+        return _length(self)
+
+    def __getitem__(self, key):
+        return _getitem(self, key)
+
+    def __setitem__(self, key, value):
+        _setitem(self, key, value)
+
+    def __contains__(self, key):
+        return _contains(self, key)
+
+    def __iter__(self):
+        return iter(self.to_dict())
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self.to_dict())})"
+
+    @property
+    def key_type(self):
+        return self._type.key_type
+
+    @property
+    def value_type(self):
+        return self._type.value_type
+
+    def get(self, key, default=None):
+        """Return the value for *key* if present, else *default*.
+        """
+        if default is None:
+            return _get(self, key)
+        return _get_default(self, key, default)
+
+    def setdefault(self, key, default):
+        """Insert *key* with *default* if absent and return its value.
+        """
+        return _setdefault(self, key, default)
+
+    def combine(self, key, value, func):
+        """Insert *key* with *value* if absent, otherwise replace the stored
+        value ``old`` with ``func(old, value)``. *func* must be a jit
+        function.
+        """
+        _combine(self, key, value, func)
+
+    def merge(self, other, func):
+        """Combine every item of *other* into this mapping as if by
+        ``self.combine(k, v, func)``. *other* can be a ConcurrentDict or a
+        typed List of typed Dicts, e.g. the per-thread partial results of a
+        group-by. The items are merged in parallel.
+        """
+        _merge(self, other, func)
+
+    def to_dict(self):
+        """Return a snapshot of the contents as a ``numba.typed.Dict``.
+        """
+        return _to_dict(self)
+
+
+structref.define_boxing(ConcurrentDictType, ConcurrentDict)
+
+
+@overload(ConcurrentDict)
+def impl_concurrent_dict(key_type, value_type, n_shards=_DEFAULT_SHARDS):
+    keyty = _as_instance_type(key_type, "key_type")
+    valty = _as_instance_type(value_type, "value_type")
+    if not isinstance(n_shards, (types.Integer, types.Omitted, int)):
+        raise TypingError("n_shards must be an integer")
+    dictty = types.DictType(keyty, valty)
+    struct_type = ConcurrentDictType([
+        ('shards', types.ListType(dictty)),
+        ('locks', types.int64[::1]),
+        ('versions', types.int64[::1]),
+        ('mask', types.uint64),
+    ])
+
+    def impl(key_type, value_type, n_shards=_DEFAULT_SHARDS):
+        n = _num_shards(n_shards)
+        shards = List.empty_list(dictty)
+        for _ in range(n):
+            shards.append(Dict.empty(keyty, valty))
+        cd = structref.new(struct_type)
+        cd.shards = shards
+        cd.locks = np.zeros(n, dtype=np.int64)
+        cd.versions = np.zeros(n, dtype=np.int64)
+        cd.mask = np.uint64(n - 1)
+        return cd
+
+    return impl
+
+
+@overload(len)
+def impl_len(cd):
+    if not isinstance(cd, ConcurrentDictType):
+        return
+
+    def impl(cd):
+        n = 0
+        for i in range(len(cd.shards)):
+            n += len(cd.shards[i])
+        return n
+
+    return impl
+
+
+@overload(operator.getitem)
+def impl_getitem(cd, key):
+    if not isinstance(cd, ConcurrentDictType):
+        return
+
+    def impl(cd, key):
+        i = _shard_index(cd, key)
+        _lock_acquire(cd.locks, i)
+        val = cd.shards[i].get(key)
+        _lock_release(cd.locks, i)
+        if val is None:
+            raise KeyError()
+        return _nonoptional(val)
+
+    return impl
+
+
+@overload(operator.setitem)
+def impl_setitem(cd, key, value):
+    if not isinstance(cd, ConcurrentDictType):
+        return
+
+    def impl(cd, key, value):
+        i = _shard_index(cd, key)
+        _lock_acquire(cd.locks, i)
+        cd.shards[i][key] = value
+        cd.versions[i] += 1
+        _lock_release(cd.locks, i)
+
+    return impl
+
+
+@overload(operator.contains)
+def impl_contains(cd, key):
+    if not isinstance(cd, ConcurrentDictType):
+        return
+
+    def impl(cd, key):
+        i = _shard_index(cd, key)
+        _lock_acquire(cd.locks, i)
+        found = key in cd.shards[i]
+        _lock_release(cd.locks, i)
+        return found
+
+    return impl
+
+
+@overload_method(ConcurrentDictType, 'get')
+def impl_get(cd, key, default=None):
+    def impl(cd, key, default=None):
+        i = _shard_index(cd, key)
+        _lock_acquire(cd.locks, i)
+        val = cd.shards[i].get(key, default)
+        _lock_release(cd.locks, i)
+        return val
+
+    return impl
+
+
+@overload_method(ConcurrentDictType, 'setdefault')
+def impl_setdefault(cd, key, default):
+    def impl(cd, key, default):
+        i = _shard_index(cd, key)
+        _lock_acquire(cd.locks, i)
+        val = cd.shards[i].setdefault(key, default)
+        cd.versions[i] += 1
+        _lock_release(cd.locks, i)
+        return val
+
+    return impl
+
+
+@overload_method(ConcurrentDictType, 'combine')
+def impl_combine(cd, key, value, func):
+    def impl(cd, key, value, func):
+        i = _shard_index(cd, key)
+        d = cd.shards[i]
+        while True:
+            _lock_acquire(cd.locks, i)
+            old = d.get(key)
+            version = cd.versions[i]
+            _lock_release(cd.locks, i)
+            # func may raise or use this dictionary, so it is called without
+            # the lock held.
+            if old is None:
+                new = value
+            else:
+                new = func(_nonoptional(old), value)
+            _lock_acquire(cd.locks, i)
+            stored = cd.versions[i] == version
+            if stored:
+                d[key] = new
+                cd.versions[i] += 1
+            _lock_release(cd.locks, i)
+            if stored:
+                return
+
+    return impl
+
+
+@njit(parallel=True)
+def _merge_parallel(cd, dicts, func):
+    for j in prange(len(dicts)):
+        # prange indices may be unsigned; typed List indexing wants intp
+        for k, v in dicts[np.intp(j)].items():
+            cd.combine(k, v, func)
+
+
+@njit(parallel=True)
+def _merge_shards_parallel(cd, other, func):
+    for j in prange(len(other.shards)):
+        s = np.intp(j)
+        # Combine from a copy of the shard so that other's lock is not held
+        # while combining, other may be cd itself.
+        _lock_acquire(other.locks, s)
+        items = other.shards[s].copy()
+        _lock_release(other.locks, s)
+        for k, v in items.items():
+            cd.combine(k, v, func)
+
+
+@overload_method(ConcurrentDictType, 'merge')
+def impl_merge(cd, other, func):
+    if isinstance(other, ConcurrentDictType):
+        def impl(cd, other, func):
+            _merge_shards_parallel(cd, other, func)
+    elif (isinstance(other, types.ListType) and
+            isinstance(other.item_type, types.DictType)):
+        def impl(cd, other, func):
+            _merge_parallel(cd, other, func)
+    else:
+        raise TypingError("merge() expects a ConcurrentDict or a typed List "
+                          f"of typed Dicts, got {other}")
+    return impl
+
+
+@overload_method(ConcurrentDictType, 'to_dict')
+def impl_to_dict(cd):
+    keyty, valty = cd.key_type, cd.value_type
+
+    def impl(cd):
+        out = Dict.empty(keyty, valty)
+        for i in range(len(cd.shards)):
+            _lock_acquire(cd.locks, i)
+            for k, v in cd.shards[i].items():
+                out[k] = v
+            _lock_release(cd.locks, i)
+        return out
+
+    return impl
+
+
+@njit
+def _length(cd):
+    return len(cd)
+
+
+@njit
+def _getitem(cd, key):
+    return cd[key]
+
+
+@njit
+def _setitem(cd, key, value):
+    cd[key] = value
+
+
+@njit
+def _contains(cd, key):
+    return key in cd
+
+
+@njit
+def _get(cd, key):
+    return cd.get(key)
+
+
+@njit
+def _get_default(cd, key, default):
+    return cd.get(key, default)
+
+
+@njit
+def _setdefault(cd, key, default):
+    return cd.setdefault(key, default)
+
+
+@njit
+def _combine(cd, key, value, func):
+    cd.combine(key, value, func)
+
+
+@njit
+def _merge(cd, other, func):
+    cd.merge(other, func)
+
+
+@njit
+def _to_dict(cd):
+    return cd.to_dict()
@@ -5,6 +5,7 @@ import ctypes
 import operator
 from enum import IntEnum
 
+import numpy as np
 from llvmlite import ir
 
 from numba import _helperlib
@@ -943,6 +944,85 @@ def ol_dict_update(d, other):
     return impl
 
 
+def _is_array_dtype(ty):
+    return isinstance(ty, (types.Number, types.Boolean))
+
+
+@overload_method(types.DictType, 'get_many')
+def impl_get_many(dct, keys, default):
+    """d.get_many(keys, default) looks up each key of a 1D array and returns
+    an array of the values, with *default* where a key is missing.
+    """
+    if not isinstance(dct, types.DictType):
+        return
+    if not (isinstance(keys, types.Array) and keys.ndim == 1):
+        raise TypingError("get_many() expects a one-dimensional array of "
+                          "keys, got {}".format(keys))
+    keyty = dct.key_type
+    valty = dct.value_type
+    if not _is_array_dtype(valty):
+        raise TypingError("get_many() requires number or boolean values, "
+                          "got {}".format(valty))
+    _sentry_safe_cast_default(default, valty)
+
+    def impl(dct, keys, default):
+        out = np.empty(len(keys), valty)
+        for i in range(len(keys)):
+            castedkey = _cast(keys[i], keyty)
+            ix, val = _dict_lookup(dct, castedkey, hash(castedkey))
+            if ix > DKIX.EMPTY:
+                out[i] = _nonoptional(val)
+            else:
+                out[i] = default
+        return out
+
+    return impl
+
+
+@overload_method(types.DictType, 'keys_array')
+def impl_keys_array(d):
+    """d.keys_array() returns a 1D array of the keys in insertion order.
+    """
+    if not isinstance(d, types.DictType):
+        return
+    keyty = d.key_type
+    if not _is_array_dtype(keyty):
+        raise TypingError("keys_array() requires number or boolean keys, "
+                          "got {}".format(keyty))
+
+    def impl(d):
+        out = np.empty(len(d), keyty)
+        i = 0
+        for k in d.keys():
+            out[i] = k
+            i += 1
+        return out
+
+    return impl
+
+
+@overload_method(types.DictType, 'values_array')
+def impl_values_array(d):
+    """d.values_array() returns a 1D array of the values in insertion order.
+    """
+    if not isinstance(d, types.DictType):
+        return
+    valty = d.value_type
+    if not _is_array_dtype(valty):
+        raise TypingError("values_array() requires number or boolean "
+                          "values, got {}".format(valty))
+
+    def impl(d):
+        out = np.empty(len(d), valty)
+        i = 0
+        for v in d.values():
+            out[i] = v
+            i += 1
+        return out
+
+    return impl
+
+
 @overload(operator.eq)
 def impl_equal(da, db):
     if not isinstance(da, types.DictType):
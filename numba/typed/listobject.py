@@ -621,6 +621,80 @@ def impl_append(l, item):
         return sig, impl
 
 
+@intrinsic
+def _list_resize(typingctx, l, newsize):
+    """Wrap numba_list_resize
+
+    Items added by growing the list are left uninitialized.
+    """
+    resty = types.int32
+    sig = resty(l, types.intp)
+
+    def codegen(context, builder, sig, args):
+        fnty = ir.FunctionType(
+            ll_status,
+            [ll_list_type, ll_ssize_t],
+        )
+        [l, newsize] = args
+        [tl, tnewsize] = sig.args
+        fn = cgutils.get_or_insert_function(builder.module, fnty,
+                                            'numba_list_resize')
+        lp = _container_get_data(context, builder, tl, l)
+        status = builder.call(fn, [lp, newsize])
+        return status
+
+    return sig, codegen
+
+
+def _is_scalar_list(l):
+    return isinstance(l.item_type, (types.Number, types.Boolean))
+
+
+@intrinsic
+def _list_as_array(typingctx, l):
+    """Returns a 1D array viewing the items of a list of scalars.
+
+    The array holds a reference to the list but resizing the list may move
+    its items, after which the array must not be used.
+    """
+    if not (isinstance(l, types.ListType) and _is_scalar_list(l)):
+        raise TypingError('expected a list of scalars')
+    arrty = types.Array(l.item_type, 1, 'C')
+    sig = arrty(l)
+
+    def codegen(context, builder, sig, args):
+        from numba.np.arrayobj import populate_array
+
+        [tl] = sig.args
+        [l] = args
+        fnty = ir.FunctionType(
+            ll_voidptr_type,
+            [ll_list_type],
+        )
+        fn = cgutils.get_or_insert_function(builder.module, fnty,
+                                            'numba_list_base_ptr')
+        lp = _container_get_data(context, builder, tl, l)
+        base_ptr = builder.call(fn, [lp])
+        len_sig, length_fn = _list_length._defn(context.typing_context, tl)
+        length = length_fn(context, builder, len_sig, (l,))
+
+        llty = context.get_data_type(tl.item_type)
+        itemsize = context.get_constant(types.intp,
+                                        context.get_abi_sizeof(llty))
+        # The array owns a reference to the list's meminfo
+        context.nrt.incref(builder, tl, l)
+        ary = context.make_array(sig.return_type)(context, builder)
+        populate_array(ary,
+                       data=builder.bitcast(base_ptr, llty.as_pointer()),
+                       shape=[length],
+                       strides=[itemsize],
+                       itemsize=itemsize,
+                       meminfo=_container_get_meminfo(context, builder, tl, l))
+        return ary._getvalue()
+
+    return sig, codegen
+
+
 @intrinsic
 def fix_index(tyctx, list_ty, index_ty):
     sig = types.intp(list_ty, index_ty)
@@ -1067,7 +1141,25 @@ def impl_extend(l, iterable):
     _check_for_none_typed(l, 'extend')
 
     def select_impl():
-        if isinstance(iterable, types.ListType):
+        if (isinstance(iterable, types.Array) and iterable.ndim == 1 and
+                isinstance(iterable.dtype, (types.Number, types.Boolean)) and
+                _is_scalar_list(l)):
+            # Copy arrays of scalars into the list storage in bulk.
+            def impl(l, iterable):
+                n = len(l)
+                status = _list_resize(l, n + len(iterable))
+                if status == ListStatus.LIST_OK:
+                    _list_as_array(l)[n:] = iterable
+                elif status == ListStatus.LIST_ERR_IMMUTABLE:
+                    raise ValueError('list is immutable')
+                elif status == ListStatus.LIST_ERR_NO_MEMORY:
+                    raise MemoryError('Unable to allocate memory to extend '
+                                      'list')
+                else:
+                    raise RuntimeError('list.extend failed unexpectedly')
+
+            return impl
+        elif isinstance(iterable, types.ListType):
             def impl(l, iterable):
                 if not l._is_mutable():
                     raise ValueError("list is immutable")
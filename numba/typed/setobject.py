@@ -0,0 +1,484 @@
+"""
+Compiler-side implementation of the typed set.
+
+A typed set stores its items as the keys of a typed dictionary with boolean
+values, so it shares the dictionary's storage, hashing and NRT lifetime
+management. The set algebra is implemented here in terms of dictionary
+operations and runs entirely in compiled code.
+"""
+import operator
+
+from numba.core.extending import (
+    overload,
+    overload_method,
+    intrinsic,
+    register_model,
+    models,
+    lower_builtin,
+    register_jitable,
+)
+from numba.core import types, cgutils
+from numba.core.types import SetType, Type
+from numba.core.imputils import impl_ret_borrowed
+from numba.core.errors import TypingError
+from numba.typed import dictobject
+
+
+@register_model(SetType)
+class SetModel(models.StructModel):
+    def __init__(self, dmm, fe_type):
+        members = [
+            ('data', fe_type.dict_type),   # the dict holding the items
+        ]
+        super(SetModel, self).__init__(dmm, fe_type, members)
+
+
+def _sentry_set(s):
+    if not isinstance(s, SetType):
+        raise TypingError("expected a typed set, got {}".format(s))
+
+
+@intrinsic
+def _set_data(typingctx, s):
+    """Returns the dictionary holding the items of the set *s*.
+    """
+    _sentry_set(s)
+    sig = s.dict_type(s)
+
+    def codegen(context, builder, sig, args):
+        [ts] = sig.args
+        [s] = args
+        st = cgutils.create_struct_proxy(ts)(context, builder, value=s)
+        return impl_ret_borrowed(context, builder, sig.return_type, st.data)
+
+    return sig, codegen
+
+
+@intrinsic
+def _make_set(typingctx, settyref, d):
+    """Wraps the dictionary *d* into a set of type *settyref*.
+    """
+    settype = settyref.instance_type
+    sig = settype(settyref, d)
+
+    def codegen(context, builder, sig, args):
+        st = cgutils.create_struct_proxy(sig.return_type)(context, builder)
+        st.data = args[1]
+        return impl_ret_borrowed(
+            context,
+            builder,
+            sig.return_type,
+            st._getvalue(),
+        )
+
+    return sig, codegen
+
+
+def new_set(item, n_items=0):
+    """Construct a new set with enough space for *n_items* without a resize.
+
+    Parameters
+    ----------
+    item : TypeRef
+        Item type of the new set.
+    n_items : int, default 0
+        The number of items to insert without needing a resize.
+        A value of 0 creates a set with minimum size.
+    """
+    # With JIT disabled, ignore all arguments and return a Python set.
+    return set()
+
+
+def _as_item_type(item):
+    if isinstance(item, (types.TypeRef, types.NumberClass)):
+        return item.instance_type
+    return item
+
+
+@overload(new_set)
+def impl_new_set(item, n_items=0):
+    """Creates a new set with *item* as the type of the set items.
+    """
+    if not isinstance(item, Type):
+        raise TypeError("expecting *item* to be a numba Type")
+
+    itemty = _as_item_type(item)
+    settype = SetType(itemty)
+
+    def imp(item, n_items=0):
+        d = dictobject.new_dict(itemty, types.boolean, n_keys=n_items)
+        return _make_set(settype, d)
+
+    return imp
+
+
+def _as_set(s, other):
+    """Returns *other* as a set with the item type of *s*.
+    """
+    return set(other)
+
+
+@overload(_as_set)
+def impl_as_set(s, other):
+    _sentry_set(s)
+    if other == s:
+        def impl(s, other):
+            return other
+    elif isinstance(other, types.IterableType):
+        itemty = s.item_type
+
+        def impl(s, other):
+            out = new_set(itemty)
+            d = _set_data(out)
+            for x in other:
+                d[x] = True
+            return out
+    else:
+        raise TypingError("expected an iterable, got {}".format(other))
+    return impl
+
+
+@lower_builtin('getiter', SetType)
+def impl_set_getiter(context, builder, sig, args):
+    """Implement iter(Set) by iterating the keys of the underlying dict.
+    """
+    [ts] = sig.args
+    [s] = args
+    st = cgutils.create_struct_proxy(ts)(context, builder, value=s)
+    dictsig = sig.return_type(ts.dict_type)
+    return dictobject.impl_dict_getiter(context, builder, dictsig, [st.data])
+
+
+@overload(len)
+def impl_len(s):
+    """len(set)
+    """
+    if not isinstance(s, SetType):
+        return
+
+    def impl(s):
+        return len(_set_data(s))
+
+    return impl
+
+
+@overload(operator.contains)
+def impl_contains(s, item):
+    if not isinstance(s, SetType):
+        return
+
+    def impl(s, item):
+        return item in _set_data(s)
+
+    return impl
+
+
+@overload_method(SetType, 'add')
+def impl_add(s, item):
+    def impl(s, item):
+        _set_data(s)[item] = True
+
+    return impl
+
+
+@overload_method(SetType, 'discard')
+def impl_discard(s, item):
+    def impl(s, item):
+        _set_data(s).pop(item, False)
+
+    return impl
+
+
+@overload_method(SetType, 'remove')
+def impl_remove(s, item):
+    def impl(s, item):
+        if not _set_data(s).pop(item, False):
+            raise KeyError("set.remove(): item not in set")
+
+    return impl
+
+
+@overload_method(SetType, 'pop')
+def impl_pop(s):
+    def impl(s):
+        d = _set_data(s)
+        if len(d) == 0:
+            raise KeyError("pop from an empty set")
+        item, _ = d.popitem()
+        return item
+
+    return impl
+
+
+@overload_method(SetType, 'clear')
+def impl_clear(s):
+    def impl(s):
+        _set_data(s).clear()
+
+    return impl
+
+
+@overload_method(SetType, 'copy')
+def impl_copy(s):
+    settype = s
+
+    def impl(s):
+        return _make_set(settype, _set_data(s).copy())
+
+    return impl
+
+
+@overload_method(SetType, 'update')
+def impl_update(s, other):
+    if not isinstance(other, types.IterableType):
+        raise TypingError("expected an iterable, got {}".format(other))
+
+    def impl(s, other):
+        d = _set_data(s)
+        for x in other:
+            d[x] = True
+
+    return impl
+
+
+@overload_method(SetType, 'union')
+def impl_union(s, other):
+    def impl(s, other):
+        out = s.copy()
+        out.update(other)
+        return out
+
+    return impl
+
+
+@overload_method(SetType, 'intersection')
+def impl_intersection(s, other):
+    itemty = s.item_type
+
+    def impl(s, other):
+        o = _as_set(s, other)
+        # Probe the larger set with the items of the smaller one
+        if len(o) < len(s):
+            small, large = o, s
+        else:
+            small, large = s, o
+        out = new_set(itemty)
+        d = _set_data(out)
+        for x in small:
+            if x in large:
+                d[x] = True
+        return out
+
+    return impl
+
+
+@overload_method(SetType, 'difference')
+def impl_difference(s, other):
+    itemty = s.item_type
+
+    def impl(s, other):
+        o = _as_set(s, other)
+        out = new_set(itemty)
+        d = _set_data(out)
+        for x in s:
+            if x not in o:
+                d[x] = True
+        return out
+
+    return impl
+
+
+@overload_method(SetType, 'symmetric_difference')
+def impl_symmetric_difference(s, other):
+    def impl(s, other):
+        o = _as_set(s, other)
+        out = s.difference(o)
+        d = _set_data(out)
+        for x in o:
+            if x not in s:
+                d[x] = True
+        return out
+
+    return impl
+
+
+@register_jitable
+def _replace_items(s, items):
+    # *items* is computed before clearing as the other operand may alias *s*
+    d = _set_data(s)
+    d.clear()
+    for x in items:
+        d[x] = True
+
+
+@overload_method(SetType, 'intersection_update')
+def impl_intersection_update(s, other):
+    def impl(s, other):
+        _replace_items(s, s.intersection(other))
+
+    return impl
+
+
+@overload_method(SetType, 'difference_update')
+def impl_difference_update(s, other):
+    def impl(s, other):
+        _replace_items(s, s.difference(other))
+
+    return impl
+
+
+@overload_method(SetType, 'symmetric_difference_update')
+def impl_symmetric_difference_update(s, other):
+    def impl(s, other):
+        _replace_items(s, s.symmetric_difference(other))
+
+    return impl
+
+
+@overload_method(SetType, 'issubset')
+def impl_issubset(s, other):
+    def impl(s, other):
+        o = _as_set(s, other)
+        if len(s) > len(o):
+            return False
+        for x in s:
+            if x not in o:
+                return False
+        return True
+
+    return impl
+
+
+@overload_method(SetType, 'issuperset')
+def impl_issuperset(s, other):
+    def impl(s, other):
+        o = _as_set(s, other)
+        return o.issubset(s)
+
+    return impl
+
+
+@overload_method(SetType, 'isdisjoint')
+def impl_isdisjoint(s, other):
+    def impl(s, other):
+        o = _as_set(s, other)
+        if len(o) < len(s):
+            small, large = o, s
+        else:
+            small, large = s, o
+        for x in small:
+            if x in large:
+                return False
+        return True
+
+    return impl
+
+
+@overload_method(SetType, 'to_array')
+def impl_to_array(s):
+    """s.to_array() returns a 1D array of the items in insertion order.
+    """
+    def impl(s):
+        return _set_data(s).keys_array()
+
+    return impl
+
+
+def _both_sets(a, b):
+    return isinstance(a, SetType) and isinstance(b, SetType)
+
+
+@overload(operator.or_)
+def impl_or(a, b):
+    if _both_sets(a, b):
+        return lambda a, b: a.union(b)
+
+
+@overload(operator.and_)
+def impl_and(a, b):
+    if _both_sets(a, b):
+        return lambda a, b: a.intersection(b)
+
+
+@overload(operator.sub)
+def impl_sub(a, b):
+    if _both_sets(a, b):
+        return lambda a, b: a.difference(b)
+
+
+@overload(operator.xor)
+def impl_xor(a, b):
+    if _both_sets(a, b):
+        return lambda a, b: a.symmetric_difference(b)
+
+
+@overload(operator.ior)
+def impl_ior(a, b):
+    if _both_sets(a, b):
+        def impl(a, b):
+            a.update(b)
+            return a
+        return impl
+
+
+@overload(operator.iand)
+def impl_iand(a, b):
+    if _both_sets(a, b):
+        def impl(a, b):
+            a.intersection_update(b)
+            return a
+        return impl
+
+
+@overload(operator.isub)
+def impl_isub(a, b):
+    if _both_sets(a, b):
+        def impl(a, b):
+            a.difference_update(b)
+            return a
+        return impl
+
+
+@overload(operator.ixor)
+def impl_ixor(a, b):
+    if _both_sets(a, b):
+        def impl(a, b):
+            a.symmetric_difference_update(b)
+            return a
+        return impl
+
+
+@overload(operator.eq)
+def impl_equal(a, b):
+    if _both_sets(a, b):
+        return lambda a, b: len(a) == len(b) and a.issubset(b)
+
+
+@overload(operator.ne)
+def impl_not_equal(a, b):
+    if _both_sets(a, b):
+        return lambda a, b: not (a == b)
+
+
+@overload(operator.le)
+def impl_le(a, b):
+    if _both_sets(a, b):
+        return lambda a, b: a.issubset(b)
+
+
+@overload(operator.lt)
+def impl_lt(a, b):
+    if _both_sets(a, b):
+        return lambda a, b: len(a) < len(b) and a.issubset(b)
+
+
+@overload(operator.ge)
+def impl_ge(a, b):
+    if _both_sets(a, b):
+        return lambda a, b: a.issuperset(b)
+
+
+@overload(operator.gt)
+def impl_gt(a, b):
+    if _both_sets(a, b):
+        return lambda a, b: len(a) > len(b) and a.issuperset(b)
@@ -2,6 +2,9 @@
 Python wrapper that connects CPython interpreter to the numba dictobject.
 """
 from collections.abc import MutableMapping, Iterable, Mapping
+
+import numpy as np
+
 from numba.core.types import DictType
 from numba.core.imputils import numba_typeref_ctor
 from numba import njit, typeof
@@ -74,6 +77,26 @@ def _copy(d):
     return d.copy()
 
 
+@njit
+def _from_arrays(keys, values):
+    return Dict.from_arrays(keys, values)
+
+
+@njit
+def _get_many(d, keys, default):
+    return d.get_many(keys, default)
+
+
+@njit
+def _keys_array(d):
+    return d.keys_array()
+
+
+@njit
+def _values_array(d):
+    return d.values_array()
+
+
 def _from_meminfo_ptr(ptr, dicttype):
     d = Dict(meminfo=ptr, dcttype=dicttype)
     return d
@@ -104,6 +127,19 @@ class Dict(MutableMapping):
         else:
             return cls(dcttype=DictType(key_type, value_type), n_keys=n_keys)
 
+    @classmethod
+    def from_arrays(cls, keys, values):
+        """Create a new Dict mapping each item of the one-dimensional array
+        *keys* to the item of *values* at the same index, inserted in bulk.
+        The key and value types are the arrays' dtypes.
+        """
+        if config.DISABLE_JIT:
+            return dict(zip(keys, values))
+        if not (isinstance(keys, np.ndarray) and
+                isinstance(values, np.ndarray)):
+            raise TypeError("from_arrays() expects NumPy arrays")
+        return _from_arrays(keys, values)
+
     def __init__(self, *args, **kwargs):
         """
         For users, the constructor does not take any parameters.
@@ -237,6 +273,31 @@ class Dict(MutableMapping):
     def copy(self):
         return _copy(self)
 
+    def get_many(self, keys, default):
+        """Return an array of the values of the keys in the one-dimensional
+        array *keys*, with *default* for missing keys. The values must be
+        numbers or booleans.
+        """
+        if not self._typed:
+            return np.full(len(keys), default)
+        return _get_many(self, keys, default)
+
+    def keys_array(self):
+        """Return an array of the keys, which must be numbers or booleans,
+        in insertion order.
+        """
+        if not self._typed:
+            return np.empty(0)
+        return _keys_array(self)
+
+    def values_array(self):
+        """Return an array of the values, which must be numbers or booleans,
+        in insertion order.
+        """
+        if not self._typed:
+            return np.empty(0)
+        return _values_array(self)
+
 
 @overload_classmethod(types.DictType, 'empty')
 def typeddict_empty(cls, key_type, value_type, n_keys=0):
@@ -249,6 +310,30 @@ def typeddict_empty(cls, key_type, value_type, n_keys=0):
     return impl
 
 
+@overload_classmethod(types.DictType, 'from_arrays')
+def typeddict_from_arrays(cls, keys, values):
+    if cls.instance_type is not DictType:
+        return
+    for arr in (keys, values):
+        if not (isinstance(arr, types.Array) and arr.ndim == 1):
+            raise errors.TypingError("from_arrays() expects one-dimensional "
+                                     "arrays, got {}".format(arr))
+    keyty = keys.dtype
+    valty = values.dtype
+
+    def impl(cls, keys, values):
+        n = len(keys)
+        if len(values) != n:
+            raise ValueError("from_arrays() expects keys and values of the "
+                             "same length")
+        d = dictobject.new_dict(keyty, valty, n_keys=n)
+        for i in range(n):
+            d[keys[i]] = values[i]
+        return d
+
+    return impl
+
+
 @box(types.DictType)
 def box_dicttype(typ, val, c):
     context = c.context
@@ -9,6 +9,10 @@ it should really quack like the CPython `list`.
 
 """
 from collections.abc import MutableSequence
+import threading
+import weakref
+
+import numpy as np
 
 from numba.core.types import ListType
 from numba.core.imputils import numba_typeref_ctor
@@ -117,6 +121,11 @@ def _extend(l, iterable):
     return l.extend(iterable)
 
 
+@njit
+def _as_array(l):
+    return listobject._list_as_array(l)
+
+
 @njit
 def _insert(l, i, item):
     l.insert(i, item)
@@ -186,6 +195,25 @@ def _from_meminfo_ptr(ptr, listtype):
     return List(meminfo=ptr, lsttype=listtype)
 
 
+# The number of live arrays viewing the storage of each list, keyed by the
+# data address of the list's meminfo. Lists are immutable while viewed, as
+# resizing them may move their items.
+_array_exports = {}
+_array_exports_lock = threading.Lock()
+
+
+def _release_array_export(lst, key):
+    with _array_exports_lock:
+        _array_exports[key] -= 1
+        if _array_exports[key] == 0:
+            del _array_exports[key]
+            lst._make_mutable()
+
+
+def _is_scalar_type(ty):
+    return isinstance(ty, (types.Number, types.Boolean))
+
+
 T = pt.TypeVar('T')
 T_or_ListT = pt.Union[T, 'List[T]']
 
@@ -225,6 +253,28 @@ class List(MutableSequence, pt.Generic[T]):
         else:
             return cls(lsttype=ListType(item_type), allocated=allocated)
 
+    @classmethod
+    def from_array(cls, arr):
+        """Create a new List from a one-dimensional NumPy array of numbers or
+        booleans. The items are copied in bulk.
+
+        Parameters
+        ----------
+        arr: ndarray
+            the array to copy the items from; its dtype gives the item type
+        """
+        if config.DISABLE_JIT:
+            return list(arr)
+        if not isinstance(arr, np.ndarray) or arr.ndim != 1:
+            raise TypeError("from_array() expects a one-dimensional array")
+        item_type = typeof(arr).dtype
+        if not _is_scalar_type(item_type):
+            raise TypeError("from_array() expects an array of numbers or "
+                            "booleans, got {}".format(arr.dtype))
+        lst = cls.empty_list(item_type, allocated=len(arr))
+        _extend(lst, arr)
+        return lst
+
     def __init__(self, *args, **kwargs):
         """
         For users, the constructor does not take any parameters.
@@ -259,6 +309,9 @@ class List(MutableSequence, pt.Generic[T]):
                 # NumPy Array.
                 if hasattr(iterable, "ndim") and iterable.ndim == 0:
                     self.append(iterable.item())
+                elif isinstance(iterable, np.ndarray) and iterable.ndim == 1:
+                    # Arrays of scalars are copied in bulk.
+                    self.extend(iterable)
                 else:
                     try:
                         iter(iterable)
@@ -400,6 +453,59 @@ class List(MutableSequence, pt.Generic[T]):
             self._initialise_list(iterable[0])
         return _extend(self, iterable)
 
+    def extend_from_buffer(self, buf):
+        """Extend the list in bulk from an object supporting the buffer
+        protocol, such as a NumPy array, ``array.array`` or ``bytes``, whose
+        items are numbers or booleans. Multi-dimensional buffers are
+        flattened in C order. An untyped list takes the buffer's item type.
+        """
+        arr = np.asarray(memoryview(buf)).reshape(-1)
+        item_type = typeof(arr).dtype
+        if not _is_scalar_type(item_type):
+            raise TypeError("extend_from_buffer() expects a buffer of numbers "
+                            "or booleans, got {}".format(arr.dtype))
+        if not self._typed:
+            self._list_type, self._opaque = self._parse_arg(
+                ListType(item_type), allocated=len(arr))
+        _extend(self, arr)
+
+    def __array__(self, dtype=None, copy=None):
+        """Return a NumPy array of the items of a list of numbers or booleans.
+
+        Unless a copy is requested, or needed to convert to *dtype*, the
+        array views the list's storage without copying and writes to it are
+        seen by the list. While such views are alive the list is immutable,
+        as resizing it could move its items.
+        """
+        if not self._typed:
+            return np.array([], dtype=dtype)
+        if not _is_scalar_type(self._dtype):
+            if copy is False:
+                raise ValueError("a list of {} can not be viewed as an "
+                                 "array".format(self._dtype))
+            return np.array(list(self), dtype=dtype)
+        if copy:
+            return np.array(_as_array(self), dtype=dtype, copy=True)
+        arr = _as_array(self)
+        if dtype is not None and np.dtype(dtype) != arr.dtype:
+            if copy is False:
+                raise ValueError("a list of {} can not be viewed as an array "
+                                 "of {}".format(self._dtype, dtype))
+            return arr.astype(dtype)
+        key = self._opaque.data
+        with _array_exports_lock:
+            if key in _array_exports:
+                _array_exports[key] += 1
+            elif self._is_mutable():
+                self._make_immutable()
+                _array_exports[key] = 1
+            else:
+                # Already made immutable by the user, who is then in charge
+                # of not resizing it while viewed.
+                return arr
+        weakref.finalize(arr, _release_array_export, self, key)
+        return arr
+
     def remove(self, item: T) -> None:
         return _remove(self, item)
 
@@ -454,6 +560,24 @@ def typedlist_empty(cls, item_type, allocated=DEFAULT_ALLOCATED):
     return impl
 
 
+@overload_classmethod(ListType, 'from_array')
+def typedlist_from_array(cls, arr):
+    if cls.instance_type is not ListType:
+        return
+    if not (isinstance(arr, types.Array) and arr.ndim == 1 and
+            _is_scalar_type(arr.dtype)):
+        raise TypingError("from_array() expects a one-dimensional array of "
+                          "numbers or booleans")
+    item_type = arr.dtype
+
+    def impl(cls, arr):
+        l = listobject.new_list(item_type, allocated=len(arr))
+        l.extend(arr)
+        return l
+
+    return impl
+
+
 @box(types.ListType)
 def box_lsttype(typ, val, c):
     context = c.context
@@ -0,0 +1,501 @@
+"""
+Python wrapper that connects CPython interpreter to the numba setobject.
+"""
+from collections.abc import MutableSet, Iterable
+
+import numpy as np
+
+from numba.core.types import SetType
+from numba import njit, typeof
+from numba.core import types, errors, config, cgutils
+from numba.core.extending import (
+    overload_classmethod,
+    box,
+    unbox,
+    NativeValue,
+)
+from numba.np.numpy_support import from_dtype
+from numba.typed import setobject
+from numba.typed.typeddict import Dict
+
+
+@njit
+def _length(s):
+    return len(s)
+
+
+@njit
+def _contains(s, item):
+    return item in s
+
+
+@njit
+def _add(s, item):
+    s.add(item)
+
+
+@njit
+def _discard(s, item):
+    s.discard(item)
+
+
+@njit
+def _remove(s, item):
+    s.remove(item)
+
+
+@njit
+def _pop(s):
+    return s.pop()
+
+
+@njit
+def _copy(s):
+    return s.copy()
+
+
+@njit
+def _update(s, other):
+    s.update(other)
+
+
+@njit
+def _union(s, other):
+    return s.union(other)
+
+
+@njit
+def _intersection(s, other):
+    return s.intersection(other)
+
+
+@njit
+def _difference(s, other):
+    return s.difference(other)
+
+
+@njit
+def _symmetric_difference(s, other):
+    return s.symmetric_difference(other)
+
+
+@njit
+def _intersection_update(s, other):
+    s.intersection_update(other)
+
+
+@njit
+def _difference_update(s, other):
+    s.difference_update(other)
+
+
+@njit
+def _symmetric_difference_update(s, other):
+    s.symmetric_difference_update(other)
+
+
+@njit
+def _issubset(s, other):
+    return s.issubset(other)
+
+
+@njit
+def _issuperset(s, other):
+    return s.issuperset(other)
+
+
+@njit
+def _isdisjoint(s, other):
+    return s.isdisjoint(other)
+
+
+@njit
+def _equal(s, other):
+    return s == other
+
+
+@njit
+def _to_array(s):
+    return s.to_array()
+
+
+@njit
+def _from_array(arr):
+    return Set.from_array(arr)
+
+
+def _from_dict(data, settype):
+    return Set(settype=settype, data=data)
+
+
+class Set(MutableSet):
+    """A typed-set usable in Numba compiled functions.
+
+    Implements the MutableSet interface. The items are kept in native
+    memory, so passing a Set to or from a compiled function does not copy or
+    reflect its contents.
+    """
+
+    def __new__(cls, iterable=None, settype=None, data=None):
+        if config.DISABLE_JIT:
+            return set() if iterable is None else set(iterable)
+        else:
+            return object.__new__(cls)
+
+    @classmethod
+    def empty(cls, item_type, n_items=0):
+        """Create a new empty Set with *item_type* as the type of its items.
+
+        Optionally, allocate enough memory to hold *n_items* without
+        requiring resizes.
+        """
+        if config.DISABLE_JIT:
+            return set()
+        else:
+            data = Dict.empty(item_type, types.boolean, n_keys=n_items)
+            return cls(settype=SetType(item_type), data=data)
+
+    @classmethod
+    def from_array(cls, arr):
+        """Create a new Set of the items of the NumPy array *arr*, inserted
+        in bulk. The item type is the array's dtype.
+        """
+        if config.DISABLE_JIT:
+            return set(np.asarray(arr).ravel().tolist())
+        if not isinstance(arr, np.ndarray):
+            raise TypeError("from_array() expects a NumPy array")
+        return _from_array(arr)
+
+    def __init__(self, iterable=None, settype=None, data=None):
+        """
+        For users, the constructor takes an optional iterable of the
+        initial items. The keyword arguments are for internal use only.
+
+        Parameters
+        ----------
+        settype : numba.core.types.SetType; keyword-only
+            Used internally for the set type.
+        data : numba.typed.Dict; keyword-only
+            Used internally to pass the dictionary holding the items.
+        """
+        if data is not None:
+            if not isinstance(settype, SetType):
+                raise TypeError('*settype* must be a SetType')
+            self._set_type = settype
+            self._dict = data
+        else:
+            self._set_type = None
+            self._dict = None
+
+        if iterable is not None:
+            if not isinstance(iterable, Iterable):
+                msg = (f"'{type(iterable)}' object is not iterable. Supported "
+                       "type constructor are Set() and Set(iterable)")
+                raise errors.TypingError(msg)
+            self.update(iterable)
+
+    @property
+    def _numba_type_(self):
+        if self._set_type is None:
+            raise TypeError("invalid operation on untyped set")
+        return self._set_type
+
+    @property
+    def _typed(self):
+        """Returns True if the set is typed.
+        """
+        return self._set_type is not None
+
+    @property
+    def item_type(self):
+        return self._set_type.item_type if self._typed else None
+
+    def _initialise_set(self, itemty):
+        self._set_type = SetType(itemty)
+        self._dict = Dict.empty(itemty, types.boolean)
+
+    @classmethod
+    def _from_iterable(cls, it):
+        # Used by the MutableSet mixin methods
+        return cls(it)
+
+    def _coerce(self, other):
+        """Returns *other* in a form the compiled set operations accept.
+        """
+        if isinstance(other, np.ndarray) or (isinstance(other, Set) and
+                                             other._typed):
+            return other
+        out = Set.empty(self.item_type)
+        for item in other:
+            out.add(item)
+        return out
+
+    def __len__(self):
+        if not self._typed:
+            return 0
+        return _length(self)
+
+    def __contains__(self, item):
+        if len(self) == 0:
+            return False
+        return _contains(self, item)
+
+    def __iter__(self):
+        if not self._typed:
+            return iter(())
+        return iter(self._dict)
+
+    def __str__(self):
+        if len(self) == 0:
+            return 'set()'
+        return '{{{0}}}'.format(', '.join(str(x) for x in self))
+
+    def __repr__(self):
+        return "{prefix}({body})".format(prefix=str(self._set_type),
+                                         body=str(self))
+
+    def add(self, item):
+        if not self._typed:
+            self._initialise_set(typeof(item))
+        _add(self, item)
+
+    def discard(self, item):
+        if len(self) > 0:
+            _discard(self, item)
+
+    def remove(self, item):
+        if len(self) == 0:
+            raise KeyError(item)
+        _remove(self, item)
+
+    def pop(self):
+        if len(self) == 0:
+            raise KeyError('pop from an empty set')
+        return _pop(self)
+
+    def clear(self):
+        if self._typed:
+            self._dict.clear()
+
+    def copy(self):
+        if not self._typed:
+            return Set()
+        return _copy(self)
+
+    def update(self, *others):
+        for other in others:
+            if isinstance(other, np.ndarray):
+                if not self._typed:
+                    self._initialise_set(from_dtype(other.dtype))
+                _update(self, other.ravel())
+            elif isinstance(other, Set) and self._typed and other._typed:
+                _update(self, other)
+            else:
+                for item in other:
+                    self.add(item)
+
+    def union(self, *others):
+        out = self.copy()
+        out.update(*others)
+        return out
+
+    def intersection(self, other):
+        if not self._typed:
+            return Set()
+        return _intersection(self, self._coerce(other))
+
+    def difference(self, other):
+        if not self._typed:
+            return Set()
+        return _difference(self, self._coerce(other))
+
+    def symmetric_difference(self, other):
+        if not self._typed:
+            return Set(other)
+        return _symmetric_difference(self, self._coerce(other))
+
+    def intersection_update(self, other):
+        if self._typed:
+            _intersection_update(self, self._coerce(other))
+
+    def difference_update(self, other):
+        if self._typed:
+            _difference_update(self, self._coerce(other))
+
+    def symmetric_difference_update(self, other):
+        if not self._typed:
+            self.update(other)
+        else:
+            _symmetric_difference_update(self, self._coerce(other))
+
+    def issubset(self, other):
+        if not self._typed:
+            return True
+        return _issubset(self, self._coerce(other))
+
+    def issuperset(self, other):
+        if not self._typed:
+            return len(Set(other)) == 0
+        return _issuperset(self, self._coerce(other))
+
+    def isdisjoint(self, other):
+        if not self._typed:
+            return True
+        return _isdisjoint(self, self._coerce(other))
+
+    def _both_typed(self, other):
+        return isinstance(other, Set) and self._typed and other._typed
+
+    def __or__(self, other):
+        if self._both_typed(other):
+            return _union(self, other)
+        return super().__or__(other)
+
+    def __and__(self, other):
+        if self._both_typed(other):
+            return _intersection(self, other)
+        return super().__and__(other)
+
+    def __sub__(self, other):
+        if self._both_typed(other):
+            return _difference(self, other)
+        return super().__sub__(other)
+
+    def __xor__(self, other):
+        if self._both_typed(other):
+            return _symmetric_difference(self, other)
+        return super().__xor__(other)
+
+    def __ior__(self, other):
+        if self._both_typed(other):
+            _update(self, other)
+            return self
+        return super().__ior__(other)
+
+    def __iand__(self, other):
+        if self._both_typed(other):
+            _intersection_update(self, other)
+            return self
+        return super().__iand__(other)
+
+    def __isub__(self, other):
+        if self._both_typed(other):
+            _difference_update(self, other)
+            return self
+        return super().__isub__(other)
+
+    def __ixor__(self, other):
+        if self._both_typed(other):
+            _symmetric_difference_update(self, other)
+            return self
+        return super().__ixor__(other)
+
+    def __eq__(self, other):
+        if self._both_typed(other):
+            return _equal(self, other)
+        return super().__eq__(other)
+
+    def __le__(self, other):
+        if self._both_typed(other):
+            return _issubset(self, other)
+        return super().__le__(other)
+
+    def __ge__(self, other):
+        if self._both_typed(other):
+            return _issuperset(self, other)
+        return super().__ge__(other)
+
+    def to_array(self):
+        """Return an array of the items, which must be numbers or booleans,
+        in insertion order.
+        """
+        if not self._typed:
+            return np.empty(0)
+        return _to_array(self)
+
+
+@overload_classmethod(types.SetType, 'empty')
+def typedset_empty(cls, item_type, n_items=0):
+    if cls.instance_type is not SetType:
+        return
+
+    def impl(cls, item_type, n_items=0):
+        return setobject.new_set(item_type, n_items=n_items)
+
+    return impl
+
+
+@overload_classmethod(types.SetType, 'from_array')
+def typedset_from_array(cls, arr):
+    if cls.instance_type is not SetType:
+        return
+    if not isinstance(arr, types.Array):
+        raise errors.TypingError("from_array() expects an array, "
+                                 "got {}".format(arr))
+    itemty = arr.dtype
+
+    def impl(cls, arr):
+        s = setobject.new_set(itemty, n_items=arr.size)
+        for x in arr.flat:
+            s.add(x)
+        return s
+
+    return impl
+
+
+@box(types.SetType)
+def box_settype(typ, val, c):
+    # The set is a thin wrapper around its dictionary, box that and wrap it
+    # in a Python Set.
+    st = cgutils.create_struct_proxy(typ)(c.context, c.builder, value=val)
+    dictobj = c.box(typ.dict_type, st.data)
+
+    modname = c.context.insert_const_string(
+        c.builder.module, 'numba.typed.typedset',
+    )
+    typedset_mod = c.pyapi.import_module_noblock(modname)
+    fd_fn = c.pyapi.object_getattr_string(typedset_mod, '_from_dict')
+
+    settype_obj = c.pyapi.unserialize(c.pyapi.serialize_object(typ))
+
+    result_var = c.builder.alloca(c.pyapi.pyobj)
+    c.builder.store(cgutils.get_null_value(c.pyapi.pyobj), result_var)
+    with c.builder.if_then(cgutils.is_not_null(c.builder, dictobj)):
+        res = c.pyapi.call_function_objargs(fd_fn, (dictobj, settype_obj))
+        c.pyapi.decref(dictobj)
+        c.builder.store(res, result_var)
+    c.pyapi.decref(fd_fn)
+    c.pyapi.decref(typedset_mod)
+    return c.builder.load(result_var)
+
+
+@unbox(types.SetType)
+def unbox_settype(typ, val, c):
+    # Check that `type(val) is Set`
+    set_type = c.pyapi.unserialize(c.pyapi.serialize_object(Set))
+    valtype = c.pyapi.object_type(val)
+    same_type = c.builder.icmp_unsigned("==", valtype, set_type)
+
+    st = cgutils.create_struct_proxy(typ)(c.context, c.builder)
+    is_error = cgutils.alloca_once_value(c.builder, cgutils.true_bit)
+    with c.builder.if_else(same_type) as (then, orelse):
+        with then:
+            dictobj = c.pyapi.object_getattr_string(val, '_dict')
+            native = c.unbox(typ.dict_type, dictobj)
+            st.data = native.value
+            c.builder.store(native.is_error, is_error)
+            c.pyapi.decref(dictobj)
+
+        with orelse:
+            # Raise error on incorrect type
+            c.pyapi.err_format(
+                "PyExc_TypeError",
+                "can't unbox a %S as a %S",
+                valtype, set_type,
+            )
+
+    # cleanup
+    c.pyapi.decref(set_type)
+    c.pyapi.decref(valtype)
+
+    return NativeValue(st._getvalue(), is_error=c.builder.load(is_error))